@@ -7,6 +7,11 @@ from pydantic import BaseModel, Field
 
 from ...api.dependencies import rate_limiter_dependency
 from ...schemas.ai_sql import (
+    AGGREGATION_RESULTS,
+    CLASSIFICATION_RESULTS,
+    SENTIMENT_RESULTS,
+    SUMMARY_RESULTS,
+    TRANSCRIPTION_RESULTS,
     AIAggregateRequest,
     AIAggregateResponse,
     AIClassifyRequest,
@@ -135,7 +140,7 @@ async def ai_transcribe(
             audio_file_column=request.audio_file_column,
             table_name=request.table_name,
         )
-        return AITranscribeResponse(results=results)
+        return AITranscribeResponse.model_construct(results=TRANSCRIPTION_RESULTS.validate_python(results))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -164,7 +169,7 @@ async def ai_classify(
             table_name=request.table_name,
             prompt_prefix=request.prompt_prefix,
         )
-        return AIClassifyResponse(results=results)
+        return AIClassifyResponse.model_construct(results=CLASSIFICATION_RESULTS.validate_python(results))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -221,7 +226,7 @@ async def ai_aggregate(
             table_name=request.table_name,
             group_by=request.group_by,
         )
-        return AIAggregateResponse(results=results)
+        return AIAggregateResponse.model_construct(results=AGGREGATION_RESULTS.validate_python(results))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -248,7 +253,7 @@ async def ai_sentiment(
             text_column=request.text_column,
             table_name=request.table_name,
         )
-        return AISentimentResponse(results=results)
+        return AISentimentResponse.model_construct(results=SENTIMENT_RESULTS.validate_python(results))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -275,7 +280,7 @@ async def summarize(
             text_column=request.text_column,
             table_name=request.table_name,
         )
-        return SummarizeResponse(results=results)
+        return SummarizeResponse.model_construct(results=SUMMARY_RESULTS.validate_python(results))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,6 +1,6 @@
 """API endpoints for column metadata caching and initialization."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,6 +23,19 @@ async def get_snowflake_service() -> SnowflakeService:
     return SnowflakeService()
 
 
+def _metadata_response(table_meta, columns) -> Response:
+    """Serialize cached metadata rows straight to JSON.
+
+    The rows come from the database, so the response is built without
+    validation and FastAPI's response-model re-validation is skipped.
+    """
+    payload = ColumnMetadataList.model_construct(
+        table=TableAssetMetadataRead.from_orm_trusted(table_meta) if table_meta else None,
+        columns=[ColumnMetadataRead.from_orm_trusted(col) for col in columns],
+    )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
 async def get_ai_sql_service(
     sf_service: SnowflakeService = Depends(get_snowflake_service),
 ) -> ModularAISQLService:
@@ -35,15 +48,12 @@ async def get_column_metadata(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
-) -> ColumnMetadataList:
+) -> Response:
     """Fetch cached column metadata for a table asset."""
     service = ColumnMetadataService(db, sf_service, ai_sql_service)
     table_meta, columns = await service.get_cached_metadata(table_asset_id)
 
-    return ColumnMetadataList(
-        table=TableAssetMetadataRead.model_validate(table_meta) if table_meta else None,
-        columns=[ColumnMetadataRead.model_validate(col) for col in columns],
-    )
+    return _metadata_response(table_meta, columns)
 
 
 @router.post("/{table_asset_id}/initialize", response_model=ColumnMetadataList)
@@ -53,7 +63,7 @@ async def initialize_column_metadata(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
-) -> ColumnMetadataList:
+) -> Response:
     """Initialize column metadata with sampling and inference."""
     service = ColumnMetadataService(db, sf_service, ai_sql_service)
     try:
@@ -61,10 +71,7 @@ async def initialize_column_metadata(
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
-    return ColumnMetadataList(
-        table=TableAssetMetadataRead.model_validate(table_meta),
-        columns=[ColumnMetadataRead.model_validate(col) for col in columns],
-    )
+    return _metadata_response(table_meta, columns)
 
 
 @router.put("/{table_asset_id}/override", response_model=ColumnMetadataList)
@@ -74,7 +81,7 @@ async def override_column_metadata(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
-) -> ColumnMetadataList:
+) -> Response:
     """Override column metadata based on user input."""
     service = ColumnMetadataService(db, sf_service, ai_sql_service)
     table_meta, columns = await service.get_cached_metadata(table_asset_id)
@@ -93,10 +100,7 @@ async def override_column_metadata(
     await db.commit()
     await db.refresh(target)
 
-    return ColumnMetadataList(
-        table=TableAssetMetadataRead.model_validate(table_meta) if table_meta else None,
-        columns=[ColumnMetadataRead.model_validate(col) for col in columns],
-    )
+    return _metadata_response(table_meta, columns)
 
 
 @router.put("/{table_asset_id}/bulk-override", response_model=ColumnMetadataList)
@@ -106,7 +110,7 @@ async def bulk_override_column_metadata(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
-) -> ColumnMetadataList:
+) -> Response:
     """Override column metadata in bulk based on user input."""
     service = ColumnMetadataService(db, sf_service, ai_sql_service)
     table_meta, columns = await service.get_cached_metadata(table_asset_id)
@@ -128,10 +132,7 @@ async def bulk_override_column_metadata(
 
     await db.commit()
 
-    return ColumnMetadataList(
-        table=TableAssetMetadataRead.model_validate(table_meta) if table_meta else None,
-        columns=[ColumnMetadataRead.model_validate(col) for col in columns],
-    )
+    return _metadata_response(table_meta, columns)
 
 
 @router.put("/{table_asset_id}/table-override", response_model=ColumnMetadataList)
@@ -141,7 +142,7 @@ async def override_table_metadata(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
-) -> ColumnMetadataList:
+) -> Response:
     """Override table metadata based on user input."""
     service = ColumnMetadataService(db, sf_service, ai_sql_service)
     table_meta, columns = await service.get_cached_metadata(table_asset_id)
@@ -159,7 +160,4 @@ async def override_table_metadata(
     await db.commit()
     await db.refresh(table_meta)
 
-    return ColumnMetadataList(
-        table=TableAssetMetadataRead.model_validate(table_meta),
-        columns=[ColumnMetadataRead.model_validate(col) for col in columns],
-    )
+    return _metadata_response(table_meta, columns)
@@ -24,6 +24,7 @@ from ...services.snowflake_service import SnowflakeService
 from ...services.modular_ai_sql_service import ModularAISQLService
 from ...orchestration.eda_workflows import (
     create_eda_orchestrator,
+    EDAWorkflowTools,
     WorkflowType,
 )
 from strands_tools import workflow as workflow_tool
@@ -101,6 +102,21 @@ async def get_ai_sql_service(
     return ModularAISQLService(sf_service)
 
 
+# One tool set per Snowflake connection, so its profile cache outlives a request
+_workflow_tools: dict[int, EDAWorkflowTools] = {}
+
+
+async def get_eda_workflow_tools(
+    sf_service: SnowflakeService = Depends(get_snowflake_service),
+) -> EDAWorkflowTools:
+    """Get the EDA workflow tools shared by requests on the same Snowflake connection."""
+    key = id(sf_service.sf_conn)
+    workflow_tools = _workflow_tools.get(key)
+    if workflow_tools is None or workflow_tools.sf.sf_conn is not sf_service.sf_conn:
+        workflow_tools = _workflow_tools[key] = EDAWorkflowTools(sf_service)
+    return workflow_tools
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -112,6 +128,7 @@ async def run_eda_workflow(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
+    workflow_tools: EDAWorkflowTools = Depends(get_eda_workflow_tools),
 ):
     """Run EDA workflow on a table asset.
 
@@ -153,7 +170,12 @@ async def run_eda_workflow(
             )
 
         # Create orchestrator with database session for persistence
-        orchestrator = create_eda_orchestrator(sf_service, ai_sql_service, db=db)
+        orchestrator = create_eda_orchestrator(
+            sf_service,
+            ai_sql_service,
+            db=db,
+            workflow_tools=workflow_tools,
+        )
 
         # Run EDA workflow
         results = await orchestrator.run_eda(
@@ -196,6 +218,7 @@ async def run_eda_workflow_stream(
     db: AsyncSession = Depends(get_async_db_session),
     sf_service: SnowflakeService = Depends(get_snowflake_service),
     ai_sql_service: ModularAISQLService = Depends(get_ai_sql_service),
+    workflow_tools: EDAWorkflowTools = Depends(get_eda_workflow_tools),
 ):
     """Run EDA workflow with streaming logs (Server-Sent Events).
 
@@ -354,10 +377,12 @@ async def run_eda_workflow_stream(
                     }
                     workflow_status = workflow_data.get("status", "created")
 
+                    tasks_total = 0
                     for task in tasks:
                         task_id = task.get("task_id")
                         if not task_id:
                             continue
+                        tasks_total += 1
 
                         raw_status = status_by_id.get(task_id, "pending")
                         if raw_status == "completed":
@@ -389,13 +414,11 @@ async def run_eda_workflow_stream(
                                     },
                                 )
 
-                    tasks_total = len([task for task in tasks if task.get("task_id")])
-                    tasks_completed = sum(
-                        1 for status in status_by_id.values() if status == "completed"
-                    )
+                    # list.count compares in C instead of resuming a generator per task
+                    tasks_completed = list(status_by_id.values()).count("completed")
 
                     if tasks_total > 0:
-                        progress = int((tasks_completed / tasks_total) * 100)
+                        progress = tasks_completed * 100 // tasks_total
                         if progress != last_progress:
                             last_progress = progress
                             _enqueue(
@@ -454,6 +477,7 @@ async def run_eda_workflow_stream(
                     sf_service,
                     ai_sql_service,
                     db=db,
+                    workflow_tools=workflow_tools,
                 )
 
                 _enqueue(
@@ -610,7 +634,7 @@ async def run_eda_workflow_stream(
             tasks_total = summary.get("tasks_total", 0)
 
             if tasks_total > 0:
-                progress = int((tasks_completed / tasks_total) * 100)
+                progress = tasks_completed * 100 // tasks_total
                 yield _sse(
                     "progress",
                     {
@@ -4,7 +4,7 @@ import json
 import re
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
@@ -12,6 +12,7 @@ from ...core.db.database import get_async_db_session
 from ...models.table_asset import TableAsset
 from ...models.table_asset_metadata import TableAssetMetadata
 from ...models.column_metadata import ColumnMetadata
+from ...orchestration.eda_workflows import EDAWorkflowRouter
 from ...services.snowflake_service import SnowflakeService
 from ...schemas.table_asset import (
     TableAssetCreate,
@@ -158,7 +159,7 @@ async def get_table_assets(
     search: str | None = Query(None, description="Search in name, tags"),
     owner: str | None = Query(None, description="Filter by owner"),
     db: AsyncSession = Depends(get_async_db_session),
-) -> TableAssetList:
+) -> Response:
     """Get all table assets with pagination."""
     try:
         # Build query
@@ -193,15 +194,18 @@ async def get_table_assets(
         result = await db.execute(query)
         assets = result.scalars().all()
 
-        # Convert to response model
-        items = [TableAssetRead.model_validate(asset) for asset in assets]
+        # Convert to response model; rows come straight from the database
+        items = [TableAssetRead.from_orm_trusted(asset) for asset in assets]
 
-        return TableAssetList(
+        # Serialized directly: the rows are trusted, so FastAPI's response-model
+        # re-validation of every item is skipped
+        payload = TableAssetList.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
         )
+        return Response(content=payload.model_dump_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -358,6 +362,8 @@ async def update_table_asset(
 
         await db.commit()
         await db.refresh(asset)
+        # The asset may now point at a different table
+        EDAWorkflowRouter.invalidate_schema_route_cache(asset_id)
 
         return TableAssetRead.model_validate(asset)
     except HTTPException:
@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 if not os.path.exists(LOG_DIR):
@@ -11,10 +13,23 @@ LOG_FILE_PATH = os.path.join(LOG_DIR, "app.log")
 LOGGING_LEVEL = logging.INFO
 LOGGING_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
+root_logger = logging.getLogger("")
+root_logger.setLevel(LOGGING_LEVEL)
 
 file_handler = RotatingFileHandler(LOG_FILE_PATH, maxBytes=10485760, backupCount=5)
 file_handler.setLevel(LOGGING_LEVEL)
 file_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
 
-logging.getLogger("").addHandler(file_handler)
+output_handlers: list[logging.Handler] = [file_handler]
+if not root_logger.handlers:
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
+    output_handlers.insert(0, console_handler)
+
+# Records are handed to a background thread for formatting and I/O so that
+# logging from coroutines never blocks the event loop on stdout or disk.
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+queue_listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+root_logger.addHandler(QueueHandler(log_queue))
+queue_listener.start()
+atexit.register(queue_listener.stop)
@@ -1,6 +1,7 @@
 import uuid as uuid_pkg
 from datetime import UTC, datetime
-from typing import Any
+from functools import cache
+from typing import Any, Self
 
 from pydantic import BaseModel, Field, field_serializer
 from uuid6 import uuid7
@@ -47,6 +48,26 @@ class TimestampSchema(BaseModel):
         return None
 
 
+class TrustedORMSchema(BaseModel):
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        """Build from a trusted ORM row without validation.
+
+        Field constraints and validators are bypassed; use model_validate for
+        anything that did not come from the database.
+        """
+        return cls.model_construct(**{name: getattr(obj, attribute) for name, attribute in _orm_attributes(cls)})
+
+
+@cache
+def _orm_attributes(schema: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    """(field name, ORM attribute) pairs; a string validation_alias names the attribute."""
+    return tuple(
+        (name, field.validation_alias if isinstance(field.validation_alias, str) else name)
+        for name, field in schema.model_fields.items()
+    )
+
+
 class PersistentDeletion(BaseModel):
     deleted_at: datetime | None = Field(default=None)
     is_deleted: bool = False
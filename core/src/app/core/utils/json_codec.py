@@ -0,0 +1,59 @@
+"""JSON encode/decode helpers backed by orjson.
+
+orjson is a declared dependency. The standard library fallback only keeps
+stripped-down installs importable; its output differs for NaN/Infinity
+(bare ``NaN`` instead of ``null``), dict keys other than str/int/float/bool/None
+(rejected) and NumPy values (left to ``default``).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Parse a JSON document from text or raw bytes.
+
+    Documents orjson refuses but ``json`` accepts (``NaN``/``Infinity`` written
+    by ``json.dump``) are retried with the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, *, default: Any = None, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a compact JSON string, keeping non-ASCII text as-is.
+
+    With orjson, non-string dict keys and NumPy values are serialized natively;
+    ``default`` handles any other value neither encoder supports. ``sort_keys``
+    gives a canonical form suitable for cache keys.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+            pass
+    return json.dumps(
+        obj,
+        default=default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    )
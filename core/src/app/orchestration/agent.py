@@ -200,7 +200,7 @@ Tool: {tool.name}
 Description: {tool.description}
 
 Required Parameters:
-{json.dumps(tool.parameters, indent=2)}
+{json.dumps(tool.to_dict()['parameters'], indent=2)}
 
 User Request: {user_request}
 
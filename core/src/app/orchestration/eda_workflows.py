@@ -5,7 +5,7 @@ It uses the Strands workflow tool to manage multi-agent task execution with
 automatic dependency resolution, parallel execution, and state management.
 
 Workflows:
-    - EDA_OVERVIEW: Comprehensive analysis (profile → insights → charts → docs)
+    - EDA_OVERVIEW: Comprehensive analysis (profile → insights ∥ charts → docs)
     - EDA_TIME_SERIES: Time-series focused analysis
     - EDA_DATA_QUALITY: Data quality focused analysis
 
@@ -14,16 +14,22 @@ Router Logic:
     - AI-powered routing (AI_CLASSIFY for complex decisions)
 """
 
-from typing import Any, Literal
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import Any, ClassVar, Literal
 import asyncio
 import copy
-import json
-import uuid
+import functools
+import itertools
+import time
 import os
 from pathlib import Path
 import ast
 import operator
 import logging
+import re
+import secrets
+import sys
 
 from strands import Agent, tool
 from strands_tools import workflow
@@ -36,18 +42,374 @@ from ..services.snowflake_service import SnowflakeService
 from ..services.data_type_detector import DataTypeDetector
 from ..services.eda_workflow_persistence import EDAWorkflowPersistenceService
 from ..core.config import settings
+from ..core.utils.json_codec import json_dumps, json_loads
 from .eda_agents import SnowflakeProfiler
 from .eda_hooks import create_default_eda_hooks
 
 logger = logging.getLogger(__name__)
 
-
 # ============================================================================
 # Workflow Type Definitions
 # ============================================================================
 
 WorkflowType = Literal["EDA_OVERVIEW", "EDA_TIME_SERIES", "EDA_DATA_QUALITY"]
 
+_BANNER = "=" * 60
+
+
+# Workflow ids only need to be unique among workflow files and execution rows.
+# A per-process 64-bit counter whose high 32 bits are random avoids building a
+# UUID from the OS CSPRNG on every run; forked workers reseed their own counter.
+def _new_workflow_id_counter() -> Iterator[int]:
+    return itertools.count(secrets.randbits(32) << 32)
+
+
+_workflow_id_counter = _new_workflow_id_counter()
+
+
+def _reseed_workflow_id_counter() -> None:
+    global _workflow_id_counter
+    _workflow_id_counter = _new_workflow_id_counter()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_workflow_id_counter)
+
+
+# ============================================================================
+# Model Configuration
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_model() -> OpenAIModel | None:
+    """Resolve provider settings once and build the shared coordinator model.
+
+    Settings and environment lookups, and the exported STRANDS_* variables, are
+    process-wide, so every orchestrator reuses one model configuration.
+    Returns None when no OpenAI API key is configured.
+    """
+    # Prefer OpenAI provider if API key is available
+    openai_key = (
+        settings.OPENAI_API_KEY.get_secret_value()
+        if settings.OPENAI_API_KEY
+        else os.getenv("OPENAI_API_KEY")
+    )
+    if openai_key:
+        os.environ.setdefault("OPENAI_API_KEY", openai_key)
+
+    openai_model_id = (
+        settings.STRANDS_MODEL_ID
+        or settings.OPENAI_MODEL_ID
+        or os.getenv("STRANDS_MODEL_ID")
+        or os.getenv("OPENAI_MODEL_ID")
+        or "gpt-4o-mini"
+    )
+    model_provider = (
+        settings.STRANDS_MODEL_PROVIDER
+        or os.getenv("STRANDS_MODEL_PROVIDER")
+    )
+    if not model_provider or model_provider == "ollama":
+        model_provider = "openai"
+
+    os.environ["STRANDS_MODEL_PROVIDER"] = model_provider
+    os.environ["STRANDS_MODEL_ID"] = openai_model_id
+    os.environ["STRANDS_PROVIDER"] = model_provider
+    if not openai_key:
+        return None
+    return OpenAIModel(
+        model_id=openai_model_id,
+        params={
+            "max_tokens": 8192,  # Increased from 2048 to handle large profiles
+            "temperature": 0.2,
+        },
+    )
+
+
+# ============================================================================
+# Workflow Task Templates
+# ============================================================================
+
+# Static task specs are built once at import; only the description is formatted
+# per run (``{table_name}``, ``{table_sql}``, ``{user_goal}``).
+
+
+def _prompt(*parts: str) -> str:
+    """Join prompt fragments into one interned system prompt."""
+    return sys.intern("\n\n".join(parts))
+
+
+# Fragments shared by every workflow, so all tasks send byte-identical text
+# (which also lets provider-side prompt prefix caches match across tasks).
+_PROFILE_TOOL_INCLUDES = sys.intern("""The profile_table tool automatically includes:
+- column_type_inferences: Semantic types for each column (identifier, categorical, numeric, datetime, etc.)
+  with confidence scores and recommendations
+- data_structure_type: Overall data structure (time_series, panel, cross_sectional, etc.)""")
+
+_PROFILE_FETCH_AND_RETURN = sys.intern("""Use the profile_table tool to fetch real data; do not fabricate.
+Pass the Table SQL from the task description, unchanged, as table_ref.
+Return JSON with keys: schema, statistics, samples, metadata (including column_type_inferences and data_structure_type).""")
+
+_PROFILE_CONTEXT = sys.intern("""The profile you receive includes semantic type information:
+- metadata.column_type_inferences: For each column, inferred_type (e.g., "identifier", "nominal_categorical",
+  "continuous_numeric"), confidence (0.0-1.0), and recommendations for handling the type
+- metadata.data_structure_type: Overall data structure (time_series, panel, cross_sectional, etc.)""")
+
+_OVERVIEW_TASK_TEMPLATES: tuple[dict[str, Any], ...] = (
+    {
+        "task_id": "profile_table",
+        "tools": ("profile_table",),
+        "description": "Profile the table '{table_name}' to extract schema, statistics, sample data, AND semantic type inference for each column. Table SQL: {table_sql}",
+        "system_prompt": _prompt(
+            """You are a data profiling expert. Extract comprehensive table profiles including:
+
+1. Schema (column names and SQL types)
+2. Statistics (row count, null counts, distinct values, cardinality)
+3. Sample data
+4. Semantic type inference""",
+            _PROFILE_TOOL_INCLUDES,
+            _PROFILE_FETCH_AND_RETURN,
+        ),
+        "priority": 5,
+        "dependencies": (),
+    },
+    {
+        "task_id": "generate_insights",
+        "tools": ("calculator",),
+        "description": "Analyze the table profile INCLUDING semantic type information and generate insights about data patterns, quality issues, and recommendations. User goal: {user_goal}",
+        "default_goal": "general analysis",
+        "system_prompt": _prompt(
+            "You are a data insights expert. Analyze table profiles with semantic type information.",
+            _PROFILE_CONTEXT,
+            """Use this information to:
+- Identify mismatched types (e.g., numeric data stored as text)
+- Detect identifier columns that shouldn't be used in calculations
+- Find categorical columns that need encoding
+- Spot time-series data that needs temporal analysis
+- Detect high-cardinality columns (likely IDs)
+- Identify low-cardinality columns (good for grouping)
+
+Pay special attention to:
+- Columns with low confidence scores (may need manual review)
+- Recommendations from type inference
+- Data structure type (time_series, panel, etc.) for analysis approach
+
+Return JSON with keys: key_findings (array), data_quality_issues (array of objects with issue and severity), recommendations (array).""",
+        ),
+        "priority": 4,
+        "dependencies": ("profile_table",),
+    },
+    {
+        "task_id": "generate_charts",
+        "tools": ("calculator",),
+        "description": "Create visualization specifications for the table. Generate 2-3 appropriate charts based on the data types (use semantic type information) and user goal: {user_goal}",
+        "default_goal": "general visualization",
+        "system_prompt": _prompt(
+            "You are a data visualization expert. Create chart specifications using semantic type information.",
+            _PROFILE_CONTEXT,
+            """Use the inferred type of each column:
+- identifier: Don't visualize (use as labels/keys)
+- categorical: Use for grouping (bar charts, pie charts)
+- continuous_numeric: Use for distributions (histograms, scatter plots)
+- discrete_numeric: Use for counts (bar charts)
+- datetime: Use for time-series (line charts, time plots)
+
+Choose appropriate chart types based on semantic types:
+- Categorical × Numeric → Bar chart
+- Numeric × Numeric → Scatter plot
+- Datetime × Numeric → Line chart
+- Categorical distribution → Pie chart
+
+Return JSON with key: charts (array of objects with title, chart_type, sql, narrative).""",
+        ),
+        "priority": 3,
+        "dependencies": ("profile_table",),
+    },
+    {
+        "task_id": "generate_documentation",
+        "tools": ("calculator",),
+        "description": "Generate comprehensive documentation for the table including summary, use cases, tags, and markdown documentation. Incorporate semantic type information.",
+        "system_prompt": _prompt(
+            "You are a technical documentation expert. Create clear documentation incorporating semantic type information.",
+            _PROFILE_CONTEXT,
+            """Use this information to:
+- Describe the table's purpose based on column types
+- Suggest use cases based on data structure type
+- Tag the table appropriately (e.g., "time-series", "categorical-data", "high-dimensional")
+- Document key columns and their semantic meanings
+- Include recommendations from type inference
+
+Return JSON with keys: summary (2-3 sentences), use_cases (array), tags (array), markdown_doc.""",
+        ),
+        "priority": 2,
+        "dependencies": ("generate_insights", "generate_charts"),
+    },
+)
+
+_TIME_SERIES_TASK_TEMPLATES: tuple[dict[str, Any], ...] = (
+    {
+        "task_id": "profile_table",
+        "tools": ("profile_table",),
+        "description": "Profile the table '{table_name}' with focus on time-series columns and semantic type inference. Table SQL: {table_sql}",
+        "system_prompt": _prompt(
+            """You are a data profiling expert specializing in time-series data.
+Extract schema, statistics, and identify date/timestamp columns.""",
+            _PROFILE_TOOL_INCLUDES,
+            """Pay special attention to temporal columns and their semantic types (datetime, temporal_cyclic).
+The data_structure_type should detect as time_series or panel.""",
+            _PROFILE_FETCH_AND_RETURN,
+        ),
+        "priority": 5,
+        "dependencies": (),
+    },
+    {
+        "task_id": "generate_charts",
+        "tools": ("calculator",),
+        "description": "Create time-series visualizations showing trends, patterns, and temporal distributions using semantic type information. User goal: {user_goal}",
+        "default_goal": "time-series analysis",
+        "system_prompt": _prompt(
+            """You are a time-series visualization expert. Create 3-4 charts
+focusing on temporal patterns, trends, and time-based distributions.""",
+            _PROFILE_CONTEXT,
+            """Use the column_type_inferences to identify:
+- datetime/timestamp columns: Use as x-axis for time-series plots
+- temporal_cyclic columns: Use for seasonality analysis
+- continuous_numeric columns: Use as y-axis for trends
+
+Prioritize line charts and time-series plots.
+Return JSON with charts array.""",
+        ),
+        "priority": 4,
+        "dependencies": ("profile_table",),
+    },
+    {
+        "task_id": "generate_insights",
+        "tools": ("calculator",),
+        "description": "Analyze temporal patterns, trends, seasonality, and anomalies in the time-series data using semantic type information.",
+        "system_prompt": _prompt(
+            """You are a time-series analysis expert. Identify trends, seasonality,
+anomalies, and temporal patterns.""",
+            _PROFILE_CONTEXT,
+            """Use the semantic type information to:
+- Focus on datetime columns for temporal analysis
+- Identify cyclic patterns in temporal_cyclic columns
+- Detect time-dependent relationships
+- Check if data_structure_type is time_series or panel
+
+Return JSON with key_findings, data_quality_issues, recommendations.""",
+        ),
+        "priority": 3,
+        "dependencies": ("profile_table",),
+    },
+    {
+        "task_id": "generate_documentation",
+        "tools": ("calculator",),
+        "description": "Generate time-series focused documentation highlighting temporal insights and semantic types.",
+        "system_prompt": _prompt(
+            """You are a technical documentation expert specializing in time-series data.
+Create documentation emphasizing temporal patterns and trends.""",
+            _PROFILE_CONTEXT,
+            """Incorporate semantic type information:
+- Highlight datetime columns and their ranges
+- Document temporal_cyclic patterns
+- Explain data_structure_type (time_series vs panel)
+- Include time-series specific recommendations
+
+Return JSON with summary, use_cases, tags (include "time-series"), markdown_doc.""",
+        ),
+        "priority": 2,
+        "dependencies": ("generate_insights", "generate_charts"),
+    },
+)
+
+_DATA_QUALITY_TASK_TEMPLATES: tuple[dict[str, Any], ...] = (
+    {
+        "task_id": "profile_table",
+        "tools": ("profile_table",),
+        "description": "Profile the table '{table_name}' with focus on data quality metrics and semantic type inference. Table SQL: {table_sql}",
+        "system_prompt": _prompt(
+            """You are a data quality profiling expert. Extract schema, statistics
+with emphasis on null counts, distinct values, and potential quality issues.""",
+            _PROFILE_TOOL_INCLUDES,
+            """Pay attention to:
+- Low confidence scores (may indicate quality issues)
+- Type mismatches (e.g., numeric stored as text)
+- Identifier columns with duplicates""",
+            _PROFILE_FETCH_AND_RETURN,
+        ),
+        "priority": 5,
+        "dependencies": (),
+    },
+    {
+        "task_id": "generate_insights",
+        "tools": ("calculator",),
+        "description": "Perform comprehensive data quality analysis identifying issues, anomalies, and providing recommendations using semantic type information. User goal: {user_goal}",
+        "default_goal": "data quality check",
+        "system_prompt": _prompt(
+            """You are a data quality expert. Identify quality issues including
+nulls, duplicates, outliers, inconsistencies, and data integrity problems.""",
+            _PROFILE_CONTEXT,
+            """Use semantic type information to detect quality issues:
+- identifier columns with duplicates (should be unique)
+- categorical columns with too many categories (data entry errors?)
+- numeric columns stored as text (type mismatch)
+- datetime columns with invalid dates
+- Low confidence scores (ambiguous types, needs review)
+
+Assign severity levels (low/medium/high) based on:
+- Impact on analysis
+- Data integrity violations
+- Type confidence scores
+
+Return JSON with key_findings, data_quality_issues (with severity), recommendations.""",
+        ),
+        "priority": 4,
+        "dependencies": ("profile_table",),
+    },
+    {
+        "task_id": "generate_documentation",
+        "tools": ("calculator",),
+        "description": "Generate a data quality report with findings, issues, and remediation recommendations incorporating semantic type information.",
+        "system_prompt": _prompt(
+            """You are a data quality documentation expert. Create a quality report
+highlighting issues, their impact, and remediation steps.""",
+            _PROFILE_CONTEXT,
+            """Incorporate semantic type information:
+- Document type mismatches and their implications
+- Explain quality issues in context of semantic types
+- Provide type-specific remediation recommendations
+- Include confidence scores for ambiguous columns
+
+Return JSON with summary, use_cases (focus on quality improvement), tags (include "data-quality"), markdown_doc.""",
+        ),
+        "priority": 3,
+        "dependencies": ("generate_insights",),
+    },
+)
+
+
+def _render_task_templates(
+    templates: tuple[dict[str, Any], ...],
+    table_asset: TableAsset,
+    user_goal: str | None,
+) -> list[dict[str, Any]]:
+    """Materialize fresh workflow task dicts from static templates."""
+    return [
+        {
+            "task_id": template["task_id"],
+            "tools": list(template["tools"]),
+            "description": template["description"].format(
+                table_name=table_asset.name,
+                table_sql=table_asset.source_sql,
+                user_goal=user_goal or template.get("default_goal", ""),
+            ),
+            "system_prompt": template["system_prompt"],
+            "priority": template["priority"],
+            "dependencies": list(template["dependencies"]),
+        }
+        for template in templates
+    ]
+
 
 # ============================================================================
 # Workflow Router
@@ -60,8 +422,18 @@ class EDAWorkflowRouter:
     Uses a combination of:
     1. Rule-based routing (fast, deterministic)
     2. AI-powered routing (flexible, handles edge cases)
+
+    Schema-based decisions are cached per Snowflake connection and table asset
+    for a short TTL so repeated EDA requests on the same table skip the
+    Snowflake lookup; invalidate_schema_route_cache drops them early.
     """
 
+    SCHEMA_ROUTE_CACHE_TTL_SECONDS: ClassVar[float] = 300.0
+    SCHEMA_ROUTE_CACHE_MAX_ENTRIES: ClassVar[int] = 256
+    # Routers are built per request, so the cache is shared but keyed by connection:
+    # (sf_conn, table_asset.id, table_asset.name) -> (cached_at, has_date_columns)
+    _schema_route_cache: ClassVar[OrderedDict[tuple[Any, int, str], tuple[float, bool]]] = OrderedDict()
+
     def __init__(
         self,
         snowflake_service: SnowflakeService,
@@ -93,6 +465,14 @@ class EDAWorkflowRouter:
                 return "EDA_TIME_SERIES"
 
         # Step 2: Analyze table schema to detect patterns
+        cache = self._schema_route_cache
+        key = (self.sf.sf_conn, table_asset.id, table_asset.name)
+        cached = cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.SCHEMA_ROUTE_CACHE_TTL_SECONDS:
+            cache.move_to_end(key)
+            return "EDA_TIME_SERIES" if cached[1] else "EDA_OVERVIEW"
+
         try:
             # Check for date/timestamp columns
             date_check_query = f"""
@@ -104,6 +484,11 @@ class EDAWorkflowRouter:
             date_result = await self.sf.execute_query(date_check_query)
             has_date_columns = date_result[0].get("DATE_COL_COUNT", 0) > 0
 
+            cache[key] = (now, has_date_columns)
+            cache.move_to_end(key)
+            while len(cache) > self.SCHEMA_ROUTE_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+
             if has_date_columns:
                 return "EDA_TIME_SERIES"
 
@@ -113,15 +498,64 @@ class EDAWorkflowRouter:
         # Default: EDA_OVERVIEW
         return "EDA_OVERVIEW"
 
+    @classmethod
+    def invalidate_schema_route_cache(cls, table_asset_id: int | None = None) -> None:
+        """Drop cached schema routing decisions for one table asset, or all of them."""
+        if table_asset_id is None:
+            cls._schema_route_cache.clear()
+            return
+        for key in [key for key in cls._schema_route_cache if key[1] == table_asset_id]:
+            del cls._schema_route_cache[key]
+
 
 # ============================================================================
 # Strands Workflow-Based EDA Orchestrator
 # ============================================================================
 
 
+def _serialize_tool_result(payload: dict[str, Any]) -> str:
+    """Pre-serialize a large tool payload for the model.
+
+    Strands passes string results through unchanged and would otherwise run
+    ``json.dumps`` on the dict (falling back to ``repr`` for Snowflake
+    ``Decimal``/``datetime`` values); orjson is faster and ``default=str``
+    keeps those values as readable JSON.
+    """
+    return json_dumps(payload, default=str)
+
+
 class EDAWorkflowTools:
     """Tool set exposed to Strands workflows for table analysis."""
 
+    # Per-instance profile cache, keyed by (table_ref, sample_size) -> (cached_at, profile).
+    # run_eda warms it, and the API shares one instance per Snowflake connection, so
+    # repeated EDA runs on an asset skip the Snowflake profile scan while it is fresh.
+    PROFILE_CACHE_TTL_SECONDS: ClassVar[float] = 300.0
+    PROFILE_CACHE_MAX_ENTRIES: ClassVar[int] = 128
+
+    _OPERATORS: ClassVar[dict[type[ast.AST], Callable[..., Any]]] = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.FloorDiv: operator.floordiv,
+        ast.Mod: operator.mod,
+        ast.Pow: operator.pow,
+        ast.USub: operator.neg,
+        ast.UAdd: operator.pos,
+    }
+
+    _FILE_WRITE_MAX_PATH_LENGTH: ClassVar[int] = 4096
+
+    # Large artifacts are written unbuffered in 1 MiB slices of one encoded copy.
+    _FILE_WRITE_CHUNK_BYTES: ClassVar[int] = 1024 * 1024
+
+    # Only the leading keyword is inspected, so large queries are never copied.
+    _READ_ONLY_QUERY_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"\s*(?:SELECT|WITH|SHOW|DESCRIBE|EXPLAIN)\b",
+        re.IGNORECASE,
+    )
+
     def __init__(self, snowflake_service: SnowflakeService):
         self.sf = snowflake_service
         self.profiler = SnowflakeProfiler(snowflake_service)
@@ -129,45 +563,80 @@ class EDAWorkflowTools:
         repo_root = Path(__file__).resolve().parents[4]
         self.output_dir = repo_root / "output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_resolved = self.output_dir.resolve()
+        # Scoped to this instance, and so to this Snowflake service and its session
+        self._profile_cache: OrderedDict[tuple[str, int], tuple[float, dict[str, Any]]] = OrderedDict()
 
     @tool
-    async def sql(self, query: str) -> dict[str, Any]:
+    async def sql(self, query: str) -> str:
         """Execute a read-only SQL query against Snowflake.
 
+        Returns the JSON-serialized result, or a JSON error object for a
+        rejected query.
+
         Args:
             query: SQL query to run (SELECT/WITH/SHOW/DESCRIBE/EXPLAIN only)
         """
-        normalized = query.strip().upper()
-        allowed_prefixes = ("SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN")
-        if not normalized.startswith(allowed_prefixes):
-            return {
+        if not self._READ_ONLY_QUERY_RE.match(query):
+            return _serialize_tool_result({
                 "error": "Only read-only queries are allowed (SELECT/WITH/SHOW/DESCRIBE/EXPLAIN).",
                 "query": query,
-            }
+            })
 
         results = await self.sf.execute_query(query)
-        return {
+        return _serialize_tool_result({
             "row_count": len(results),
             "rows": results,
-        }
+        })
 
     @tool
-    async def profile_table(self, table_ref: str, sample_size: int = 100) -> dict[str, Any]:
+    async def profile_table(self, table_ref: str, sample_size: int = 100) -> str:
         """Generate a structured table profile (schema, stats, samples).
 
+        The profile already carries server-side semantic type inference in
+        metadata.column_type_inferences and metadata.data_structure_type, so
+        there is no need to call infer_column_type for the profiled columns.
+
         Args:
             table_ref: Fully qualified table name or SQL query
             sample_size: Number of sample rows
         """
+        return _serialize_tool_result(await self.get_cached_profile(table_ref, sample_size))
+
+    async def get_cached_profile(self, table_ref: str, sample_size: int = 100) -> dict[str, Any]:
+        """Return a table profile, reusing a fresh cached profile when available.
+
+        Callers get their own copy, so mutating it does not change the cache.
+        """
+        # Exact table_ref: quoted identifiers and SQL queries are case-sensitive
+        key = (table_ref, sample_size)
+        cache = self._profile_cache
+        entry = cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.PROFILE_CACHE_TTL_SECONDS:
+            cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
         profile = await self.profiler.get_table_profile(table_ref, sample_size)
+        cache[key] = (now, copy.deepcopy(profile))
+        cache.move_to_end(key)
+        while len(cache) > self.PROFILE_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
         return profile
 
+    def invalidate_profile_cache(self, table_ref: str | None = None) -> None:
+        """Drop cached profiles for one table reference, or all of them."""
+        if table_ref is None:
+            self._profile_cache.clear()
+            return
+        for key in [key for key in self._profile_cache if key[0] == table_ref]:
+            del self._profile_cache[key]
+
     @tool
     def calculator(self, expression: str) -> dict[str, Any]:
         """Evaluate a simple numeric expression safely."""
         try:
-            node = ast.parse(expression, mode="eval")
-            value = self._safe_eval(node.body)
+            value = self._evaluate_expression(expression)
             return {"expression": expression, "value": value}
         except Exception as exc:
             return {"error": f"calculator error: {exc}"}
@@ -176,8 +645,7 @@ class EDAWorkflowTools:
     def python_repl(self, code: str) -> dict[str, Any]:
         """Restricted Python execution (expressions only)."""
         try:
-            node = ast.parse(code, mode="eval")
-            value = self._safe_eval(node.body)
+            value = self._evaluate_expression(code)
             return {"result": value}
         except Exception as exc:
             return {"error": f"python_repl error: {exc}"}
@@ -185,18 +653,38 @@ class EDAWorkflowTools:
     @tool
     def file_write(self, path: str, content: str) -> dict[str, Any]:
         """Write content to a file under the output/ directory."""
+        outside_error = {"error": "file_write only supports paths under output/."}
+        if not path or len(path) > self._FILE_WRITE_MAX_PATH_LENGTH or "\x00" in path:
+            return {"error": "file_write path is empty, too long, or contains NUL bytes."}
+        try:
+            os.fsencode(path)
+        except UnicodeEncodeError:
+            return {"error": "file_write path cannot be encoded for the filesystem."}
+
+        # Reject traversal and foreign absolute paths lexically, before any
+        # filesystem access; the resolved check below still guards symlinks.
+        output_root = str(self._output_dir_resolved)
         target = Path(path)
-        if not target.is_absolute():
+        if ".." in target.parts:
+            return outside_error
+        if target.is_absolute():
+            if os.path.commonpath((path, output_root)) != output_root:
+                return outside_error
+        else:
             target = self.output_dir / target
 
-        try:
-            target.resolve().relative_to(self.output_dir.resolve())
-        except ValueError:
-            return {"error": "file_write only supports paths under output/."}
+        if os.path.commonpath((str(target.resolve()), output_root)) != output_root:
+            return outside_error
 
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(content, encoding="utf-8")
-        return {"path": str(target), "bytes": len(content)}
+        data = content.encode("utf-8")
+        with open(target, "wb", buffering=0) as f:
+            view = memoryview(data)
+            while view:
+                # Raw writes may be partial; advance by what the OS accepted.
+                written = f.write(view[: self._FILE_WRITE_CHUNK_BYTES])
+                view = view[written:]
+        return {"path": str(target), "bytes": len(data)}
 
     @tool
     def infer_column_type(
@@ -249,6 +737,37 @@ class EDAWorkflowTools:
         )
         return result
 
+    @tool
+    def infer_column_types_batch(self, columns: list[dict[str, Any]]) -> dict[str, Any]:
+        """Infer semantic data types for many columns in a single call.
+
+        Prefer this over calling infer_column_type once per column.
+
+        Args:
+            columns: List of column evidence objects, each with the same keys as
+                infer_column_type (column_name, sql_type, sample_values,
+                unique_count, total_count, null_count)
+
+        Returns:
+            Dictionary with:
+            - column_type_inferences: One result per input column, in order,
+              each tagged with column_name and sql_type
+        """
+        inferences: list[dict[str, Any]] = []
+        for column in columns:
+            column_name = column.get("column_name")
+            sql_type = column.get("sql_type")
+            try:
+                result = self.type_detector.infer_column_type(**column)
+            except Exception as exc:
+                result = {
+                    "inferred_type": "unknown",
+                    "confidence": 0.0,
+                    "error": str(exc),
+                }
+            inferences.append({"column_name": column_name, "sql_type": sql_type, **result})
+        return {"column_type_inferences": inferences}
+
     @tool
     def detect_data_structure(
         self,
@@ -329,29 +848,58 @@ class EDAWorkflowTools:
         )
         return strategy_info
 
-    def _safe_eval(self, node):
-        operators = {
-            ast.Add: operator.add,
-            ast.Sub: operator.sub,
-            ast.Mult: operator.mul,
-            ast.Div: operator.truediv,
-            ast.FloorDiv: operator.floordiv,
-            ast.Mod: operator.mod,
-            ast.Pow: operator.pow,
-            ast.USub: operator.neg,
-            ast.UAdd: operator.pos,
-        }
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _evaluate_expression(cls, expression: str) -> Any:
+        """Evaluate an expression string, caching the result.
 
-        if isinstance(node, ast.BinOp) and type(node.op) in operators:
-            return operators[type(node.op)](
-                self._safe_eval(node.left),
-                self._safe_eval(node.right),
-            )
-        if isinstance(node, ast.UnaryOp) and type(node.op) in operators:
-            return operators[type(node.op)](self._safe_eval(node.operand))
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Unsupported expression")
+        ``_safe_eval`` only accepts numeric constants and operators, so every
+        expression it evaluates is constant and a retried calculation can
+        return the cached value. Errors are not cached.
+        """
+        return cls._safe_eval(ast.parse(expression, mode="eval").body)
+
+    @classmethod
+    def _safe_eval(cls, node: ast.AST) -> Any:
+        """Evaluate a numeric AST without recursion.
+
+        Nodes are visited post-order from an explicit stack; operands are
+        pushed onto ``values`` and folded when their operator is revisited.
+        """
+        operators = cls._OPERATORS
+        values: list[Any] = []
+        stack: list[tuple[ast.AST, bool]] = [(node, False)]
+        while stack:
+            current, operands_ready = stack.pop()
+            node_type = type(current)
+            if node_type is ast.Constant:
+                value = current.value  # type: ignore[attr-defined]
+                if not isinstance(value, (int, float)):
+                    raise ValueError("Unsupported expression")
+                values.append(value)
+            elif node_type is ast.BinOp:
+                op = operators.get(type(current.op))  # type: ignore[attr-defined]
+                if op is None:
+                    raise ValueError("Unsupported expression")
+                if operands_ready:
+                    right = values.pop()
+                    values.append(op(values.pop(), right))
+                else:
+                    stack.append((current, True))
+                    stack.append((current.right, False))  # type: ignore[attr-defined]
+                    stack.append((current.left, False))  # type: ignore[attr-defined]
+            elif node_type is ast.UnaryOp:
+                op = operators.get(type(current.op))  # type: ignore[attr-defined]
+                if op is None:
+                    raise ValueError("Unsupported expression")
+                if operands_ready:
+                    values.append(op(values.pop()))
+                else:
+                    stack.append((current, True))
+                    stack.append((current.operand, False))  # type: ignore[attr-defined]
+            else:
+                raise ValueError("Unsupported expression")
+        return values[0]
 
 
 class EDAOrchestrator:
@@ -370,59 +918,34 @@ class EDAOrchestrator:
         ai_sql_service: ModularAISQLService,
         enable_hooks: bool = True,
         db: AsyncSession | None = None,  # Optional database session for persistence
+        workflow_tools: EDAWorkflowTools | None = None,
+        persistence: EDAWorkflowPersistenceService | None = None,
     ):
         self.sf = snowflake_service
         self.ai_sql = ai_sql_service
         self.router = EDAWorkflowRouter(snowflake_service, ai_sql_service)
         self.db = db  # Store database session
+        # One persistence service per orchestrator, sharing the caller's session
+        if persistence is None and db is not None:
+            persistence = EDAWorkflowPersistenceService(db)
+        self.persistence = persistence
 
         # Create hooks for monitoring and logging
         hooks = create_default_eda_hooks() if enable_hooks else []
 
-        # Prefer OpenAI provider if API key is available
-        openai_key = (
-            settings.OPENAI_API_KEY.get_secret_value()
-            if settings.OPENAI_API_KEY
-            else os.getenv("OPENAI_API_KEY")
-        )
-        if openai_key:
-            os.environ.setdefault("OPENAI_API_KEY", openai_key)
-
-        openai_model_id = (
-            settings.STRANDS_MODEL_ID
-            or settings.OPENAI_MODEL_ID
-            or os.getenv("STRANDS_MODEL_ID")
-            or os.getenv("OPENAI_MODEL_ID")
-            or "gpt-4o-mini"
-        )
-        model_provider = (
-            settings.STRANDS_MODEL_PROVIDER
-            or os.getenv("STRANDS_MODEL_PROVIDER")
-        )
-        if not model_provider or model_provider == "ollama":
-            model_provider = "openai"
-
-        os.environ["STRANDS_MODEL_PROVIDER"] = model_provider
-        os.environ["STRANDS_MODEL_ID"] = openai_model_id
-        os.environ["STRANDS_PROVIDER"] = model_provider
-        openai_model = (
-            OpenAIModel(
-                model_id=openai_model_id,
-                params={
-                    "max_tokens": 8192,  # Increased from 2048 to handle large profiles
-                    "temperature": 0.2,
-                },
-            )
-            if openai_key
-            else None
-        )
-
+        openai_model = _get_openai_model()
         if not openai_model:
+            # Do not cache the miss; a key may be configured before the next call.
+            _get_openai_model.cache_clear()
             raise RuntimeError(
                 "OPENAI_API_KEY is not configured. Set it in core/src/.env or your environment."
             )
 
-        workflow_tools = EDAWorkflowTools(snowflake_service)
+        # Reuse injected tools so callers share one Snowflake service (and its
+        # connection) across orchestrators instead of building a new one each time
+        if workflow_tools is None:
+            workflow_tools = EDAWorkflowTools(snowflake_service)
+        self.workflow_tools = workflow_tools
 
         # Create workflow coordinator agent with hooks
         self.coordinator = Agent(
@@ -430,7 +953,11 @@ class EDAOrchestrator:
             system_prompt="""You are an EDA workflow coordinator. You manage the execution
                                 of exploratory data analysis workflows by coordinating multiple specialized agents.
 
+                                profile_table already returns column_type_inferences and data_structure_type for every
+                                column, so prefer it over separate type inference calls when profiling a table.
+
                                 You have access to powerful data type detection tools:
+                                - infer_column_types_batch: Infer semantic types for all columns in one call (preferred)
                                 - infer_column_type: Infer semantic types of columns (identifier, categorical, numeric, etc.)
                                 - detect_data_structure: Detect if data is time-series, panel, cross-sectional, etc.
                                 - suggest_sampling_strategy: Get optimal sampling strategy for large datasets
@@ -441,6 +968,7 @@ class EDAOrchestrator:
                 workflow_tools.profile_table,
                 workflow_tools.sql,
                 workflow_tools.calculator,
+                workflow_tools.infer_column_types_batch,
                 workflow_tools.infer_column_type,
                 workflow_tools.detect_data_structure,
                 workflow_tools.suggest_sampling_strategy,
@@ -456,111 +984,12 @@ class EDAOrchestrator:
     ) -> list[dict[str, Any]]:
         """Create tasks for EDA_OVERVIEW workflow.
 
-        Workflow: Profile → Insights → Charts → Documentation
-        """
-        # Store context for tasks
-        context = {
-            "table_ref": table_asset.source_sql,
-            "table_name": table_asset.name,
-            "user_goal": user_goal or "Comprehensive EDA analysis",
-        }
-
-        tasks = [
-            {
-                "task_id": "profile_table",
-                "tools": ["profile_table"],
-                "description": f"Profile the table '{table_asset.name}' to extract schema, statistics, sample data, AND semantic type inference for each column. Table SQL: {table_asset.source_sql}",
-                "system_prompt": """You are a data profiling expert. Extract comprehensive table profiles including:
-
-                1. Schema (column names and SQL types)
-                2. Statistics (row count, null counts, distinct values, cardinality)
-                3. Sample data
-                4. **Semantic type inference** - The profile_table tool now automatically includes:
-                - column_type_inferences: Semantic types for each column (identifier, categorical, numeric, etc.)
-                - data_structure_type: Overall data structure (time_series, panel, cross_sectional, etc.)
-
-                The profile you receive will already contain semantic type information in metadata.column_type_inferences.
-                Each column inference includes:
-                - inferred_type: Semantic type (e.g., "identifier", "nominal_categorical", "continuous_numeric")
-                - confidence: Confidence score (0.0-1.0)
-                - recommendations: How to handle this type
-
-                Use the profile_table tool to fetch the complete profile with type inference.
-                Return results as JSON with keys: schema, statistics, samples, metadata (including column_type_inferences and data_structure_type).""",
-                "priority": 5,
-                "dependencies": [],
-            },
-            {
-                "task_id": "generate_insights",
-                "tools": ["calculator"],
-                "description": f"Analyze the table profile INCLUDING semantic type information and generate insights about data patterns, quality issues, and recommendations. User goal: {user_goal or 'general analysis'}",
-                "system_prompt": """You are a data insights expert. Analyze table profiles with semantic type information.
-
-The profile you receive includes column_type_inferences with semantic types for each column.
-Use this information to:
-- Identify mismatched types (e.g., numeric data stored as text)
-- Detect identifier columns that shouldn't be used in calculations
-- Find categorical columns that need encoding
-- Spot time-series data that needs temporal analysis
-- Detect high-cardinality columns (likely IDs)
-- Identify low-cardinality columns (good for grouping)
-
-Pay special attention to:
-- Columns with low confidence scores (may need manual review)
-- Recommendations from type inference
-- Data structure type (time_series, panel, etc.) for analysis approach
-
-Return JSON with keys: key_findings (array), data_quality_issues (array of objects with issue and severity), recommendations (array).""",
-                "priority": 4,
-                "dependencies": ["profile_table"],
-            },
-            {
-                "task_id": "generate_charts",
-                "tools": ["calculator"],
-                "description": f"Create visualization specifications for the table. Generate 2-3 appropriate charts based on the data types (use semantic type information) and user goal: {user_goal or 'general visualization'}",
-                "system_prompt": """You are a data visualization expert. Create chart specifications using semantic type information.
-
-The profile includes column_type_inferences that tell you the semantic type of each column:
-- identifier: Don't visualize (use as labels/keys)
-- categorical: Use for grouping (bar charts, pie charts)
-- continuous_numeric: Use for distributions (histograms, scatter plots)
-- discrete_numeric: Use for counts (bar charts)
-- datetime: Use for time-series (line charts, time plots)
-
-Choose appropriate chart types based on semantic types:
-- Categorical × Numeric → Bar chart
-- Numeric × Numeric → Scatter plot
-- Datetime × Numeric → Line chart
-- Categorical distribution → Pie chart
+        Workflow: Profile → (Insights ∥ Charts) → Documentation
 
-Return JSON with key: charts (array of objects with title, chart_type, sql, narrative).""",
-                "priority": 3,
-                "dependencies": ["profile_table"],
-            },
-            {
-                "task_id": "generate_documentation",
-                "tools": ["calculator"],
-                "description": f"Generate comprehensive documentation for the table including summary, use cases, tags, and markdown documentation. Incorporate semantic type information.",
-                "system_prompt": """You are a technical documentation expert. Create clear documentation incorporating semantic type information.
-
-The profile includes:
-- column_type_inferences: Semantic types for each column
-- data_structure_type: Overall data structure (time_series, panel, etc.)
-
-Use this information to:
-- Describe the table's purpose based on column types
-- Suggest use cases based on data structure type
-- Tag the table appropriately (e.g., "time-series", "categorical-data", "high-dimensional")
-- Document key columns and their semantic meanings
-- Include recommendations from type inference
-
-Return JSON with keys: summary (2-3 sentences), use_cases (array), tags (array), markdown_doc.""",
-                "priority": 2,
-                "dependencies": ["generate_insights", "generate_charts"],
-            },
-        ]
-
-        return tasks
+        Insights and charts only depend on the profile, so the Strands workflow
+        executor dispatches them concurrently once profiling completes.
+        """
+        return _render_task_templates(_OVERVIEW_TASK_TEMPLATES, table_asset, user_goal)
 
     def _create_eda_time_series_tasks(
         self,
@@ -569,78 +998,9 @@ Return JSON with keys: summary (2-3 sentences), use_cases (array), tags (array),
     ) -> list[dict[str, Any]]:
         """Create tasks for EDA_TIME_SERIES workflow.
 
-        Workflow: Profile → Charts (time-focused) → Insights (temporal) → Documentation
+        Workflow: Profile → (Charts (time-focused) ∥ Insights (temporal)) → Documentation
         """
-        tasks = [
-            {
-                "task_id": "profile_table",
-                "tools": ["profile_table"],
-                "description": f"Profile the table '{table_asset.name}' with focus on time-series columns and semantic type inference. Table SQL: {table_asset.source_sql}",
-                "system_prompt": """You are a data profiling expert specializing in time-series data.
-Extract schema, statistics, and identify date/timestamp columns. The profile_table tool automatically includes:
-- column_type_inferences: Semantic types (will identify datetime, temporal_cyclic types)
-- data_structure_type: Should detect as time_series or panel
-
-Pay special attention to temporal columns and their semantic types.
-Use the profile_table tool to fetch real data; do not fabricate.
-Return JSON with schema, statistics, samples, metadata (including type inferences).""",
-                "priority": 5,
-                "dependencies": [],
-            },
-            {
-                "task_id": "generate_charts",
-                "tools": ["calculator"],
-                "description": f"Create time-series visualizations showing trends, patterns, and temporal distributions using semantic type information. User goal: {user_goal or 'time-series analysis'}",
-                "system_prompt": """You are a time-series visualization expert. Create 3-4 charts
-focusing on temporal patterns, trends, and time-based distributions.
-
-Use the column_type_inferences to identify:
-- datetime/timestamp columns: Use as x-axis for time-series plots
-- temporal_cyclic columns: Use for seasonality analysis
-- continuous_numeric columns: Use as y-axis for trends
-
-Prioritize line charts and time-series plots.
-Return JSON with charts array.""",
-                "priority": 4,
-                "dependencies": ["profile_table"],
-            },
-            {
-                "task_id": "generate_insights",
-                "tools": ["calculator"],
-                "description": f"Analyze temporal patterns, trends, seasonality, and anomalies in the time-series data using semantic type information.",
-                "system_prompt": """You are a time-series analysis expert. Identify trends, seasonality,
-anomalies, and temporal patterns.
-
-Use the semantic type information to:
-- Focus on datetime columns for temporal analysis
-- Identify cyclic patterns in temporal_cyclic columns
-- Detect time-dependent relationships
-- Check if data_structure_type is time_series or panel
-
-Return JSON with key_findings, data_quality_issues, recommendations.""",
-                "priority": 3,
-                "dependencies": ["profile_table", "generate_charts"],
-            },
-            {
-                "task_id": "generate_documentation",
-                "tools": ["calculator"],
-                "description": f"Generate time-series focused documentation highlighting temporal insights and semantic types.",
-                "system_prompt": """You are a technical documentation expert specializing in time-series data.
-Create documentation emphasizing temporal patterns and trends.
-
-Incorporate semantic type information:
-- Highlight datetime columns and their ranges
-- Document temporal_cyclic patterns
-- Explain data_structure_type (time_series vs panel)
-- Include time-series specific recommendations
-
-Return JSON with summary, use_cases, tags (include "time-series"), markdown_doc.""",
-                "priority": 2,
-                "dependencies": ["generate_insights"],
-            },
-        ]
-
-        return tasks
+        return _render_task_templates(_TIME_SERIES_TASK_TEMPLATES, table_asset, user_goal)
 
     def _create_eda_data_quality_tasks(
         self,
@@ -651,69 +1011,7 @@ Return JSON with summary, use_cases, tags (include "time-series"), markdown_doc.
 
         Workflow: Profile → Insights (quality-focused) → Documentation (quality report)
         """
-        tasks = [
-            {
-                "task_id": "profile_table",
-                "tools": ["profile_table"],
-                "description": f"Profile the table '{table_asset.name}' with focus on data quality metrics and semantic type inference. Table SQL: {table_asset.source_sql}",
-                "system_prompt": """You are a data quality profiling expert. Extract schema, statistics
-with emphasis on null counts, distinct values, and potential quality issues. The profile_table tool automatically includes:
-- column_type_inferences: Semantic types with confidence scores
-- data_structure_type: Overall data structure
-
-Pay attention to:
-- Low confidence scores (may indicate quality issues)
-- Type mismatches (e.g., numeric stored as text)
-- Identifier columns with duplicates
-
-Use the profile_table tool to fetch real data; do not fabricate.
-Return JSON with schema, statistics, samples, metadata (including type inferences).""",
-                "priority": 5,
-                "dependencies": [],
-            },
-            {
-                "task_id": "generate_insights",
-                "tools": ["calculator"],
-                "description": f"Perform comprehensive data quality analysis identifying issues, anomalies, and providing recommendations using semantic type information. User goal: {user_goal or 'data quality check'}",
-                "system_prompt": """You are a data quality expert. Identify quality issues including
-nulls, duplicates, outliers, inconsistencies, and data integrity problems.
-
-Use semantic type information to detect quality issues:
-- identifier columns with duplicates (should be unique)
-- categorical columns with too many categories (data entry errors?)
-- numeric columns stored as text (type mismatch)
-- datetime columns with invalid dates
-- Low confidence scores (ambiguous types, needs review)
-
-Assign severity levels (low/medium/high) based on:
-- Impact on analysis
-- Data integrity violations
-- Type confidence scores
-
-Return JSON with key_findings, data_quality_issues (with severity), recommendations.""",
-                "priority": 4,
-                "dependencies": ["profile_table"],
-            },
-            {
-                "task_id": "generate_documentation",
-                "tools": ["calculator"],
-                "description": f"Generate a data quality report with findings, issues, and remediation recommendations incorporating semantic type information.",
-                "system_prompt": """You are a data quality documentation expert. Create a quality report
-highlighting issues, their impact, and remediation steps.
-
-Incorporate semantic type information:
-- Document type mismatches and their implications
-- Explain quality issues in context of semantic types
-- Provide type-specific remediation recommendations
-- Include confidence scores for ambiguous columns
-
-Return JSON with summary, use_cases (focus on quality improvement), tags (include "data-quality"), markdown_doc.""",
-                "priority": 3,
-                "dependencies": ["generate_insights"],
-            },
-        ]
-
-        return tasks
+        return _render_task_templates(_DATA_QUALITY_TASK_TEMPLATES, table_asset, user_goal)
 
     def _get_task_templates(
         self,
@@ -821,19 +1119,19 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
         Returns:
             Complete EDA results with all artifacts
         """
-        # Route to appropriate workflow
+        # Route to appropriate workflow; an explicit workflow_type skips the router
         if workflow_type is None:
             workflow_type = await self.router.route_workflow(table_asset, user_intent)
 
-        logger.info("\n%s", "=" * 60)
+        logger.info("\n%s", _BANNER)
         logger.info("🔬 Starting EDA Workflow: %s", workflow_type)
         logger.info("📊 Table: %s", table_asset.name)
         if user_intent:
             logger.info("🎯 Goal: %s", user_intent)
-        logger.info("%s\n", "=" * 60)
+        logger.info("%s\n", _BANNER)
 
         # Create workflow ID
-        workflow_id = f"eda_{table_asset.id}_{uuid.uuid4().hex[:8]}"
+        workflow_id = f"eda_{table_asset.id}_{next(_workflow_id_counter):016x}"
 
         if tasks_override is not None:
             tasks = tasks_override
@@ -841,9 +1139,8 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
             tasks = self._get_task_templates(workflow_type, table_asset, user_intent)
 
         # Create database record if db session is available
-        persistence = None
-        if self.db:
-            persistence = EDAWorkflowPersistenceService(self.db)
+        persistence = self.persistence
+        if persistence:
             try:
                 await persistence.create_execution(
                     workflow_id=workflow_id,
@@ -860,6 +1157,13 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
                     e,
                 )
 
+        # Warm the profile cache; the workflow's profile_table task then reuses this scan
+        if any("profile_table" in task.get("tools", ()) for task in tasks):
+            try:
+                await self.workflow_tools.get_cached_profile(table_asset.source_sql)
+            except Exception as e:
+                logger.warning("[Profile] Warning: Could not prefetch table profile: %s", e)
+
         # Create workflow using Strands workflow tool
         logger.info(
             "[Strands Workflow] Creating workflow '%s' with %s tasks...",
@@ -899,31 +1203,25 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
             workflow_data = None
             if workflow_file.exists():
                 try:
-                    with open(workflow_file, "r") as f:
-                        workflow_data = json.load(f)
+                    workflow_data = json_loads(workflow_file.read_bytes())
                 except Exception as e:
                     logger.warning("[Warning] Could not read workflow file: %s", e)
 
             workflow_state = workflow_data.get("status") if workflow_data else None
             if workflow_state == "cancelled":
-                logger.info("\n%s", "=" * 60)
+                logger.info("\n%s", _BANNER)
                 logger.info("🛑 EDA Workflow Cancelled")
-                logger.info("%s\n", "=" * 60)
+                logger.info("%s\n", _BANNER)
             else:
-                logger.info("\n%s", "=" * 60)
+                logger.info("\n%s", _BANNER)
                 logger.info("✅ EDA Workflow Complete!")
-                logger.info("%s\n", "=" * 60)
+                logger.info("%s\n", _BANNER)
 
             # Parse and structure results
-            artifacts = (
-                self._extract_artifacts_from_workflow_data(workflow_data)
-                if workflow_data
-                else {}
-            )
-            summary = (
-                self._generate_summary_from_workflow_data(workflow_data)
+            artifacts, summary = (
+                self._extract_artifacts_and_summary(workflow_data)
                 if workflow_data
-                else {}
+                else ({}, {})
             )
 
             # Update database record with results
@@ -981,32 +1279,16 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
                     )
             raise
 
-    def _extract_artifacts_from_workflow_data(self, workflow_data: dict[str, Any]) -> dict[str, Any]:
-        """Extract artifacts from workflow data file."""
-        artifacts = {}
-
-        if not workflow_data:
-            return artifacts
+    def _extract_artifacts_and_summary(
+        self,
+        workflow_data: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Extract artifacts and the progress summary from workflow data.
 
-        # Extract from task_results
-        task_results = workflow_data.get("task_results", {})
-        for task_id, task_data in task_results.items():
-            if task_data.get("status") == "completed" and "result" in task_data:
-                # Parse the result - it's a list with text content
-                result_list = task_data["result"]
-                if isinstance(result_list, list) and len(result_list) > 0:
-                    # Extract text and try to parse JSON from it
-                    text_content = result_list[0].get("text", "")
-                    artifacts[task_id] = {
-                        "status": "completed",
-                        "text": text_content,
-                        "metrics": task_data.get("metrics", ""),
-                    }
-
-        return artifacts
-
-    def _generate_summary_from_workflow_data(self, workflow_data: dict[str, Any]) -> dict[str, Any]:
-        """Generate summary from workflow data file."""
+        Task results are walked once; each completed task both counts toward
+        progress and contributes its text output as an artifact.
+        """
+        artifacts: dict[str, Any] = {}
         summary = {
             "completed": False,
             "progress": 0,
@@ -1015,26 +1297,48 @@ Return JSON with summary, use_cases (focus on quality improvement), tags (includ
         }
 
         if not workflow_data:
-            return summary
-
-        # Check workflow status
-        summary["completed"] = workflow_data.get("status") == "completed"
+            return artifacts, summary
 
-        # Count tasks
-        tasks = workflow_data.get("tasks", [])
+        tasks_completed = 0
         task_results = workflow_data.get("task_results", {})
+        for task_id, task_data in task_results.items():
+            if not isinstance(task_data, dict) or task_data.get("status") != "completed":
+                continue
+            tasks_completed += 1
 
-        summary["tasks_total"] = len(tasks)
-        summary["tasks_completed"] = sum(
-            1 for task_data in task_results.values()
-            if task_data.get("status") == "completed"
-        )
+            # The result is a list of content blocks; the first holds the text
+            result_list = task_data.get("result")
+            if not result_list or not isinstance(result_list, list):
+                continue
+            first_block = result_list[0]
+            artifacts[task_id] = {
+                "status": "completed",
+                "text": first_block.get("text", "") if isinstance(first_block, dict) else "",
+                "metrics": task_data.get("metrics", ""),
+            }
 
-        # Calculate progress
-        if summary["tasks_total"] > 0:
-            summary["progress"] = int((summary["tasks_completed"] / summary["tasks_total"]) * 100)
+        tasks_total = len(workflow_data.get("tasks", []))
+        summary["completed"] = workflow_data.get("status") == "completed"
+        summary["tasks_total"] = tasks_total
+        summary["tasks_completed"] = tasks_completed
+        if tasks_total > 0:
+            summary["progress"] = tasks_completed * 100 // tasks_total
+
+        return artifacts, summary
 
-        return summary
+    def _extract_artifacts_from_workflow_data(
+        self,
+        workflow_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Extract task artifacts only; see ``_extract_artifacts_and_summary``."""
+        return self._extract_artifacts_and_summary(workflow_data)[0]
+
+    def _generate_summary_from_workflow_data(
+        self,
+        workflow_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the progress summary only; see ``_extract_artifacts_and_summary``."""
+        return self._extract_artifacts_and_summary(workflow_data)[1]
 
 
 # ============================================================================
@@ -1046,6 +1350,8 @@ def create_eda_orchestrator(
     snowflake_service: SnowflakeService,
     ai_sql_service: ModularAISQLService,
     db: AsyncSession | None = None,
+    workflow_tools: EDAWorkflowTools | None = None,
+    persistence: EDAWorkflowPersistenceService | None = None,
 ) -> EDAOrchestrator:
     """Create an EDA orchestrator instance using Strands workflow tool.
 
@@ -1053,9 +1359,17 @@ def create_eda_orchestrator(
         snowflake_service: Snowflake service instance
         ai_sql_service: AI SQL service instance
         db: Optional database session for persistence
+        workflow_tools: Optional shared tool set; built from snowflake_service if omitted
+        persistence: Optional shared persistence service; built from db if omitted
 
     Usage:
         orchestrator = create_eda_orchestrator(sf_service, ai_sql_service, db=db)
         results = await orchestrator.run_eda(table_asset, user_intent="find trends")
     """
-    return EDAOrchestrator(snowflake_service, ai_sql_service, db=db)
+    return EDAOrchestrator(
+        snowflake_service,
+        ai_sql_service,
+        db=db,
+        workflow_tools=workflow_tools,
+        persistence=persistence,
+    )
@@ -10,55 +10,17 @@ Usage:
     response = await agent.run("Analyze sentiment of customer reviews")
 """
 
+from dataclasses import dataclass
+from collections.abc import Callable
 from typing import Any
 
 from strands import Agent, tool
-from strands.types.content import Message
 
 from ..services.modular_ai_sql_service import ModularAISQLService
 from ..services.snowflake_service import SnowflakeService
 
-
-class AISQLStrandsAgent(Agent):
-    """AI SQL Agent built with Strands Agents framework.
-
-    This agent provides all 17+ AI SQL capabilities as Strands tools,
-    allowing natural language interaction with Snowflake Cortex AI.
-
-    Example:
-        agent = AISQLStrandsAgent(snowflake_service)
-        response = await agent.run("Analyze sentiment of reviews in the reviews table")
-    """
-
-    def __init__(
-        self,
-        snowflake_service: SnowflakeService,
-        name: str = "AI SQL Agent",
-        model: str = "claude-3-7-sonnet",
-        **kwargs,
-    ):
-        """Initialize AI SQL Strands Agent.
-
-        Args:
-            snowflake_service: Snowflake service instance
-            name: Agent name
-            model: LLM model to use
-            **kwargs: Additional Agent configuration
-        """
-        # Initialize AI SQL service
-        self.ai_sql_service = ModularAISQLService(snowflake_service)
-
-        # Initialize Strands Agent
-        super().__init__(
-            model=model,
-            name=name,
-            system_prompt=self._build_instructions(),
-            **kwargs,
-        )
-
-    def _build_instructions(self) -> str:
-        """Build comprehensive instructions for the agent."""
-        return """You are an AI SQL expert specializing in Snowflake Cortex AI operations.
+# Static agent instructions, built once at import rather than per agent instance
+_SYSTEM_PROMPT = """You are an AI SQL expert specializing in Snowflake Cortex AI operations.
 
 You have access to 17+ powerful AI SQL tools organized by category:
 
@@ -90,6 +52,11 @@ You have access to 17+ powerful AI SQL tools organized by category:
 
 **UTILITY**
 - ai_count_tokens: Count tokens for cost estimation
+- run_ops_batch: Run several row-level AI functions on one table in a single query
+
+When several row-level operations (sentiment, classify, summarize, translate, extract,
+embed, similarity, count tokens, redact) target the same table, prefer run_ops_batch
+over separate tool calls: it answers them all in one warehouse round-trip.
 
 When a user asks you to perform an AI SQL operation:
 1. Identify which tool(s) are most appropriate
@@ -100,6 +67,170 @@ When a user asks you to perform an AI SQL operation:
 Always ask for clarification if table names or column names are not specified.
 """
 
+
+@dataclass(frozen=True)
+class _TableToolSpec:
+    """How a table-backed tool maps onto its ModularAISQLService method.
+
+    The service method shares the tool's name. ``service_args`` lists tool
+    arguments in service call order and ``response_fields`` the ``(key, argument)``
+    pairs echoed in the response; a callable instead of an argument name derives
+    the value from all arguments.
+    """
+
+    service_args: tuple[str, ...]
+    response_fields: tuple[tuple[str, str | Callable[[dict[str, Any]], Any]], ...]
+
+
+_TABLE_TOOL_SPECS: dict[str, _TableToolSpec] = {
+    "ai_sentiment": _TableToolSpec(
+        ("text_column", "table_name"),
+        (("table", "table_name"), ("column", "text_column")),
+    ),
+    "ai_classify": _TableToolSpec(
+        ("content_column", "categories", "table_name", "prompt_prefix"),
+        (("table", "table_name"), ("column", "content_column"), ("categories", "categories")),
+    ),
+    "ai_filter": _TableToolSpec(
+        ("filter_condition", "table_name", "columns"),
+        (("table", "table_name"), ("condition", "filter_condition"), ("columns", "columns")),
+    ),
+    "ai_similarity": _TableToolSpec(
+        ("table_name", "column1", "column2"),
+        (("table", "table_name"), ("columns", lambda args: [args["column1"], args["column2"]])),
+    ),
+    "ai_translate": _TableToolSpec(
+        ("text_column", "table_name", "source_lang", "target_lang"),
+        (
+            ("table", "table_name"),
+            ("column", "text_column"),
+            ("from", "source_lang"),
+            ("to", "target_lang"),
+        ),
+    ),
+    "ai_redact": _TableToolSpec(
+        ("text_column", "table_name", "pii_types"),
+        (
+            ("table", "table_name"),
+            ("column", "text_column"),
+            ("pii_types", lambda args: args["pii_types"] or "all"),
+        ),
+    ),
+    "summarize": _TableToolSpec(
+        ("text_column", "table_name"),
+        (("table", "table_name"), ("column", "text_column")),
+    ),
+    "ai_extract": _TableToolSpec(
+        ("content_column", "table_name", "instruction"),
+        (("table", "table_name"), ("column", "content_column"), ("instruction", "instruction")),
+    ),
+    "extract_structured_data": _TableToolSpec(
+        ("text_column", "table_name", "extraction_prompt", "schema"),
+        (("table", "table_name"), ("column", "text_column"), ("schema", "schema")),
+    ),
+    "ai_parse_document": _TableToolSpec(
+        ("file_path_column", "table_name", "mode"),
+        (("table", "table_name"), ("column", "file_path_column"), ("mode", "mode")),
+    ),
+    "ai_transcribe": _TableToolSpec(
+        ("audio_file_column", "table_name"),
+        (("table", "table_name"), ("column", "audio_file_column")),
+    ),
+    "ai_aggregate": _TableToolSpec(
+        ("column_to_aggregate", "aggregation_prompt", "table_name", "group_by"),
+        (
+            ("table", "table_name"),
+            ("column", "column_to_aggregate"),
+            ("prompt", "aggregation_prompt"),
+            ("group_by", "group_by"),
+        ),
+    ),
+    "ai_summarize_agg": _TableToolSpec(
+        ("text_column", "table_name", "group_by"),
+        (("table", "table_name"), ("column", "text_column"), ("group_by", "group_by")),
+    ),
+    "ai_embed": _TableToolSpec(
+        ("content_column", "table_name", "model"),
+        (("table", "table_name"), ("column", "content_column"), ("model", "model")),
+    ),
+    "semantic_join": _TableToolSpec(
+        ("left_table", "right_table", "left_column", "right_column", "join_condition"),
+        (
+            ("left_table", "left_table"),
+            ("right_table", "right_table"),
+            ("condition", "join_condition"),
+        ),
+    ),
+    "ai_count_tokens": _TableToolSpec(
+        ("model", "text_column", "table_name"),
+        (("table", "table_name"), ("model", "model"), ("column", "text_column")),
+    ),
+    "run_ops_batch": _TableToolSpec(
+        ("table_name", "ops"),
+        (("table", "table_name"), ("ops", lambda args: [spec.get("op") for spec in args["ops"]])),
+    ),
+}
+
+
+def _tool_result(tool_name: str, results: list[dict[str, Any]], **fields: Any) -> dict[str, Any]:
+    """Build the response shared by all table-backed tools.
+
+    Keys are ordered ``tool``, the tool-specific ``fields``, ``results`` and
+    ``count``, matching what the agent has always returned.
+    """
+    return {"tool": tool_name, **fields, "results": results, "count": len(results)}
+
+
+class AISQLStrandsAgent(Agent):
+    """AI SQL Agent built with Strands Agents framework.
+
+    This agent provides all 17+ AI SQL capabilities as Strands tools,
+    allowing natural language interaction with Snowflake Cortex AI.
+
+    Example:
+        agent = AISQLStrandsAgent(snowflake_service)
+        response = await agent.run("Analyze sentiment of reviews in the reviews table")
+    """
+
+    def __init__(
+        self,
+        snowflake_service: SnowflakeService,
+        name: str = "AI SQL Agent",
+        model: str = "claude-3-7-sonnet",
+        **kwargs,
+    ):
+        """Initialize AI SQL Strands Agent.
+
+        Args:
+            snowflake_service: Snowflake service instance
+            name: Agent name
+            model: LLM model to use
+            **kwargs: Additional Agent configuration
+        """
+        # Initialize AI SQL service
+        self.ai_sql_service = ModularAISQLService(snowflake_service)
+        # Service methods resolved once for _run_table_tool dispatch
+        self._tool_methods = {name: getattr(self.ai_sql_service, name) for name in _TABLE_TOOL_SPECS}
+
+        # Initialize Strands Agent
+        super().__init__(
+            model=model,
+            name=name,
+            system_prompt=_SYSTEM_PROMPT,
+            **kwargs,
+        )
+
+    async def _run_table_tool(self, tool_name: str, **arguments: Any) -> dict[str, Any]:
+        """Run a table-backed tool as described by its ``_TABLE_TOOL_SPECS`` entry."""
+        spec = _TABLE_TOOL_SPECS[tool_name]
+        service_args = [arguments[name] for name in spec.service_args]
+        results = await self._tool_methods[tool_name](*service_args)
+        fields = {
+            key: source(arguments) if callable(source) else arguments[source]
+            for key, source in spec.response_fields
+        }
+        return _tool_result(tool_name, results, **fields)
+
     # ========================================================================
     # TEXT ANALYSIS TOOLS
     # ========================================================================
@@ -122,14 +253,11 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Sentiment analysis results with scores and categories
         """
-        results = await self.ai_sql_service.ai_sentiment(text_column, table_name)
-        return {
-            "tool": "ai_sentiment",
-            "table": table_name,
-            "column": text_column,
-            "results": results,
-            "count": len(results),
-        }
+        return await self._run_table_tool(
+            "ai_sentiment",
+            text_column=text_column,
+            table_name=table_name,
+        )
 
     @tool
     async def ai_classify(
@@ -152,17 +280,13 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Classification results with labels and confidence scores
         """
-        results = await self.ai_sql_service.ai_classify(
-            content_column, categories, table_name, prompt_prefix
+        return await self._run_table_tool(
+            "ai_classify",
+            content_column=content_column,
+            categories=categories,
+            table_name=table_name,
+            prompt_prefix=prompt_prefix,
         )
-        return {
-            "tool": "ai_classify",
-            "table": table_name,
-            "column": content_column,
-            "categories": categories,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_filter(
@@ -184,17 +308,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Filtered results matching the condition
         """
-        results = await self.ai_sql_service.ai_filter(
-            filter_condition, table_name, columns
+        return await self._run_table_tool(
+            "ai_filter",
+            filter_condition=filter_condition,
+            table_name=table_name,
+            columns=columns,
         )
-        return {
-            "tool": "ai_filter",
-            "table": table_name,
-            "condition": filter_condition,
-            "columns": columns,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_similarity(
@@ -215,14 +334,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Similarity scores between the columns
         """
-        results = await self.ai_sql_service.ai_similarity(table_name, column1, column2)
-        return {
-            "tool": "ai_similarity",
-            "table": table_name,
-            "columns": [column1, column2],
-            "results": results,
-            "count": len(results),
-        }
+        return await self._run_table_tool(
+            "ai_similarity",
+            table_name=table_name,
+            column1=column1,
+            column2=column2,
+        )
 
     # ========================================================================
     # TEXT TRANSFORMATION TOOLS
@@ -249,18 +366,13 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Translated text results
         """
-        results = await self.ai_sql_service.ai_translate(
-            text_column, table_name, source_lang, target_lang
+        return await self._run_table_tool(
+            "ai_translate",
+            text_column=text_column,
+            table_name=table_name,
+            source_lang=source_lang,
+            target_lang=target_lang,
         )
-        return {
-            "tool": "ai_translate",
-            "table": table_name,
-            "column": text_column,
-            "from": source_lang,
-            "to": target_lang,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_redact(
@@ -281,17 +393,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Redacted text with PII removed
         """
-        results = await self.ai_sql_service.ai_redact(
-            text_column, table_name, pii_types
+        return await self._run_table_tool(
+            "ai_redact",
+            text_column=text_column,
+            table_name=table_name,
+            pii_types=pii_types,
         )
-        return {
-            "tool": "ai_redact",
-            "table": table_name,
-            "column": text_column,
-            "pii_types": pii_types or "all",
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def summarize(
@@ -310,14 +417,11 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Summarized text results
         """
-        results = await self.ai_sql_service.summarize(text_column, table_name)
-        return {
-            "tool": "summarize",
-            "table": table_name,
-            "column": text_column,
-            "results": results,
-            "count": len(results),
-        }
+        return await self._run_table_tool(
+            "summarize",
+            text_column=text_column,
+            table_name=table_name,
+        )
 
     @tool
     async def ai_complete(
@@ -342,7 +446,7 @@ Always ask for clarification if table names or column names are not specified.
         return {
             "tool": "ai_complete",
             "model": model,
-            "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
+            "prompt": prompt if len(prompt) <= 100 else f"{prompt[:100]}...",
             "response": result,
         }
 
@@ -369,17 +473,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Extracted information
         """
-        results = await self.ai_sql_service.ai_extract(
-            content_column, table_name, instruction
+        return await self._run_table_tool(
+            "ai_extract",
+            content_column=content_column,
+            table_name=table_name,
+            instruction=instruction,
         )
-        return {
-            "tool": "ai_extract",
-            "table": table_name,
-            "column": content_column,
-            "instruction": instruction,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def extract_structured_data(
@@ -402,17 +501,13 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Structured data matching the schema
         """
-        results = await self.ai_sql_service.extract_structured_data(
-            text_column, table_name, extraction_prompt, schema
+        return await self._run_table_tool(
+            "extract_structured_data",
+            text_column=text_column,
+            table_name=table_name,
+            extraction_prompt=extraction_prompt,
+            schema=schema,
         )
-        return {
-            "tool": "extract_structured_data",
-            "table": table_name,
-            "column": text_column,
-            "schema": schema,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_parse_document(
@@ -433,17 +528,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Parsed text content from documents
         """
-        results = await self.ai_sql_service.ai_parse_document(
-            file_path_column, table_name, mode
+        return await self._run_table_tool(
+            "ai_parse_document",
+            file_path_column=file_path_column,
+            table_name=table_name,
+            mode=mode,
         )
-        return {
-            "tool": "ai_parse_document",
-            "table": table_name,
-            "column": file_path_column,
-            "mode": mode,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_transcribe(
@@ -462,16 +552,11 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Transcribed text with metadata
         """
-        results = await self.ai_sql_service.ai_transcribe(
-            audio_file_column, table_name
+        return await self._run_table_tool(
+            "ai_transcribe",
+            audio_file_column=audio_file_column,
+            table_name=table_name,
         )
-        return {
-            "tool": "ai_transcribe",
-            "table": table_name,
-            "column": audio_file_column,
-            "results": results,
-            "count": len(results),
-        }
 
     # ========================================================================
     # AGGREGATION TOOLS
@@ -498,18 +583,13 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Aggregated insights
         """
-        results = await self.ai_sql_service.ai_aggregate(
-            column_to_aggregate, aggregation_prompt, table_name, group_by
+        return await self._run_table_tool(
+            "ai_aggregate",
+            column_to_aggregate=column_to_aggregate,
+            aggregation_prompt=aggregation_prompt,
+            table_name=table_name,
+            group_by=group_by,
         )
-        return {
-            "tool": "ai_aggregate",
-            "table": table_name,
-            "column": column_to_aggregate,
-            "prompt": aggregation_prompt,
-            "group_by": group_by,
-            "results": results,
-            "count": len(results),
-        }
 
     @tool
     async def ai_summarize_agg(
@@ -530,17 +610,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Aggregated summaries
         """
-        results = await self.ai_sql_service.ai_summarize_agg(
-            text_column, table_name, group_by
+        return await self._run_table_tool(
+            "ai_summarize_agg",
+            text_column=text_column,
+            table_name=table_name,
+            group_by=group_by,
         )
-        return {
-            "tool": "ai_summarize_agg",
-            "table": table_name,
-            "column": text_column,
-            "group_by": group_by,
-            "results": results,
-            "count": len(results),
-        }
 
     # ========================================================================
     # SEMANTIC OPERATIONS TOOLS
@@ -565,15 +640,12 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Embedding vectors
         """
-        results = await self.ai_sql_service.ai_embed(content_column, table_name, model)
-        return {
-            "tool": "ai_embed",
-            "table": table_name,
-            "column": content_column,
-            "model": model,
-            "results": results,
-            "count": len(results),
-        }
+        return await self._run_table_tool(
+            "ai_embed",
+            content_column=content_column,
+            table_name=table_name,
+            model=model,
+        )
 
     @tool
     async def semantic_join(
@@ -598,17 +670,14 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Semantically joined results
         """
-        results = await self.ai_sql_service.semantic_join(
-            left_table, right_table, left_column, right_column, join_condition
+        return await self._run_table_tool(
+            "semantic_join",
+            left_table=left_table,
+            right_table=right_table,
+            left_column=left_column,
+            right_column=right_column,
+            join_condition=join_condition,
         )
-        return {
-            "tool": "semantic_join",
-            "left_table": left_table,
-            "right_table": right_table,
-            "condition": join_condition,
-            "results": results,
-            "count": len(results),
-        }
 
     # ========================================================================
     # UTILITY TOOLS
@@ -633,17 +702,43 @@ Always ask for clarification if table names or column names are not specified.
         Returns:
             Token counts
         """
-        results = await self.ai_sql_service.ai_count_tokens(
-            model, text_column, table_name
+        return await self._run_table_tool(
+            "ai_count_tokens",
+            model=model,
+            text_column=text_column,
+            table_name=table_name,
+        )
+
+    @tool
+    async def run_ops_batch(
+        self,
+        table_name: str,
+        ops: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Run several row-level AI SQL operations on one table in a single query.
+
+        Use this instead of separate ai_sentiment/ai_classify/ai_translate/... calls
+        when they target the same table; all results come back in one round-trip.
+
+        Args:
+            table_name: Name of the table
+            ops: Operations to run, e.g.
+                [{"op": "ai_sentiment", "column": "review_text"},
+                 {"op": "ai_classify", "column": "review_text", "categories": ["A", "B"]}].
+                Supported ops: ai_sentiment, ai_classify (categories, prompt_prefix),
+                summarize, ai_translate (source_lang, target_lang), ai_extract
+                (instruction), ai_embed (model), ai_similarity (column2),
+                ai_count_tokens (model), ai_redact (pii_types). An optional
+                "alias" names the result column.
+
+        Returns:
+            One row per input row with a result column per operation
+        """
+        return await self._run_table_tool(
+            "run_ops_batch",
+            table_name=table_name,
+            ops=ops,
         )
-        return {
-            "tool": "ai_count_tokens",
-            "table": table_name,
-            "model": model,
-            "column": text_column,
-            "results": results,
-            "count": len(results),
-        }
 
 
 # ============================================================================
@@ -690,6 +785,8 @@ def create_aisql_agent(
 
 async def example_usage():
     """Example of using the AI SQL Strands Agent."""
+    from strands.types.content import Message
+
     from app.services.snowflake_service import SnowflakeService
 
     # Initialize services
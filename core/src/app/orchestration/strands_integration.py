@@ -10,25 +10,268 @@ Usage:
     response = await agent.process_request("Analyze sentiment of reviews", "user-123", "session-456")
 """
 
-from typing import Any
+import asyncio
+import copy
+import functools
+import hashlib
+import io
+import json
+import re
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from contextvars import ContextVar
+from importlib.util import find_spec
+from types import MappingProxyType
+from weakref import WeakValueDictionary
+from typing import TYPE_CHECKING, Any
+
+from ..core.utils.json_codec import json_dumps, json_loads
+
+# Strands Agents (install: pip install multi-agent-orchestrator) is detected without
+# importing it; the SDK and the AI SQL service are loaded when an agent or
+# orchestrator is created, so importing this module stays cheap.
+STRANDS_AVAILABLE = find_spec("multi_agent_orchestrator") is not None
+
+if TYPE_CHECKING:
+    from multi_agent_orchestrator.agents import Agent, AgentResponse
+
+    from ..services.snowflake_service import SnowflakeService
+    from .tools import AISQLToolkit
+
+# Responses longer than this are JSON-decoded in a worker thread
+_OFFLOAD_JSON_PARSE_CHARS = 64_000
+
+# AISQLToolkit (and its ModularAISQLService) per Snowflake service, shared by
+# every live agent created for that service
+_TOOLKIT_CACHE: "WeakValueDictionary[int, AISQLToolkit]" = WeakValueDictionary()
+
+# Fenced ```json blocks in agent responses
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+
+# Connection pool size for the bedrock-runtime client shared by orchestrator agents
+_BEDROCK_MAX_POOL_CONNECTIONS = 50
+
+# toolUse blocks captured during the current process_request call
+_captured_tool_uses: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "aisql_captured_tool_uses", default=None
+)
+
+
+# Specialized agents registered by AISQLOrchestrator, built once at import
+_SPECIALIZED_AGENT_CONFIGS: tuple[MappingProxyType[str, str], ...] = (
+    # Text Analysis Agent
+    MappingProxyType({
+        "name": "Text Analysis Agent",
+        "description": """Specializes in text analysis operations:
+            - Sentiment analysis
+            - Classification
+            - Filtering
+            - Similarity detection
 
-# Strands Agents imports (install: pip install multi-agent-orchestrator)
-try:
-    from multi_agent_orchestrator.agents import BedrockLLMAgent, Agent, AgentResponse
-    from multi_agent_orchestrator.orchestrator import MultiAgentOrchestrator
-    from multi_agent_orchestrator.types import ConversationMessage
+            Use this agent for understanding and categorizing text data.""",
+        "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
+    }),
+    # Data Extraction Agent
+    MappingProxyType({
+        "name": "Data Extraction Agent",
+        "description": """Specializes in extracting information:
+            - Extract specific data from text
+            - Parse documents (PDF, images)
+            - Transcribe audio/video
+            - Structure unstructured data
 
-    STRANDS_AVAILABLE = True
-except ImportError:
-    STRANDS_AVAILABLE = False
-    # Fallback types for type hints
-    Agent = Any
-    AgentResponse = Any
-    MultiAgentOrchestrator = Any
+            Use this agent for pulling information from various sources.""",
+        "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
+    }),
+    # Text Transformation Agent
+    MappingProxyType({
+        "name": "Text Transformation Agent",
+        "description": """Specializes in transforming text:
+            - Translation
+            - Summarization
+            - PII redaction
+            - Text generation
+
+            Use this agent for modifying or converting text.""",
+        "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
+    }),
+    # Semantic Operations Agent
+    MappingProxyType({
+        "name": "Semantic Operations Agent",
+        "description": """Specializes in semantic operations:
+            - Generate embeddings
+            - Calculate similarity
+            - Semantic joins
+            - Vector operations
+
+            Use this agent for semantic search and similarity tasks.""",
+        "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
+    }),
+)
 
-from ..services.modular_ai_sql_service import ModularAISQLService
-from ..services.snowflake_service import SnowflakeService
-from .tools import AISQLToolkit
+
+@functools.lru_cache(maxsize=32)
+def _format_tools_description(
+    tools: tuple[tuple[str, str, str, str | None], ...],
+) -> str:
+    """Format (category, name, description, first example) rows grouped by category.
+
+    The toolkit is the same for every agent in a process, so agents after the
+    first reuse the formatted text.
+    """
+    tools_by_category: defaultdict[str, list[tuple[str, str, str, str | None]]] = defaultdict(list)
+    for tool in tools:
+        tools_by_category[tool[0]].append(tool)
+
+    buffer = io.StringIO()
+    for category, category_tools in tools_by_category.items():
+        buffer.write(f"\n\n{category.upper()}:")
+        for _, name, description, example in category_tools:
+            buffer.write(f"\n  • {name}: {description}")
+            if example:
+                buffer.write(f"\n    Examples: {example}")
+
+    # Every line is written with a leading newline; "\n".join had none before the first
+    return buffer.getvalue()[1:]
+
+
+def _find_embedded_tool_selection(text: str) -> dict[str, Any] | None:
+    """Return the first ``{"tool_name": ..., "parameters": {...}}`` object in ``text``.
+
+    Fenced ```json blocks are tried first, then every ``{`` is tried as the start
+    of a JSON object, so nested braces are handled by the decoder itself.
+    """
+    candidates = [match.group(1) for match in _JSON_FENCE_RE.finditer(text)]
+    candidates.append(text)
+    decoder = json.JSONDecoder()
+    for candidate in candidates:
+        start = candidate.find("{")
+        while start != -1:
+            try:
+                value, end = decoder.raw_decode(candidate, start)
+            except ValueError:
+                start = candidate.find("{", start + 1)
+                continue
+            if (
+                isinstance(value, dict)
+                and isinstance(value.get("tool_name"), str)
+                and isinstance(value.get("parameters"), dict)
+            ):
+                return value
+            start = candidate.find("{", start + 1)
+    return None
+
+
+def _create_bedrock_client() -> Any:
+    """Create a bedrock-runtime client sized for concurrent agents."""
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "bedrock-runtime",
+        config=Config(max_pool_connections=_BEDROCK_MAX_POOL_CONNECTIONS),
+    )
+
+
+def _tool_input_schema(parameters: dict[str, Any]) -> dict[str, Any]:
+    """Convert toolkit parameter definitions into a JSON schema object."""
+    properties = {}
+    required = []
+    for name, spec in parameters.items():
+        properties[name] = {key: value for key, value in spec.items() if key != "required"}
+        if spec.get("required"):
+            required.append(name)
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _tool_call_schema(tool_names: list[str]) -> dict[str, Any]:
+    """JSON schema for a ``{"tool_name": ..., "parameters": {...}}`` tool selection."""
+    return {
+        "type": "object",
+        "properties": {
+            "tool_name": {"type": "string", "enum": tool_names},
+            "parameters": {"type": "object"},
+        },
+        "required": ["tool_name", "parameters"],
+    }
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to provider throttling (AIMD).
+
+    The limit halves whenever a call fails with a throttling error and grows by
+    one after ``limit`` consecutive successes, bounded by ``min_concurrency`` and
+    ``max_concurrency``. ``max_rps`` optionally spaces out call starts.
+
+    Usage:
+        async with limiter:
+            await bedrock_call()
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        max_rps: float | None = None,
+    ):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = max(min_concurrency, min(initial_concurrency, max_concurrency))
+        self._min_interval = 1.0 / max_rps if max_rps else 0.0
+        self._next_start = 0.0
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            if self._min_interval:
+                now = time.monotonic()
+                start_at = max(now, self._next_start)
+                self._next_start = start_at + self._min_interval
+            else:
+                start_at = 0.0
+        if start_at:
+            delay = start_at - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    # Cancelled before the call started: give the slot back
+                    async with self._condition:
+                        self._in_flight -= 1
+                        self._condition.notify_all()
+                    raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if exc is not None and _is_throttling_error(exc):
+                self.limit = max(self.min_concurrency, self.limit // 2)
+                self._successes = 0
+            elif exc is None:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+def _is_throttling_error(exc: BaseException) -> bool:
+    """Return True for HTTP 429 / Bedrock ThrottlingException style errors."""
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code", "")
+        if code in ("ThrottlingException", "TooManyRequestsException"):
+            return True
+        if response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 429:
+            return True
+    return getattr(exc, "status_code", None) == 429 or "Throttl" in type(exc).__name__
 
 
 class AISQLStrandsAgent:
@@ -38,11 +281,15 @@ class AISQLStrandsAgent:
     and provides a conversational interface using Strands orchestration.
     """
 
+    TOOL_SELECTION_CACHE_MAX_ENTRIES = 512
+
     def __init__(
         self,
-        snowflake_service: SnowflakeService,
+        snowflake_service: "SnowflakeService",
         agent_name: str = "AI SQL Agent",
         agent_description: str = "Specialized in Snowflake Cortex AI SQL operations",
+        initial_concurrency: int = 8,
+        max_rps: float | None = None,
     ):
         """Initialize Strands-integrated AI SQL agent.
 
@@ -50,59 +297,106 @@ class AISQLStrandsAgent:
             snowflake_service: Snowflake service instance
             agent_name: Name for the agent
             agent_description: Description of agent capabilities
+            initial_concurrency: Starting limit on concurrent agent/tool calls;
+                adapted to throttling by AdaptiveLimiter
+            max_rps: Optional cap on agent/tool calls started per second
         """
         if not STRANDS_AVAILABLE:
             raise ImportError(
                 "Strands Agents not installed. Install with: pip install multi-agent-orchestrator"
             )
 
+        from ..services.modular_ai_sql_service import ModularAISQLService
+        from .tools import AISQLToolkit
+
         self.sf_service = snowflake_service
-        self.ai_sql_service = ModularAISQLService(snowflake_service)
-        self.toolkit = AISQLToolkit(self.ai_sql_service)
+        # Agents on the same Snowflake service share one AI SQL service and
+        # toolkit. Keying by id() is safe: both hold the Snowflake service, so
+        # it outlives their cache entries.
+        key = id(snowflake_service)
+        toolkit = _TOOLKIT_CACHE.get(key)
+        if toolkit is None:
+            toolkit = AISQLToolkit(ModularAISQLService(snowflake_service))
+            _TOOLKIT_CACHE[key] = toolkit
+        self.ai_sql_service = toolkit.service
+        self.toolkit = toolkit
+        # Tool snapshot, name -> tool lookup and the tool list for the parse
+        # prompt; the toolkit registers its tools only when it is built
+        self._tools_tuple = tuple(self.toolkit.get_all_tools())
+        self._tool_index = {tool.name: tool for tool in self._tools_tuple}
+        self._tool_names_str = ", ".join(self._tool_index)
+        self._tool_call_schema_json = json_dumps(_tool_call_schema(list(self._tool_index)))
+        # Parsed tool selections keyed by a digest of (response_text, context)
+        self._tool_selection_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        # Caps concurrent Bedrock and warehouse calls, e.g. from process_request_batch
+        self._limiter = AdaptiveLimiter(initial_concurrency=initial_concurrency, max_rps=max_rps)
 
         # Create Strands agent with AI SQL tools
         self.agent = self._create_strands_agent(agent_name, agent_description)
 
-    def _create_strands_agent(self, name: str, description: str) -> Agent:
+    def _create_strands_agent(self, name: str, description: str) -> "Agent":
         """Create a Strands Agent with AI SQL tools registered.
 
         In Strands, tools are typically registered through the agent configuration
         or by extending the agent class with custom tool methods.
         """
+        from multi_agent_orchestrator.agents import BedrockLLMAgent
+
         # Build comprehensive tool description for the agent
         tools_description = self._build_tools_description()
 
+        # Without a toolUse block, the model is asked for a schema-conforming JSON
+        # selection, which _parse_tool_selection reads without a second LLM call
+        output_instructions = (
+            "If you do not call a tool, reply with only a JSON object matching this schema:\n"
+            f"{self._tool_call_schema_json}"
+        )
+
         # Create Bedrock LLM Agent (or custom agent)
         agent = BedrockLLMAgent({
             "name": name,
-            "description": f"{description}\n\nAvailable Tools:\n{tools_description}",
+            "description": (
+                f"{description}\n\nAvailable Tools:\n{tools_description}\n\n{output_instructions}"
+            ),
             "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",  # or your preferred model
             "streaming": False,
             "inference_config": {
                 "maxTokens": 2000,
                 "temperature": 0.7,
-            }
+            },
+            # Native tool use: the model returns a structured toolUse block, which
+            # _capture_tool_use records so no second LLM call is needed to parse it
+            "tool_config": {
+                "tool": [
+                    {
+                        "toolSpec": {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "inputSchema": {"json": _tool_input_schema(tool.parameters)},
+                        }
+                    }
+                    for tool in self._tools_tuple
+                ],
+                "toolMaxRecursions": 1,
+                "useToolHandler": self._capture_tool_use,
+            },
         })
 
         return agent
 
     def _build_tools_description(self) -> str:
         """Build formatted description of all AI SQL tools for the agent."""
-        tools_by_category = {}
-        for tool in self.toolkit.get_all_tools():
-            if tool.category not in tools_by_category:
-                tools_by_category[tool.category] = []
-            tools_by_category[tool.category].append(tool)
-
-        description_parts = []
-        for category, tools in tools_by_category.items():
-            description_parts.append(f"\n{category.value.upper()}:")
-            for tool in tools:
-                description_parts.append(f"  • {tool.name}: {tool.description}")
-                if tool.examples:
-                    description_parts.append(f"    Examples: {tool.examples[0]}")
-
-        return "\n".join(description_parts)
+        return _format_tools_description(
+            tuple(
+                (
+                    tool.category.value,
+                    tool.name,
+                    tool.description,
+                    tool.examples[0] if tool.examples else None,
+                )
+                for tool in self._tools_tuple
+            )
+        )
 
     async def process_request(
         self,
@@ -123,35 +417,98 @@ class AISQLStrandsAgent:
             Dictionary with response and metadata
         """
         # In Strands, the agent processes the request and returns a response
-        response = await self.agent.process_request(
-            user_input,
-            user_id,
-            session_id,
-            additional_params or {}
-        )
-
-        # Parse the agent's response to extract tool usage and execute
-        result = await self._execute_tool_from_response(response, additional_params)
+        token = _captured_tool_uses.set([])
+        try:
+            async with self._limiter:
+                response = await self.agent.process_request(
+                    user_input,
+                    user_id,
+                    session_id,
+                    additional_params or {}
+                )
+            tool_uses = _captured_tool_uses.get()
+        finally:
+            _captured_tool_uses.reset(token)
+
+        # Execute the tool the agent selected
+        result = await self._execute_tool_from_response(response, additional_params, tool_uses)
 
         return result
 
+    async def _capture_tool_use(self, response: Any, conversation: list[Any]) -> None:
+        """Record toolUse blocks from the model instead of running them in the agent.
+
+        The tool is executed by _execute_tool_from_response once the agent returns.
+        """
+        captured = _captured_tool_uses.get()
+        if captured is None:
+            return
+        for block in getattr(response, "content", None) or []:
+            if isinstance(block, dict) and block.get("toolUse"):
+                captured.append(block["toolUse"])
+
+    async def process_request_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 8,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Process many requests concurrently.
+
+        Args:
+            requests: Keyword arguments for process_request (user_input, user_id,
+                session_id and optional additional_params), one dict per request
+            max_concurrency: Maximum number of requests in flight at once
+            on_progress: Optional callback receiving (completed, total) after each request
+
+        Returns:
+            Results in input order; a failed request yields its exception instead
+            of cancelling the rest of the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(requests)
+        completed = 0
+
+        async def _process_one(request: dict[str, Any]) -> dict[str, Any]:
+            nonlocal completed
+            try:
+                async with semaphore:
+                    return await self.process_request(**request)
+            finally:
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, total)
+
+        return await asyncio.gather(
+            *(_process_one(request) for request in requests),
+            return_exceptions=True,
+        )
+
     async def _execute_tool_from_response(
         self,
-        agent_response: AgentResponse,
+        agent_response: "AgentResponse",
         context: dict[str, Any] | None,
+        tool_uses: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Execute the appropriate AI SQL tool based on agent's response.
 
-        The agent's response should indicate which tool to use and with what parameters.
-        This method parses that and executes the actual AI SQL operation.
+        A structured toolUse block from the model is used directly; otherwise the
+        agent's text response is parsed for the tool and its parameters.
         """
         # Extract tool selection from agent response
         # This is a simplified version - actual implementation depends on your prompt engineering
-        response_text = agent_response.output if hasattr(agent_response, 'output') else str(agent_response)
-
-        # Parse tool name and parameters from response
-        # In production, you'd use structured output or function calling
-        tool_info = await self._parse_tool_selection(response_text, context)
+        response_text = getattr(agent_response, "output", None)
+        if response_text is None:
+            response_text = str(agent_response)
+
+        if tool_uses:
+            tool_info = {
+                "tool_name": tool_uses[0].get("name"),
+                "parameters": tool_uses[0].get("input") or {},
+            }
+        else:
+            # Fall back to parsing the tool name and parameters from the text
+            tool_info = await self._parse_tool_selection(response_text, context)
 
         if tool_info.get("error"):
             return {
@@ -160,7 +517,7 @@ class AISQLStrandsAgent:
             }
 
         # Execute the selected tool
-        tool = self.toolkit.get_tool(tool_info["tool_name"])
+        tool = self._tool_index.get(tool_info["tool_name"])
         if not tool:
             return {
                 "error": f"Tool '{tool_info['tool_name']}' not found",
@@ -168,14 +525,15 @@ class AISQLStrandsAgent:
             }
 
         try:
-            results = await tool.function(**tool_info["parameters"])
+            async with self._limiter:
+                results = await tool.function(**tool_info["parameters"])
 
             return {
                 "tool_used": tool_info["tool_name"],
                 "parameters": tool_info["parameters"],
                 "results": results,
                 "agent_response": response_text,
-                "metadata": agent_response.metadata if hasattr(agent_response, 'metadata') else {},
+                "metadata": getattr(agent_response, "metadata", {}),
             }
         except Exception as e:
             return {
@@ -192,19 +550,35 @@ class AISQLStrandsAgent:
     ) -> dict[str, Any]:
         """Parse tool selection from agent response.
 
-        In production, you'd use structured output or function calling.
-        This is a simplified version for demonstration.
+        A JSON tool selection already present in the response (as the agent is
+        instructed to emit) is used as-is; only free-form text falls back to an
+        LLM call that extracts the tool and parameters.
         """
-        # Use AI to parse the response and extract tool + parameters
-        import json
+        if len(response_text) > _OFFLOAD_JSON_PARSE_CHARS:
+            embedded = await asyncio.to_thread(_find_embedded_tool_selection, response_text)
+        else:
+            embedded = _find_embedded_tool_selection(response_text)
+        if embedded is not None:
+            return embedded
+
+        context_json = json_dumps(context or {}, default=str, sort_keys=True)
+        cache_key = hashlib.blake2b(
+            f"{response_text}\0{context_json}".encode(),
+            digest_size=16,
+        ).digest()
+        cached = self._tool_selection_cache.get(cache_key)
+        if cached is not None:
+            self._tool_selection_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
 
+        # Use AI to parse the response and extract tool + parameters
         parse_prompt = f"""Parse this agent response and extract the tool name and parameters.
 
 Agent Response: {response_text}
 
-Context: {json.dumps(context or {}, indent=2)}
+Context: {context_json}
 
-Available Tools: {', '.join(self.toolkit.get_tool_names())}
+Available Tools: {self._tool_names_str}
 
 Respond with JSON:
 {{
@@ -222,10 +596,22 @@ If unclear, respond with: {{"error": "description"}}
         )
 
         try:
-            return json.loads(parsed)
-        except json.JSONDecodeError:
+            # Large payloads (inlined data in parameters) are decoded off the event loop
+            if len(parsed) > _OFFLOAD_JSON_PARSE_CHARS:
+                tool_info = await asyncio.to_thread(json_loads, parsed)
+            else:
+                tool_info = json_loads(parsed)
+        except ValueError:
             return {"error": "Failed to parse tool selection"}
 
+        # Only successful selections are reused; errors may be transient
+        if isinstance(tool_info, dict) and not tool_info.get("error"):
+            cache = self._tool_selection_cache
+            cache[cache_key] = copy.deepcopy(tool_info)
+            while len(cache) > self.TOOL_SELECTION_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return tool_info
+
 
 class AISQLOrchestrator:
     """Multi-agent orchestrator for AI SQL operations.
@@ -234,76 +620,55 @@ class AISQLOrchestrator:
     specialized AI SQL agents for different tasks.
     """
 
-    def __init__(self, snowflake_service: SnowflakeService):
+    def __init__(self, snowflake_service: "SnowflakeService"):
         """Initialize orchestrator with multiple AI SQL agents."""
         if not STRANDS_AVAILABLE:
             raise ImportError(
                 "Strands Agents not installed. Install with: pip install multi-agent-orchestrator"
             )
 
+        from multi_agent_orchestrator.orchestrator import MultiAgentOrchestrator
+
         self.sf_service = snowflake_service
         self.orchestrator = MultiAgentOrchestrator()
 
-        # Add specialized agents
-        self._add_agents()
-
-    def _add_agents(self):
-        """Add specialized AI SQL agents to the orchestrator."""
-        # Text Analysis Agent
-        analysis_agent = BedrockLLMAgent({
-            "name": "Text Analysis Agent",
-            "description": """Specializes in text analysis operations:
-            - Sentiment analysis
-            - Classification
-            - Filtering
-            - Similarity detection
-
-            Use this agent for understanding and categorizing text data.""",
-            "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
-        })
-        self.orchestrator.add_agent(analysis_agent)
-
-        # Data Extraction Agent
-        extraction_agent = BedrockLLMAgent({
-            "name": "Data Extraction Agent",
-            "description": """Specializes in extracting information:
-            - Extract specific data from text
-            - Parse documents (PDF, images)
-            - Transcribe audio/video
-            - Structure unstructured data
-
-            Use this agent for pulling information from various sources.""",
-            "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
-        })
-        self.orchestrator.add_agent(extraction_agent)
-
-        # Text Transformation Agent
-        transformation_agent = BedrockLLMAgent({
-            "name": "Text Transformation Agent",
-            "description": """Specializes in transforming text:
-            - Translation
-            - Summarization
-            - PII redaction
-            - Text generation
+        # Specialized agents are created on first use; see ready()
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+
+    async def ready(self) -> None:
+        """Create and register the specialized agents once."""
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            await self._add_agents_async()
+            self._ready = True
+
+    async def _add_agents_async(self):
+        """Add specialized AI SQL agents to the orchestrator.
+
+        Agent constructors are synchronous and may do client/auth setup, so
+        they run concurrently in worker threads; agents are registered in
+        _SPECIALIZED_AGENT_CONFIGS order.
+        """
+        from multi_agent_orchestrator.agents import BedrockLLMAgent
 
-            Use this agent for modifying or converting text.""",
-            "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
-        })
-        self.orchestrator.add_agent(transformation_agent)
+        # One bedrock-runtime client (and connection pool) shared by all agents
+        # instead of one client, TLS session and pool per agent
+        bedrock_client = await asyncio.to_thread(_create_bedrock_client)
 
-        # Semantic Operations Agent
-        semantic_agent = BedrockLLMAgent({
-            "name": "Semantic Operations Agent",
-            "description": """Specializes in semantic operations:
-            - Generate embeddings
-            - Calculate similarity
-            - Semantic joins
-            - Vector operations
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    asyncio.to_thread(BedrockLLMAgent, {**config, "client": bedrock_client})
+                )
+                for config in _SPECIALIZED_AGENT_CONFIGS
+            ]
 
-            Use this agent for semantic search and similarity tasks.""",
-            "model_id": "anthropic.claude-3-sonnet-20240229-v1:0",
-        })
-        self.orchestrator.add_agent(semantic_agent)
+        for task in tasks:
+            self.orchestrator.add_agent(task.result())
 
     async def route_request(
         self,
@@ -317,6 +682,7 @@ class AISQLOrchestrator:
         Strands orchestrator automatically selects the best agent based on
         the user input and agent descriptions.
         """
+        await self.ready()
         response = await self.orchestrator.route_request(
             user_input,
             user_id,
@@ -324,10 +690,12 @@ class AISQLOrchestrator:
             additional_params or {}
         )
 
+        metadata = getattr(response, "metadata", None)
+        output = getattr(response, "output", None)
         return {
-            "agent_name": response.metadata.get("agent_name") if hasattr(response, 'metadata') else None,
-            "response": response.output if hasattr(response, 'output') else str(response),
-            "metadata": response.metadata if hasattr(response, 'metadata') else {},
+            "agent_name": metadata.get("agent_name") if metadata is not None else None,
+            "response": output if output is not None else str(response),
+            "metadata": metadata if metadata is not None else {},
         }
 
 
@@ -337,7 +705,7 @@ class AISQLOrchestrator:
 
 
 def create_aisql_agent(
-    snowflake_service: SnowflakeService,
+    snowflake_service: "SnowflakeService",
     agent_name: str = "AI SQL Agent",
 ) -> AISQLStrandsAgent:
     """Create a Strands-integrated AI SQL agent.
@@ -354,7 +722,7 @@ def create_aisql_agent(
 
 
 def create_aisql_orchestrator(
-    snowflake_service: SnowflakeService,
+    snowflake_service: "SnowflakeService",
 ) -> AISQLOrchestrator:
     """Create a multi-agent orchestrator for AI SQL.
 
@@ -386,22 +754,16 @@ def register_aisql_tools_as_decorators(agent_class):
                 self.ai_sql = ModularAISQLService(sf_service)
                 super().__init__(config)
     """
-    from functools import wraps
-
     # This would typically use Strands' @tool decorator
     # For now, we'll show the pattern
 
     def tool(name: str, description: str):
         """Tool decorator (mimics Strands pattern)."""
         def decorator(func):
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                return await func(*args, **kwargs)
-
-            # Register tool metadata
-            wrapper._tool_name = name
-            wrapper._tool_description = description
-            return wrapper
+            # Register tool metadata on the function itself; no passthrough wrapper
+            func._tool_name = name
+            func._tool_description = description
+            return func
         return decorator
 
     # Add tool methods to the agent class
@@ -461,15 +823,27 @@ async def example_usage():
     print(f"Agent selected: {result['agent_name']}")
     print(f"Response: {result['response']}")
 
-    # Example 3: Streaming Response
-    agent = create_aisql_agent(sf_service)
-    response = await agent.agent.process_request(
-        "Summarize all customer feedback",
-        "user-123",
-        "session-456",
-        {"streaming": True}
-    )
-
-    if response.streaming:
-        async for chunk in response.output:
-            print(chunk, end="", flush=True)
+    # Example 3: Streaming Responses from several agents
+    # Requests run concurrently and each response is streamed as soon as its
+    # agent answers, so the first output waits on the fastest agent only
+    agents = [
+        create_aisql_agent(sf_service, agent_name)
+        for agent_name in ("Feedback Agent", "Reviews Agent")
+    ]
+    tasks = [
+        asyncio.create_task(
+            agent.agent.process_request(
+                "Summarize all customer feedback",
+                "user-123",
+                "session-456",
+                {"streaming": True}
+            )
+        )
+        for agent in agents
+    ]
+
+    for next_response in asyncio.as_completed(tasks):
+        response = await next_response
+        if response.streaming:
+            async for chunk in response.output:
+                print(chunk, end="", flush=True)
@@ -4,12 +4,49 @@ This module provides a clean, framework-agnostic tool interface that can be
 easily adapted to any agent framework (LangChain, LlamaIndex, Strands, etc.).
 """
 
-from dataclasses import dataclass
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Coroutine
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Coroutine
 
+import numpy as np
+
+from ..core.utils.json_codec import json_dumps
+from ..services.ai_sql_builders import select
 from ..services.modular_ai_sql_service import ModularAISQLService
 
+# tiktoken (optional, the "tokens" extra) counts tokens for OpenAI models without
+# a warehouse AI call
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # type: ignore[assignment]
+
+# Tools whose results are memoized: only calls that are a pure function of their
+# arguments. Tools that read a table can return different rows after it changes.
+_CACHED_TOOLS = frozenset({"ai_complete"})
+
+# Row-level tools whose calls on the same table, issued together, share one
+# run_ops_batch query: tool -> (column argument, result column, op arguments)
+_COALESCED_TOOLS = MappingProxyType({
+    "summarize": ("text_column", "summary", ()),
+    "ai_translate": ("text_column", "translated_text", ("source_lang", "target_lang")),
+    "ai_extract": ("content_column", "extracted_data", ("instruction",)),
+    "ai_redact": ("text_column", "redacted_text", ("pii_types",)),
+})
+
+# Prompt argument per tool whose paraphrases may reuse a cached result
+_SEMANTIC_CACHE_ARGS = MappingProxyType({"ai_complete": "prompt"})
+
 
 class ToolCategory(str, Enum):
     """Tool categories for organization."""
@@ -23,7 +60,10 @@ class ToolCategory(str, Enum):
     UTILITY = "utility"
 
 
-@dataclass
+_CATEGORY_VALUES: tuple[str, ...] = tuple(category.value for category in ToolCategory)
+
+
+@dataclass(slots=True, frozen=True)
 class ToolDefinition:
     """Definition of an AI SQL tool.
 
@@ -34,19 +74,829 @@ class ToolDefinition:
     name: str
     description: str
     category: ToolCategory
-    parameters: dict[str, Any]
+    parameters: Mapping[str, Any]
     function: Callable[..., Coroutine[Any, Any, Any]]
-    examples: list[str]
+    examples: Sequence[str]
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "category": self.category.value,
-            "parameters": self.parameters,
-            "examples": self.examples,
-        }
+        """Convert to dictionary format.
+
+        The metadata never changes after registration, so the dictionary is
+        built once and shared; callers must not modify it.
+        """
+        if self._dict is None:
+            # Frozen dataclass: the lazily built export is set past __setattr__
+            object.__setattr__(self, "_dict", {
+                "name": self.name,
+                "description": self.description,
+                "category": self.category.value,
+                "parameters": {name: dict(spec) for name, spec in self.parameters.items()},
+                "examples": list(self.examples),
+            })
+        return self._dict
+
+    def to_json(self) -> bytes:
+        """Return ``to_dict()`` serialized as JSON, encoded once and reused."""
+        if self._json is None:
+            object.__setattr__(self, "_json", json_dumps(self.to_dict()).encode())
+        return self._json
+
+
+@dataclass(slots=True, frozen=True)
+class _ToolSpec:
+    """Static metadata for one toolkit tool; ``service_attr`` names the service method."""
+
+    name: str
+    description: str
+    category: ToolCategory
+    parameters: Mapping[str, Mapping[str, Any]]
+    service_attr: str
+    examples: tuple[str, ...]
+
+
+def _freeze_parameters(parameters: dict[str, Mapping[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Return a read-only view of a parameter schema, shared by every toolkit."""
+    return MappingProxyType({
+        name: spec if isinstance(spec, MappingProxyType) else MappingProxyType(spec)
+        for name, spec in parameters.items()
+    })
+
+
+# Parameter definitions repeated across tools, shared as single read-only objects
+_P_TABLE = MappingProxyType({"type": "string", "description": "Table name to query", "required": True})
+_P_GROUP_BY = MappingProxyType({"type": "string", "description": "Optional column to group by", "required": False})
+
+
+# Tool catalog, built once at import; AISQLToolkit binds each spec to its service
+_TOOL_SPECS: tuple[_ToolSpec, ...] = (
+    # Text Generation Tools
+    _ToolSpec(
+        name="ai_complete",
+        description="Generate text completions using LLMs. Use for creative writing, question answering, or any text generation task.",
+        category=ToolCategory.TEXT_GENERATION,
+        parameters=_freeze_parameters({
+            "model": {
+                "type": "string",
+                "description": "LLM model name (e.g., 'claude-3-7-sonnet', 'gpt-4')",
+                "required": True,
+            },
+            "prompt": {
+                "type": "string",
+                "description": "The prompt/question to send to the model",
+                "required": True,
+            },
+            "response_format": {
+                "type": "object",
+                "description": "Optional JSON schema for structured output",
+                "required": False,
+            },
+        }),
+        service_attr="ai_complete",
+        examples=(
+            "Generate a product description for a laptop",
+            "Answer: What is the capital of France?",
+            "Summarize this text in 3 sentences",
+        ),
+    ),
+
+    # Text Analysis Tools
+    _ToolSpec(
+        name="ai_classify",
+        description="Classify text into predefined categories. Use for content categorization, tagging, or routing.",
+        category=ToolCategory.TEXT_ANALYSIS,
+        parameters=_freeze_parameters({
+            "content_column": {
+                "type": "string",
+                "description": "Column containing text to classify",
+                "required": True,
+            },
+            "categories": {
+                "type": "array",
+                "description": "List of category labels",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "prompt_prefix": {
+                "type": "string",
+                "description": "Optional prefix to add context",
+                "required": False,
+            },
+        }),
+        service_attr="ai_classify",
+        examples=(
+            "Classify customer feedback into: Positive, Negative, Neutral",
+            "Categorize products into: Electronics, Clothing, Food",
+            "Tag support tickets as: Bug, Feature Request, Question",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_sentiment",
+        description="Analyze sentiment of text. Returns overall sentiment and category-specific scores.",
+        category=ToolCategory.TEXT_ANALYSIS,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text to analyze",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+        }),
+        service_attr="ai_sentiment",
+        examples=(
+            "Analyze sentiment of customer reviews",
+            "Detect emotional tone in social media posts",
+            "Measure satisfaction in survey responses",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_filter",
+        description="Filter data using natural language conditions. Use for semantic search or complex filtering.",
+        category=ToolCategory.TEXT_ANALYSIS,
+        parameters=_freeze_parameters({
+            "filter_condition": {
+                "type": "string",
+                "description": "Natural language filter condition",
+                "required": True,
+            },
+            "table_name": {
+                "type": "string",
+                "description": "Table name to filter",
+                "required": True,
+            },
+            "columns": {
+                "type": "array",
+                "description": "Columns to consider in filtering",
+                "required": True,
+            },
+        }),
+        service_attr="ai_filter",
+        examples=(
+            "Find products that mention sustainability",
+            "Filter reviews that discuss shipping issues",
+            "Find articles about artificial intelligence",
+        ),
+    ),
+
+    # Text Transformation Tools
+    _ToolSpec(
+        name="ai_translate",
+        description="Translate text between languages. Supports major world languages.",
+        category=ToolCategory.TEXT_TRANSFORMATION,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text to translate",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "source_lang": {
+                "type": "string",
+                "description": "Source language code (e.g., 'en', 'es', 'fr')",
+                "required": True,
+            },
+            "target_lang": {
+                "type": "string",
+                "description": "Target language code",
+                "required": True,
+            },
+        }),
+        service_attr="ai_translate",
+        examples=(
+            "Translate product descriptions from English to Spanish",
+            "Convert customer feedback from French to English",
+            "Localize content for international markets",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_redact",
+        description="Remove personally identifiable information (PII) from text. Use for privacy compliance.",
+        category=ToolCategory.TEXT_TRANSFORMATION,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text to redact",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "pii_types": {
+                "type": "array",
+                "description": "Types of PII to redact (EMAIL, PHONE_NUMBER, etc.)",
+                "required": False,
+            },
+        }),
+        service_attr="ai_redact",
+        examples=(
+            "Remove email addresses from customer comments",
+            "Redact phone numbers and addresses from support tickets",
+            "Anonymize user data for analysis",
+        ),
+    ),
+
+    _ToolSpec(
+        name="summarize",
+        description="Generate concise summaries of text. Use for content condensation.",
+        category=ToolCategory.TEXT_TRANSFORMATION,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text to summarize",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+        }),
+        service_attr="summarize",
+        examples=(
+            "Summarize long articles",
+            "Create executive summaries of reports",
+            "Condense customer feedback",
+        ),
+    ),
+
+    # Data Extraction Tools
+    _ToolSpec(
+        name="ai_extract",
+        description="Extract specific information from text using natural language instructions.",
+        category=ToolCategory.DATA_EXTRACTION,
+        parameters=_freeze_parameters({
+            "content_column": {
+                "type": "string",
+                "description": "Column containing text to extract from",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "instruction": {
+                "type": "string",
+                "description": "What to extract (e.g., 'Extract all email addresses')",
+                "required": True,
+            },
+        }),
+        service_attr="ai_extract",
+        examples=(
+            "Extract email addresses from text",
+            "Pull out product names and prices",
+            "Find dates and locations mentioned",
+        ),
+    ),
+
+    _ToolSpec(
+        name="extract_structured_data",
+        description="Extract structured data from unstructured text using a schema. Returns JSON.",
+        category=ToolCategory.DATA_EXTRACTION,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing unstructured text",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "extraction_prompt": {
+                "type": "string",
+                "description": "Instructions for extraction",
+                "required": True,
+            },
+            "schema": {
+                "type": "object",
+                "description": "JSON schema defining output structure",
+                "required": True,
+            },
+        }),
+        service_attr="extract_structured_data",
+        examples=(
+            "Extract product info (name, price, category) from listings",
+            "Parse invoice data into structured format",
+            "Convert resumes into standardized JSON",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_parse_document",
+        description="Parse documents (PDF, images) to extract text using OCR or layout analysis.",
+        category=ToolCategory.DATA_EXTRACTION,
+        parameters=_freeze_parameters({
+            "file_path_column": {
+                "type": "string",
+                "description": "Column containing file paths",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "mode": {
+                "type": "string",
+                "description": "Parsing mode: 'layout' or 'ocr'",
+                "required": False,
+            },
+        }),
+        service_attr="ai_parse_document",
+        examples=(
+            "Extract text from scanned documents",
+            "Parse PDF invoices",
+            "Convert images to text",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_transcribe",
+        description="Transcribe audio/video files to text with optional timestamps and speaker labels.",
+        category=ToolCategory.DATA_EXTRACTION,
+        parameters=_freeze_parameters({
+            "audio_file_column": {
+                "type": "string",
+                "description": "Column containing audio/video file paths",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+        }),
+        service_attr="ai_transcribe",
+        examples=(
+            "Transcribe customer service calls",
+            "Convert meeting recordings to text",
+            "Generate subtitles for videos",
+        ),
+    ),
+
+    # Aggregation Tools
+    _ToolSpec(
+        name="ai_aggregate",
+        description="Aggregate text data using natural language instructions. Use for insights across multiple rows.",
+        category=ToolCategory.AGGREGATION,
+        parameters=_freeze_parameters({
+            "column_to_aggregate": {
+                "type": "string",
+                "description": "Column to aggregate",
+                "required": True,
+            },
+            "aggregation_prompt": {
+                "type": "string",
+                "description": "What insights to extract",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "group_by": _P_GROUP_BY,
+        }),
+        service_attr="ai_aggregate",
+        examples=(
+            "Identify top 3 common themes in feedback",
+            "Find recurring issues in support tickets",
+            "Summarize key points across all reviews",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_summarize_agg",
+        description="Aggregate and summarize multiple rows of text into a single summary.",
+        category=ToolCategory.AGGREGATION,
+        parameters=_freeze_parameters({
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text to aggregate",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "group_by": _P_GROUP_BY,
+        }),
+        service_attr="ai_summarize_agg",
+        examples=(
+            "Summarize all customer feedback for a product",
+            "Create overview of support tickets by category",
+            "Aggregate news articles by topic",
+        ),
+    ),
+
+    # Semantic Operations
+    _ToolSpec(
+        name="ai_embed",
+        description="Generate embedding vectors for text. Use for similarity search and clustering.",
+        category=ToolCategory.SEMANTIC_OPERATIONS,
+        parameters=_freeze_parameters({
+            "content_column": {
+                "type": "string",
+                "description": "Column containing text to embed",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+            "model": {
+                "type": "string",
+                "description": "Embedding model name",
+                "required": False,
+            },
+        }),
+        service_attr="ai_embed",
+        examples=(
+            "Create embeddings for semantic search",
+            "Generate vectors for clustering",
+            "Build similarity index",
+        ),
+    ),
+
+    _ToolSpec(
+        name="ai_similarity",
+        description="Calculate semantic similarity between two text columns. Returns similarity score.",
+        category=ToolCategory.SEMANTIC_OPERATIONS,
+        parameters=_freeze_parameters({
+            "table_name": _P_TABLE,
+            "column1": {
+                "type": "string",
+                "description": "First text column",
+                "required": True,
+            },
+            "column2": {
+                "type": "string",
+                "description": "Second text column",
+                "required": True,
+            },
+        }),
+        service_attr="ai_similarity",
+        examples=(
+            "Find similar product descriptions",
+            "Match questions to answers",
+            "Detect duplicate content",
+        ),
+    ),
+
+    _ToolSpec(
+        name="semantic_join",
+        description="Join tables using semantic understanding rather than exact matches.",
+        category=ToolCategory.SEMANTIC_OPERATIONS,
+        parameters=_freeze_parameters({
+            "left_table": {
+                "type": "string",
+                "description": "Left table name",
+                "required": True,
+            },
+            "right_table": {
+                "type": "string",
+                "description": "Right table name",
+                "required": True,
+            },
+            "left_column": {
+                "type": "string",
+                "description": "Column from left table",
+                "required": True,
+            },
+            "right_column": {
+                "type": "string",
+                "description": "Column from right table",
+                "required": True,
+            },
+            "join_condition": {
+                "type": "string",
+                "description": "Natural language join condition",
+                "required": True,
+            },
+        }),
+        service_attr="semantic_join",
+        examples=(
+            "Match customer issues to solution articles",
+            "Link products to relevant reviews",
+            "Connect questions to knowledge base entries",
+        ),
+    ),
+
+    # Utility Tools
+    _ToolSpec(
+        name="ai_count_tokens",
+        description="Count tokens in text for a specific model. Use to prevent exceeding model limits.",
+        category=ToolCategory.UTILITY,
+        parameters=_freeze_parameters({
+            "model": {
+                "type": "string",
+                "description": "Model name to count tokens for",
+                "required": True,
+            },
+            "text_column": {
+                "type": "string",
+                "description": "Column containing text",
+                "required": True,
+            },
+            "table_name": _P_TABLE,
+        }),
+        service_attr="ai_count_tokens",
+        examples=(
+            "Check if prompts fit within model limits",
+            "Calculate token usage for cost estimation",
+            "Validate input size before processing",
+        ),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _tiktoken_encoding(model: str) -> Any | None:
+    """Return the tiktoken encoding for ``model``, or None if it is unavailable.
+
+    The first lookup of an encoding may download its BPE file; call it off the
+    event loop.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        # Cortex names OpenAI models "openai-<model>"
+        return tiktoken.encoding_for_model(model.removeprefix("openai-"))
+    except Exception:
+        # Unknown model, or the BPE file could not be downloaded (e.g. offline):
+        # cached as unavailable so later calls go straight to AI_COUNT_TOKENS
+        return None
+
+
+class ToolResultCache:
+    """Exact-match LRU + TTL cache for tool results.
+
+    Keys are SHA-256 digests of the tool name and its canonical JSON arguments.
+    Concurrent calls with the same key share one in-flight call. Every caller
+    gets its own copy of the result.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def make_key(name: str, arguments: Mapping[str, Any]) -> str:
+        """Return the cache key for a call to tool ``name`` with bound ``arguments``."""
+        payload = json_dumps({"name": name, "arguments": dict(arguments)}, default=str, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> Any:
+        """Return the cached result for ``key`` or await ``call()`` and store it."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._store, key))
+        else:
+            self.hits += 1
+        # Shielded so one cancelled caller does not cancel the shared call
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _store(self, key: str, task: asyncio.Task) -> None:
+        """Record a finished call; failures are not cached."""
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic(), task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of cached results."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class SemanticCache:
+    """Similarity-matched cache of tool results, behind ToolResultCache.
+
+    Opt-in: a paraphrase above ``threshold`` gets the earlier prompt's answer,
+    which is only acceptable for workloads that tolerate that. Prompts are
+    embedded and kept L2-normalized in a float32 matrix, so a lookup is one
+    matrix-vector product on the event loop; keep ``max_entries`` small. Only
+    results from calls whose other arguments match (the same ``scope``) and
+    that are younger than ``ttl_seconds`` are reused. Once ``max_entries`` is
+    reached the oldest entries are overwritten.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[list[float]]],
+        threshold: float = 0.98,
+        max_entries: int = 5_000,
+        ttl_seconds: float = 3600.0,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._embed = embed
+        self._vectors: np.ndarray | None = None
+        self._entry_scopes = np.empty(0, dtype=np.int64)
+        self._stored_at = np.empty(0, dtype=np.float64)
+        self._results: list[Any] = []
+        self._scope_ids: dict[str, int] = {}
+        self._size = 0
+        self._next = 0
+
+    async def get_or_call(
+        self,
+        scope: str,
+        text: str,
+        call: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> Any:
+        """Return the result of a similar earlier call in ``scope`` or await ``call()``."""
+        try:
+            query = np.asarray(await self._embed(text), dtype=np.float32)
+        except Exception:
+            # The cache is an optimization; an embedding failure must not fail the call
+            return await call()
+        norm = float(np.linalg.norm(query))
+        if not norm:
+            return await call()
+        query /= norm
+
+        index = self._best_match(scope, query)
+        if index is not None:
+            self.hits += 1
+            return self._results[index]
+
+        self.misses += 1
+        result = await call()
+        self._add(scope, query, result)
+        return result
+
+    def _best_match(self, scope: str, query: np.ndarray) -> int | None:
+        """Index of the most similar entry in ``scope`` at or above the threshold."""
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+            return None
+        size = self._size
+        similarities = self._vectors[:size] @ query
+        similarities[self._entry_scopes[:size] != scope_id] = -np.inf
+        similarities[time.monotonic() - self._stored_at[:size] >= self.ttl_seconds] = -np.inf
+        index = int(np.argmax(similarities))
+        return index if similarities[index] >= self.threshold else None
+
+    def _add(self, scope: str, vector: np.ndarray, result: Any) -> None:
+        """Store ``result`` under ``vector``, growing or overwriting the oldest slot."""
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = np.empty((0, vector.shape[0]), dtype=np.float32)
+            self._entry_scopes = np.empty(0, dtype=np.int64)
+            self._stored_at = np.empty(0, dtype=np.float64)
+            self._results = []
+            self._size = self._next = 0
+
+        if self._size < self.max_entries:
+            index = self._size
+            if index == len(self._vectors):
+                # Capacity doubles as needed instead of preallocating max_entries rows
+                capacity = min(self.max_entries, max(64, 2 * index))
+                vectors = np.empty((capacity, vector.shape[0]), dtype=np.float32)
+                vectors[:index] = self._vectors
+                scopes = np.empty(capacity, dtype=np.int64)
+                scopes[:index] = self._entry_scopes
+                stored_at = np.empty(capacity, dtype=np.float64)
+                stored_at[:index] = self._stored_at
+                self._vectors, self._entry_scopes, self._stored_at = vectors, scopes, stored_at
+            self._results.append(result)
+            self._size += 1
+        else:
+            index = self._next
+            self._next = (index + 1) % self.max_entries
+            self._results[index] = result
+
+        self._vectors[index] = vector
+        self._entry_scopes[index] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+        self._stored_at[index] = time.monotonic()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._vectors = None
+        self._entry_scopes = np.empty(0, dtype=np.int64)
+        self._stored_at = np.empty(0, dtype=np.float64)
+        self._results = []
+        self._scope_ids.clear()
+        self._size = self._next = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of cached results."""
+        return {"hits": self.hits, "misses": self.misses, "size": self._size}
+
+
+class RowOpBatcher:
+    """Merges row-level AI calls on one table into a single run_ops_batch query.
+
+    Calls submitted in the same event loop iteration (e.g. from invoke_many or
+    concurrent agent requests) are flushed together; each caller gets rows
+    shaped like its own single-op query. A lone call, or a batch whose query
+    fails, runs through its original single-op call instead.
+    """
+
+    def __init__(self, service: ModularAISQLService):
+        self._service = service
+        self._pending: dict[str, list[tuple[dict[str, Any], str, Callable[[], Coroutine], asyncio.Future]]] = {}
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        table_name: str,
+        op: dict[str, Any],
+        result_column: str,
+        single_call: Callable[[], Coroutine[Any, Any, list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        """Queue ``op`` for ``table_name`` and wait for its rows."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.get(table_name)
+        if pending is None:
+            pending = self._pending[table_name] = []
+            loop.call_soon(self._start_flush, table_name)
+        pending.append((op, result_column, single_call, future))
+        return await future
+
+    def _start_flush(self, table_name: str) -> None:
+        task = asyncio.ensure_future(self._flush(table_name))
+        # The loop keeps only weak references to tasks
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, table_name: str) -> None:
+        calls = self._pending.pop(table_name)
+        if len(calls) > 1:
+            # Alias of each op's result column in the batch query, by call index
+            aliases = [f"op_{index}" for index in range(len(calls))]
+            ops = [{**op, "alias": alias} for alias, (op, _, _, _) in zip(aliases, calls)]
+            try:
+                rows = await self._service.run_ops_batch(table_name, ops)
+            except Exception:
+                # One bad op must not fail the others; rerun them one by one
+                pass
+            else:
+                for alias, (op, result_column, _, future) in zip(aliases, calls):
+                    if not future.done():
+                        future.set_result([_project_row(row, op["column"], alias, result_column) for row in rows])
+                return
+
+        await asyncio.gather(*(self._run_single(call, future) for _, _, call, future in calls))
+
+    @staticmethod
+    async def _run_single(call: Callable[[], Coroutine], future: asyncio.Future) -> None:
+        try:
+            result = await call()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+def _project_row(row: dict[str, Any], column: str, alias: str, result_column: str) -> dict[str, Any]:
+    """Select one op's columns from a batched row, named as its single-op query names them.
+
+    ``alias`` is the op's result column in the batch query; it is renamed to
+    ``result_column``, upper-cased if the warehouse upper-cased the alias.
+    """
+    keys = {key.upper(): key for key in row}
+    column_key = keys.get(column.upper(), column)
+    alias_key = keys.get(alias.upper(), alias)
+    result_key = result_column.upper() if alias_key != alias and alias_key == alias.upper() else result_column
+    return {column_key: row.get(column_key), result_key: row.get(alias_key)}
+
+
+def _wrap_cached(
+    function: Callable[..., Coroutine[Any, Any, Any]],
+    name: str,
+    cache: ToolResultCache,
+    semantic_cache: SemanticCache | None = None,
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Memoize ``function`` in ``cache``.
+
+    Tools listed in ``_SEMANTIC_CACHE_ARGS`` also consult ``semantic_cache`` on an
+    exact-match miss; a semantic hit is stored in ``cache`` as well.
+    """
+    prompt_arg = _SEMANTIC_CACHE_ARGS.get(name) if semantic_cache is not None else None
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    async def cached(*args: Any, **kwargs: Any) -> Any:
+        # Bound with defaults, so positional, keyword and omitted-default spellings share a key
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        key = cache.make_key(name, arguments)
+        prompt = arguments.get(prompt_arg) if prompt_arg else None
+        if not isinstance(prompt, str):
+            return await cache.get_or_call(key, lambda: function(*args, **kwargs))
+
+        scope = cache.make_key(name, {arg: value for arg, value in arguments.items() if arg != prompt_arg})
+        return await cache.get_or_call(
+            key,
+            lambda: semantic_cache.get_or_call(scope, prompt, lambda: function(*args, **kwargs)),
+        )
+
+    return cached
 
 
 class AISQLToolkit:
@@ -64,539 +914,97 @@ class AISQLToolkit:
             agent.register_tool(tool.name, tool.function, tool.description)
     """
 
-    def __init__(self, ai_sql_service: ModularAISQLService):
-        """Initialize toolkit with AI SQL service."""
+    def __init__(self, ai_sql_service: ModularAISQLService, semantic_cache: SemanticCache | None = None):
+        """Initialize toolkit with AI SQL service.
+
+        Args:
+            ai_sql_service: Service the tools call
+            semantic_cache: Opt-in cache that answers paraphrased ai_complete
+                prompts with earlier results; off by default
+        """
         self.service = ai_sql_service
         self._tools: dict[str, ToolDefinition] = {}
+        self._by_category: dict[ToolCategory, list[ToolDefinition]] = {category: [] for category in ToolCategory}
+        self._dict_cache: dict[str, Any] | None = None
+        self._json_cache: bytes | None = None
+        # Identical ai_complete calls reuse earlier results instead of another LLM call;
+        # this is the only completion cache, ModularAISQLService does not cache
+        self._cache = ToolResultCache()
+        self._semantic_cache = semantic_cache
+        self._batcher = RowOpBatcher(ai_sql_service)
         self._register_all_tools()
 
     def _register_all_tools(self):
         """Register all available tools."""
-        # Text Generation Tools
-        self._register_tool(
-            name="ai_complete",
-            description="Generate text completions using LLMs. Use for creative writing, question answering, or any text generation task.",
-            category=ToolCategory.TEXT_GENERATION,
-            parameters={
-                "model": {
-                    "type": "string",
-                    "description": "LLM model name (e.g., 'claude-3-7-sonnet', 'gpt-4')",
-                    "required": True,
-                },
-                "prompt": {
-                    "type": "string",
-                    "description": "The prompt/question to send to the model",
-                    "required": True,
-                },
-                "response_format": {
-                    "type": "object",
-                    "description": "Optional JSON schema for structured output",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_complete,
-            examples=[
-                "Generate a product description for a laptop",
-                "Answer: What is the capital of France?",
-                "Summarize this text in 3 sentences",
-            ],
-        )
-
-        # Text Analysis Tools
-        self._register_tool(
-            name="ai_classify",
-            description="Classify text into predefined categories. Use for content categorization, tagging, or routing.",
-            category=ToolCategory.TEXT_ANALYSIS,
-            parameters={
-                "content_column": {
-                    "type": "string",
-                    "description": "Column containing text to classify",
-                    "required": True,
-                },
-                "categories": {
-                    "type": "array",
-                    "description": "List of category labels",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "prompt_prefix": {
-                    "type": "string",
-                    "description": "Optional prefix to add context",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_classify,
-            examples=[
-                "Classify customer feedback into: Positive, Negative, Neutral",
-                "Categorize products into: Electronics, Clothing, Food",
-                "Tag support tickets as: Bug, Feature Request, Question",
-            ],
-        )
-
-        self._register_tool(
-            name="ai_sentiment",
-            description="Analyze sentiment of text. Returns overall sentiment and category-specific scores.",
-            category=ToolCategory.TEXT_ANALYSIS,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text to analyze",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_sentiment,
-            examples=[
-                "Analyze sentiment of customer reviews",
-                "Detect emotional tone in social media posts",
-                "Measure satisfaction in survey responses",
-            ],
-        )
-
-        self._register_tool(
-            name="ai_filter",
-            description="Filter data using natural language conditions. Use for semantic search or complex filtering.",
-            category=ToolCategory.TEXT_ANALYSIS,
-            parameters={
-                "filter_condition": {
-                    "type": "string",
-                    "description": "Natural language filter condition",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to filter",
-                    "required": True,
-                },
-                "columns": {
-                    "type": "array",
-                    "description": "Columns to consider in filtering",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_filter,
-            examples=[
-                "Find products that mention sustainability",
-                "Filter reviews that discuss shipping issues",
-                "Find articles about artificial intelligence",
-            ],
-        )
-
-        # Text Transformation Tools
-        self._register_tool(
-            name="ai_translate",
-            description="Translate text between languages. Supports major world languages.",
-            category=ToolCategory.TEXT_TRANSFORMATION,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text to translate",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "source_lang": {
-                    "type": "string",
-                    "description": "Source language code (e.g., 'en', 'es', 'fr')",
-                    "required": True,
-                },
-                "target_lang": {
-                    "type": "string",
-                    "description": "Target language code",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_translate,
-            examples=[
-                "Translate product descriptions from English to Spanish",
-                "Convert customer feedback from French to English",
-                "Localize content for international markets",
-            ],
-        )
-
-        self._register_tool(
-            name="ai_redact",
-            description="Remove personally identifiable information (PII) from text. Use for privacy compliance.",
-            category=ToolCategory.TEXT_TRANSFORMATION,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text to redact",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "pii_types": {
-                    "type": "array",
-                    "description": "Types of PII to redact (EMAIL, PHONE_NUMBER, etc.)",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_redact,
-            examples=[
-                "Remove email addresses from customer comments",
-                "Redact phone numbers and addresses from support tickets",
-                "Anonymize user data for analysis",
-            ],
-        )
-
-        self._register_tool(
-            name="summarize",
-            description="Generate concise summaries of text. Use for content condensation.",
-            category=ToolCategory.TEXT_TRANSFORMATION,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text to summarize",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-            },
-            function=self.service.summarize,
-            examples=[
-                "Summarize long articles",
-                "Create executive summaries of reports",
-                "Condense customer feedback",
-            ],
-        )
-
-        # Data Extraction Tools
-        self._register_tool(
-            name="ai_extract",
-            description="Extract specific information from text using natural language instructions.",
-            category=ToolCategory.DATA_EXTRACTION,
-            parameters={
-                "content_column": {
-                    "type": "string",
-                    "description": "Column containing text to extract from",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "instruction": {
-                    "type": "string",
-                    "description": "What to extract (e.g., 'Extract all email addresses')",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_extract,
-            examples=[
-                "Extract email addresses from text",
-                "Pull out product names and prices",
-                "Find dates and locations mentioned",
-            ],
-        )
-
-        self._register_tool(
-            name="extract_structured_data",
-            description="Extract structured data from unstructured text using a schema. Returns JSON.",
-            category=ToolCategory.DATA_EXTRACTION,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing unstructured text",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "extraction_prompt": {
-                    "type": "string",
-                    "description": "Instructions for extraction",
-                    "required": True,
-                },
-                "schema": {
-                    "type": "object",
-                    "description": "JSON schema defining output structure",
-                    "required": True,
-                },
-            },
-            function=self.service.extract_structured_data,
-            examples=[
-                "Extract product info (name, price, category) from listings",
-                "Parse invoice data into structured format",
-                "Convert resumes into standardized JSON",
-            ],
-        )
+        for spec in _TOOL_SPECS:
+            if spec.service_attr == "ai_count_tokens":
+                function = self._count_tokens
+            else:
+                function = getattr(self.service, spec.service_attr)
+            if spec.name in _COALESCED_TOOLS:
+                function = self._coalesced(spec.name, function)
+            self._register_tool(
+                name=spec.name,
+                description=spec.description,
+                category=spec.category,
+                parameters=spec.parameters,
+                function=function,
+                examples=spec.examples,
+            )
 
-        self._register_tool(
-            name="ai_parse_document",
-            description="Parse documents (PDF, images) to extract text using OCR or layout analysis.",
-            category=ToolCategory.DATA_EXTRACTION,
-            parameters={
-                "file_path_column": {
-                    "type": "string",
-                    "description": "Column containing file paths",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "mode": {
-                    "type": "string",
-                    "description": "Parsing mode: 'layout' or 'ocr'",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_parse_document,
-            examples=[
-                "Extract text from scanned documents",
-                "Parse PDF invoices",
-                "Convert images to text",
-            ],
-        )
-
-        self._register_tool(
-            name="ai_transcribe",
-            description="Transcribe audio/video files to text with optional timestamps and speaker labels.",
-            category=ToolCategory.DATA_EXTRACTION,
-            parameters={
-                "audio_file_column": {
-                    "type": "string",
-                    "description": "Column containing audio/video file paths",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_transcribe,
-            examples=[
-                "Transcribe customer service calls",
-                "Convert meeting recordings to text",
-                "Generate subtitles for videos",
-            ],
-        )
-
-        # Aggregation Tools
-        self._register_tool(
-            name="ai_aggregate",
-            description="Aggregate text data using natural language instructions. Use for insights across multiple rows.",
-            category=ToolCategory.AGGREGATION,
-            parameters={
-                "column_to_aggregate": {
-                    "type": "string",
-                    "description": "Column to aggregate",
-                    "required": True,
-                },
-                "aggregation_prompt": {
-                    "type": "string",
-                    "description": "What insights to extract",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "group_by": {
-                    "type": "string",
-                    "description": "Optional column to group by",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_aggregate,
-            examples=[
-                "Identify top 3 common themes in feedback",
-                "Find recurring issues in support tickets",
-                "Summarize key points across all reviews",
-            ],
-        )
+    def _coalesced(
+        self,
+        name: str,
+        function: Callable[..., Coroutine[Any, Any, list[dict[str, Any]]]],
+    ) -> Callable[..., Coroutine[Any, Any, list[dict[str, Any]]]]:
+        """Route calls of row-level tool ``name`` through the toolkit's RowOpBatcher."""
+        column_arg, result_column, op_args = _COALESCED_TOOLS[name]
+        signature = inspect.signature(function)
 
-        self._register_tool(
-            name="ai_summarize_agg",
-            description="Aggregate and summarize multiple rows of text into a single summary.",
-            category=ToolCategory.AGGREGATION,
-            parameters={
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text to aggregate",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "group_by": {
-                    "type": "string",
-                    "description": "Optional column to group by",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_summarize_agg,
-            examples=[
-                "Summarize all customer feedback for a product",
-                "Create overview of support tickets by category",
-                "Aggregate news articles by topic",
-            ],
-        )
+        @functools.wraps(function)
+        async def coalesced(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            op = {"op": name, "column": arguments[column_arg], **{arg: arguments[arg] for arg in op_args}}
+            return await self._batcher.submit(
+                arguments["table_name"], op, result_column, lambda: function(*args, **kwargs)
+            )
 
-        # Semantic Operations
-        self._register_tool(
-            name="ai_embed",
-            description="Generate embedding vectors for text. Use for similarity search and clustering.",
-            category=ToolCategory.SEMANTIC_OPERATIONS,
-            parameters={
-                "content_column": {
-                    "type": "string",
-                    "description": "Column containing text to embed",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "model": {
-                    "type": "string",
-                    "description": "Embedding model name",
-                    "required": False,
-                },
-            },
-            function=self.service.ai_embed,
-            examples=[
-                "Create embeddings for semantic search",
-                "Generate vectors for clustering",
-                "Build similarity index",
-            ],
-        )
+        return coalesced
 
-        self._register_tool(
-            name="ai_similarity",
-            description="Calculate semantic similarity between two text columns. Returns similarity score.",
-            category=ToolCategory.SEMANTIC_OPERATIONS,
-            parameters={
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-                "column1": {
-                    "type": "string",
-                    "description": "First text column",
-                    "required": True,
-                },
-                "column2": {
-                    "type": "string",
-                    "description": "Second text column",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_similarity,
-            examples=[
-                "Find similar product descriptions",
-                "Match questions to answers",
-                "Detect duplicate content",
-            ],
-        )
+    async def _count_tokens(self, model: str, text_column: str, table_name: str) -> list[dict[str, Any]]:
+        """Count tokens with tiktoken when it knows ``model``, else with AI_COUNT_TOKENS.
 
-        self._register_tool(
-            name="semantic_join",
-            description="Join tables using semantic understanding rather than exact matches.",
-            category=ToolCategory.SEMANTIC_OPERATIONS,
-            parameters={
-                "left_table": {
-                    "type": "string",
-                    "description": "Left table name",
-                    "required": True,
-                },
-                "right_table": {
-                    "type": "string",
-                    "description": "Right table name",
-                    "required": True,
-                },
-                "left_column": {
-                    "type": "string",
-                    "description": "Column from left table",
-                    "required": True,
-                },
-                "right_column": {
-                    "type": "string",
-                    "description": "Column from right table",
-                    "required": True,
-                },
-                "join_condition": {
-                    "type": "string",
-                    "description": "Natural language join condition",
-                    "required": True,
-                },
-            },
-            function=self.service.semantic_join,
-            examples=[
-                "Match customer issues to solution articles",
-                "Link products to relevant reviews",
-                "Connect questions to knowledge base entries",
-            ],
-        )
+        Rows have the same shape as ModularAISQLService.ai_count_tokens results.
+        Local counts use the model's public tokenizer and are approximate: they
+        can differ from what Cortex bills, e.g. for prompt wrapping it adds.
+        """
+        encoding = await asyncio.to_thread(_tiktoken_encoding, model)
+        if encoding is None:
+            return await self.service.ai_count_tokens(model, text_column, table_name)
 
-        # Utility Tools
-        self._register_tool(
-            name="ai_count_tokens",
-            description="Count tokens in text for a specific model. Use to prevent exceeding model limits.",
-            category=ToolCategory.UTILITY,
-            parameters={
-                "model": {
-                    "type": "string",
-                    "description": "Model name to count tokens for",
-                    "required": True,
-                },
-                "text_column": {
-                    "type": "string",
-                    "description": "Column containing text",
-                    "required": True,
-                },
-                "table_name": {
-                    "type": "string",
-                    "description": "Table name to query",
-                    "required": True,
-                },
-            },
-            function=self.service.ai_count_tokens,
-            examples=[
-                "Check if prompts fit within model limits",
-                "Calculate token usage for cost estimation",
-                "Validate input size before processing",
-            ],
+        rows = await self.service.sf.execute_query(select(table_name).select_plain(text_column).limit(100).build())
+        texts = [str(next(iter(row.values()), None) or "") for row in rows]
+        # Encoding is CPU-bound; keep it off the event loop
+        token_counts = await asyncio.to_thread(
+            lambda: [len(tokens) for tokens in encoding.encode_batch(texts, disallowed_special=())]
         )
+        return [{**row, "TOKEN_COUNT": token_count} for row, token_count in zip(rows, token_counts)]
 
     def _register_tool(
         self,
         name: str,
         description: str,
         category: ToolCategory,
-        parameters: dict[str, Any],
+        parameters: Mapping[str, Any],
         function: Callable[..., Coroutine[Any, Any, Any]],
-        examples: list[str],
+        examples: Sequence[str],
     ):
         """Register a tool in the toolkit."""
+        name = sys.intern(name)
+        if name in _CACHED_TOOLS:
+            function = _wrap_cached(function, name, self._cache, self._semantic_cache)
         tool = ToolDefinition(
             name=name,
             description=description,
@@ -605,7 +1013,13 @@ class AISQLToolkit:
             function=function,
             examples=examples,
         )
+        previous = self._tools.get(name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
         self._tools[name] = tool
+        self._by_category[category].append(tool)
+        self._dict_cache = None
+        self._json_cache = None
 
     def get_tool(self, name: str) -> ToolDefinition | None:
         """Get a specific tool by name."""
@@ -617,7 +1031,7 @@ class AISQLToolkit:
 
     def get_tools_by_category(self, category: ToolCategory) -> list[ToolDefinition]:
         """Get tools filtered by category."""
-        return [tool for tool in self._tools.values() if tool.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_tool_names(self) -> list[str]:
         """Get list of all tool names."""
@@ -627,9 +1041,60 @@ class AISQLToolkit:
         """Get mapping of tool names to descriptions."""
         return {name: tool.description for name, tool in self._tools.items()}
 
+    async def invoke_many(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        max_concurrency: int = 32,
+    ) -> list[Any]:
+        """Run several tool calls concurrently.
+
+        Args:
+            calls: (tool name, keyword arguments) pairs
+            max_concurrency: Maximum number of calls in flight at once; keep it
+                within the warehouse's and model provider's concurrency limits
+
+        Returns:
+            Results in input order; a failed call yields its exception instead
+            of cancelling the others
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _invoke_one(name: str, arguments: dict[str, Any]) -> Any:
+            tool = self.get_tool(name)
+            if tool is None:
+                raise ValueError(f"Tool '{name}' not found")
+            async with semaphore:
+                return await tool.function(**arguments)
+
+        return await asyncio.gather(
+            *(_invoke_one(name, arguments) for name, arguments in calls),
+            return_exceptions=True,
+        )
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Get hit/miss counters and sizes of the exact-match and (if enabled) semantic caches."""
+        stats = {"exact": self._cache.stats()}
+        if self._semantic_cache is not None:
+            stats["semantic"] = self._semantic_cache.stats()
+        return stats
+
+    def clear_cache(self) -> None:
+        """Drop cached tool results, e.g. after the underlying tables change."""
+        self._cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def tools_as_json(self) -> bytes:
+        """Export all tool definitions as a JSON array, for tool catalogs sent every turn."""
+        if self._json_cache is None:
+            self._json_cache = b"[" + b",".join(tool.to_json() for tool in self._tools.values()) + b"]"
+        return self._json_cache
+
     def to_dict(self) -> dict[str, Any]:
-        """Export toolkit as dictionary."""
-        return {
-            "tools": [tool.to_dict() for tool in self._tools.values()],
-            "categories": [cat.value for cat in ToolCategory],
-        }
+        """Export toolkit as dictionary (built once per registered tool set; do not modify)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "tools": [tool.to_dict() for tool in self._tools.values()],
+                "categories": list(_CATEGORY_VALUES),
+            }
+        return self._dict_cache
@@ -1,6 +1,11 @@
 """Schemas for AI SQL API operations."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Result rows are read-only once validated; warehouse rows carry extra source
+# columns, which are ignored. Each result list has a module-level TypeAdapter so
+# endpoints validate rows once and build the response with model_construct.
+_RESULT_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 # ============================================================================
 # AI_COMPLETE Schemas
@@ -36,6 +41,8 @@ class AITranscribeRequest(BaseModel):
 class TranscriptionResult(BaseModel):
     """Single transcription result."""
 
+    model_config = _RESULT_CONFIG
+
     transcription_text: str
     audio_duration_seconds: float
 
@@ -43,9 +50,14 @@ class TranscriptionResult(BaseModel):
 class AITranscribeResponse(BaseModel):
     """Response from AI_TRANSCRIBE."""
 
+    model_config = _RESULT_CONFIG
+
     results: list[TranscriptionResult]
 
 
+TRANSCRIPTION_RESULTS = TypeAdapter(list[TranscriptionResult])
+
+
 # ============================================================================
 # AI_CLASSIFY Schemas
 # ============================================================================
@@ -63,6 +75,8 @@ class AIClassifyRequest(BaseModel):
 class ClassificationResult(BaseModel):
     """Single classification result."""
 
+    model_config = _RESULT_CONFIG
+
     primary_label: str
     primary_confidence: float
 
@@ -70,9 +84,14 @@ class ClassificationResult(BaseModel):
 class AIClassifyResponse(BaseModel):
     """Response from AI_CLASSIFY."""
 
+    model_config = _RESULT_CONFIG
+
     results: list[ClassificationResult]
 
 
+CLASSIFICATION_RESULTS = TypeAdapter(list[ClassificationResult])
+
+
 # ============================================================================
 # AI_FILTER Schemas
 # ============================================================================
@@ -109,6 +128,8 @@ class AIAggregateRequest(BaseModel):
 class AggregationResult(BaseModel):
     """Single aggregation result."""
 
+    model_config = _RESULT_CONFIG
+
     total_records: int
     insights: str
 
@@ -116,9 +137,14 @@ class AggregationResult(BaseModel):
 class AIAggregateResponse(BaseModel):
     """Response from AI_AGG."""
 
+    model_config = _RESULT_CONFIG
+
     results: list[AggregationResult]
 
 
+AGGREGATION_RESULTS = TypeAdapter(list[AggregationResult])
+
+
 # ============================================================================
 # AI_SENTIMENT Schemas
 # ============================================================================
@@ -134,6 +160,8 @@ class AISentimentRequest(BaseModel):
 class SentimentResult(BaseModel):
     """Single sentiment result."""
 
+    model_config = _RESULT_CONFIG
+
     primary_sentiment: str
     sentiment_score: float
 
@@ -141,9 +169,14 @@ class SentimentResult(BaseModel):
 class AISentimentResponse(BaseModel):
     """Response from AI_SENTIMENT."""
 
+    model_config = _RESULT_CONFIG
+
     results: list[SentimentResult]
 
 
+SENTIMENT_RESULTS = TypeAdapter(list[SentimentResult])
+
+
 # ============================================================================
 # SUMMARIZE Schemas
 # ============================================================================
@@ -159,15 +192,22 @@ class SummarizeRequest(BaseModel):
 class SummaryResult(BaseModel):
     """Single summary result."""
 
+    model_config = _RESULT_CONFIG
+
     summary: str
 
 
 class SummarizeResponse(BaseModel):
     """Response from SUMMARIZE."""
 
+    model_config = _RESULT_CONFIG
+
     results: list[SummaryResult]
 
 
+SUMMARY_RESULTS = TypeAdapter(list[SummaryResult])
+
+
 # ============================================================================
 # Semantic JOIN Schemas
 # ============================================================================
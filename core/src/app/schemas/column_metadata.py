@@ -4,6 +4,24 @@ from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import TypedDict
+
+from ..core.schemas import TrustedORMSchema
+
+
+class ColumnProvenance(TypedDict, total=False):
+    """How a column metadata record was produced.
+
+    Validated as a plain dict (no nested model construction); unknown keys are kept.
+    """
+    __pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[misc]
+
+    base_query: str
+    sample_size: int
+    rule_first: bool
+    used_ai: bool
+    generated_by: str
+    source_column: str
 
 
 class ColumnMetadataBase(BaseModel):
@@ -13,13 +31,13 @@ class ColumnMetadataBase(BaseModel):
     semantic_type: str = Field(..., min_length=1, max_length=50)
     confidence: float = Field(..., ge=0.0, le=1.0)
     metadata: dict[str, Any] | None = Field(default=None, validation_alias="metadata_payload")
-    provenance: dict[str, Any] | None = None
+    provenance: ColumnProvenance | None = None
     examples: list[Any] | None = None
     overrides: dict[str, Any] | None = None
     last_updated: datetime | None = None
 
 
-class ColumnMetadataRead(ColumnMetadataBase):
+class ColumnMetadataRead(ColumnMetadataBase, TrustedORMSchema):
     """Read schema for column metadata."""
     id: int
     created_at: datetime
@@ -38,7 +56,7 @@ class TableAssetMetadataBase(BaseModel):
     last_updated: datetime | None = None
 
 
-class TableAssetMetadataRead(TableAssetMetadataBase):
+class TableAssetMetadataRead(TableAssetMetadataBase, TrustedORMSchema):
     """Read schema for table-level metadata."""
     id: int
     created_at: datetime
@@ -1,8 +1,16 @@
 """Rate limit schemas."""
 
 import re
+from functools import lru_cache
+
 from pydantic import BaseModel
 
+# UUID or numeric path segment; the UUID branch comes first so UUIDs that start
+# with a digit are not cut short by the numeric branch
+_DYNAMIC_SEGMENT_RE = re.compile(
+    r'/(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)'
+)
+
 
 class RateLimitRead(BaseModel):
     """Rate limit read schema."""
@@ -14,13 +22,12 @@ class RateLimitRead(BaseModel):
     period: int
 
 
+@lru_cache(maxsize=4096)
 def sanitize_path(path: str) -> str:
     """Sanitize path for rate limiting by removing dynamic segments.
 
-    Converts paths like /api/v1/users/123 to /api/v1/users/{id}
+    Converts paths like /api/v1/users/123 to /api/v1/users/{id}. Results are
+    memoized, as the same raw paths recur across requests.
     """
-    # Replace numeric IDs with {id}
-    path = re.sub(r'/\d+', '/{id}', path)
-    # Replace UUIDs with {id}
-    path = re.sub(r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '/{id}', path, flags=re.IGNORECASE)
-    return path
+    # Replace UUIDs and numeric IDs with {id} in one pass
+    return _DYNAMIC_SEGMENT_RE.sub('/{id}', path)
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..core.schemas import TrustedORMSchema
 
 
 class TableAssetBase(BaseModel):
@@ -33,7 +35,7 @@ class TableAssetUpdate(BaseModel):
     use_cases: Optional[list[str]] = None
 
 
-class TableAssetRead(TableAssetBase):
+class TableAssetRead(TableAssetBase, TrustedORMSchema):
     """Schema for reading a table asset."""
     id: int
     created_at: datetime
@@ -41,8 +43,7 @@ class TableAssetRead(TableAssetBase):
     is_deleted: bool
     user_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TableAssetList(BaseModel):
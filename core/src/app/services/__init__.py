@@ -1,10 +1,26 @@
-"""Services module for Snowflake AI data analysis."""
+"""Services module for Snowflake AI data analysis.
 
-from .chart_service import ChartService
-from .eda_service import EDAService
-from .modular_ai_sql_service import ModularAISQLService
-from .snowflake_service import SnowflakeService
-from .column_metadata_service import ColumnMetadataService
+Service classes are imported on first access so that importing one service
+module does not pull in every other service's dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .chart_service import ChartService
+    from .column_metadata_service import ColumnMetadataService
+    from .eda_service import EDAService
+    from .modular_ai_sql_service import ModularAISQLService
+    from .snowflake_service import SnowflakeService
+
+_LAZY_IMPORTS = {
+    "ChartService": ".chart_service",
+    "EDAService": ".eda_service",
+    "ModularAISQLService": ".modular_ai_sql_service",
+    "SnowflakeService": ".snowflake_service",
+    "ColumnMetadataService": ".column_metadata_service",
+}
 
 __all__ = [
     "SnowflakeService",
@@ -13,3 +29,16 @@ __all__ = [
     "ChartService",
     "ColumnMetadataService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
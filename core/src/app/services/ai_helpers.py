@@ -5,17 +5,56 @@ This module provides reusable utilities for AI-powered features,
 including metadata generation, data analysis, and insight extraction.
 """
 
+import asyncio
+import copy
 import json
 import logging
-from typing import Any
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from ..config.prompts import build_metadata_prompt
 from ..services.modular_ai_sql_service import ModularAISQLService
 
+_FROM_TABLE_RE = re.compile(r'FROM\s+([A-Za-z0-9_\.]+)', re.IGNORECASE)
+_SQL_KEYWORD_RE = re.compile(r'\b(where|join|group by|order by)\b', re.IGNORECASE)
+
+
+def _build_metadata_query(
+    sql: str,
+    model: str,
+    columns: list[dict[str, str]] | None,
+    sample_rows: list[dict[str, Any]] | None,
+) -> str:
+    """Build the escaped AI_COMPLETE query for a metadata prompt."""
+    prompt = build_metadata_prompt(sql, columns, sample_rows)
+
+    # Escape single quotes for Snowflake
+    escaped_prompt = prompt.replace("'", "''")
+    escaped_model = model.replace("'", "''")
+
+    # Build SQL query with escaped prompt as literal
+    return f"""
+        SELECT AI_COMPLETE(
+            '{escaped_model}',
+            '{escaped_prompt}'
+        ) as response
+        """
+
 
 class AIMetadataGenerator:
     """Helper class for generating metadata using AI."""
 
+    # Parsed AI suggestions keyed by the final query -> (cached_at, metadata).
+    # Shared across instances so UI retries skip the Cortex round-trip; the
+    # deterministic fallback is never cached.
+    METADATA_CACHE_TTL_SECONDS: ClassVar[float] = 3600.0
+    METADATA_CACHE_MAX_ENTRIES: ClassVar[int] = 512
+    _metadata_cache: ClassVar[OrderedDict[str, tuple[float, dict[str, Any]]]] = OrderedDict()
+
     def __init__(self, ai_service: ModularAISQLService):
         """Initialize with AI service."""
         self.ai_service = ai_service
@@ -47,20 +86,16 @@ class AIMetadataGenerator:
         Raises:
             ValueError: If AI response cannot be parsed
         """
-        # Build prompt using centralized template
-        prompt = build_metadata_prompt(sql, columns, sample_rows)
-
-        # Escape single quotes for Snowflake
-        escaped_prompt = prompt.replace("'", "''")
-        escaped_model = model.replace("'", "''")
+        # Build the escaped query from the centralized template; it also keys the cache
+        query = _build_metadata_query(sql, model, columns, sample_rows)
 
-        # Build SQL query with escaped prompt as literal
-        query = f"""
-        SELECT AI_COMPLETE(
-            '{escaped_model}',
-            '{escaped_prompt}'
-        ) as response
-        """
+        cache = self._metadata_cache
+        entry = cache.get(query)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.METADATA_CACHE_TTL_SECONDS:
+            cache.move_to_end(query)
+            # Callers (e.g. API handlers) may edit the suggestion in place
+            return copy.deepcopy(entry[1])
 
         # Execute query directly
         result = await self.ai_service.sf.execute_query(query)
@@ -78,6 +113,10 @@ class AIMetadataGenerator:
 
         required_fields = ["table_name", "tags", "summary", "use_cases"]
         if metadata and all(field in metadata for field in required_fields):
+            cache[query] = (now, copy.deepcopy(metadata))
+            cache.move_to_end(query)
+            while len(cache) > self.METADATA_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
             return metadata
 
         # Fallback to deterministic, non-AI metadata to avoid hard failures
@@ -85,6 +124,40 @@ class AIMetadataGenerator:
         self.logger.info("Using smart metadata fallback")
         return fallback
 
+    async def suggest_table_metadata_batch(
+        self,
+        items: list[tuple[str, list[dict[str, str]] | None, list[dict[str, Any]] | None]],
+        model: str = "mistral-large2",
+        max_concurrency: int = 32,
+    ) -> list[dict[str, Any]]:
+        """
+        Generate metadata suggestions for several SQL queries concurrently.
+
+        Args:
+            items: (sql, columns, sample_rows) triples
+            model: AI model to use for generation
+            max_concurrency: Maximum number of Cortex calls in flight at once
+
+        Returns:
+            Suggested metadata in input order; an item whose AI call fails gets
+            the deterministic fallback without affecting the others
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _suggest_one(
+            sql: str,
+            columns: list[dict[str, str]] | None,
+            sample_rows: list[dict[str, Any]] | None,
+        ) -> dict[str, Any]:
+            try:
+                async with semaphore:
+                    return await self.suggest_table_metadata(sql, columns, sample_rows, model)
+            except Exception as e:
+                self.logger.warning("AI metadata generation failed, using fallback: %s", e)
+                return smart_metadata_fallback(sql)
+
+        return await asyncio.gather(*(_suggest_one(*item) for item in items))
+
 
 class AIDataAnalyzer:
     """Helper class for analyzing data using AI."""
@@ -154,8 +227,7 @@ def extract_table_name_from_sql(sql: str) -> str | None:
     Returns:
         Extracted table name or None if not found
     """
-    import re
-    table_match = re.search(r'FROM\s+([A-Za-z0-9_\.]+)', sql, re.IGNORECASE)
+    table_match = _FROM_TABLE_RE.search(sql)
     if table_match:
         full_name = table_match.group(1)
         # Return just the table name (last part after dots)
@@ -180,31 +252,49 @@ def smart_metadata_fallback(
     Returns:
         Dictionary with metadata fields
     """
-    import re
+    cached = _cached_fallback(sql, table_name)
+    return {
+        "table_name": cached["table_name"],
+        "tags": list(cached["tags"]),
+        "summary": cached["summary"],
+        "use_cases": list(cached["use_cases"]),
+    }
+
 
+@lru_cache(maxsize=1024)
+def _cached_fallback(sql: str, table_name: str | None) -> MappingProxyType[str, Any]:
+    """Compute fallback metadata once per (sql, table_name); lists are stored as tuples."""
     # Extract table name from SQL
     detected_table = extract_table_name_from_sql(sql)
     base_name = detected_table or table_name or "new_table"
 
     # Parse table name into words
-    table_words = base_name.replace('_', ' ').split()
+    readable_name = base_name.replace('_', ' ')
+    table_words = readable_name.split()
 
     # Generate tags from table name
     tags = [word for word in table_words if len(word) > 2]
 
-    # Add SQL operation tags
-    sql_lower = sql.lower()
-    if 'where' in sql_lower:
+    # Add SQL operation tags (one scan for every keyword)
+    keywords = {match.lower() for match in _SQL_KEYWORD_RE.findall(sql)}
+    if 'where' in keywords:
         tags.append('filtered')
-    if 'join' in sql_lower:
+    if 'join' in keywords:
         tags.append('joined')
-    if 'group by' in sql_lower:
+    if 'group by' in keywords:
         tags.append('aggregated')
-    if 'order by' in sql_lower:
+    if 'order by' in keywords:
         tags.append('sorted')
 
-    # Limit to 5 unique tags
-    tags = list(dict.fromkeys(tags))[:5]
+    # Limit to 5 unique tags, stopping as soon as 5 are found
+    seen: set[str] = set()
+    unique_tags: list[str] = []
+    for tag in tags:
+        if tag not in seen:
+            seen.add(tag)
+            unique_tags.append(tag)
+            if len(unique_tags) == 5:
+                break
 
     # Generate meaningful name
     if len(table_words) > 1:
@@ -214,25 +304,25 @@ def smart_metadata_fallback(
 
     # Generate summary
     operation = "retrieves data"
-    if 'group by' in sql_lower:
+    if 'group by' in keywords:
         operation = "aggregates and analyzes data"
-    elif 'join' in sql_lower:
+    elif 'join' in keywords:
         operation = "combines data from multiple sources"
-    elif 'where' in sql_lower:
+    elif 'where' in keywords:
         operation = "filters and retrieves specific data"
 
-    summary = f"This query {operation} from {base_name.replace('_', ' ')}."
+    summary = f"This query {operation} from {readable_name}."
 
     # Generate use cases
-    use_cases = [
-        f"{base_name.replace('_', ' ').title()} Analysis",
+    use_cases = (
+        f"{readable_name.title()} Analysis",
         "Data Exploration",
-        "Reporting Dashboard"
-    ]
+        "Reporting Dashboard",
+    )
 
-    return {
+    return MappingProxyType({
         "table_name": suggested_name,
-        "tags": tags,
+        "tags": tuple(unique_tags),
         "summary": summary,
         "use_cases": use_cases,
-    }
+    })
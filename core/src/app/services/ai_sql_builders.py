@@ -4,6 +4,7 @@ This module provides composable building blocks for creating AISQL queries.
 Each builder can be used independently or combined to create complex queries.
 """
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -33,6 +34,18 @@ class QueryBuilder(ABC):
 # ============================================================================
 
 
+def response_format_literal(response_format: dict[str, Any]) -> str:
+    """Serialize an AI_COMPLETE response format for use inside PARSE_JSON('...').
+
+    A bare JSON schema is wrapped as ``{"type": "json", "schema": ...}``; the
+    result is escaped for a single-quoted Snowflake literal.
+    """
+    format_payload = response_format
+    if "schema" not in response_format:
+        format_payload = {"type": "json", "schema": response_format}
+    return json.dumps(format_payload).replace("'", "''")
+
+
 class AICompleteBuilder:
     """Builder for AI_COMPLETE function calls."""
 
@@ -40,24 +53,25 @@ class AICompleteBuilder:
         self.model = model
         self.prompt = prompt
         self.response_format = None
+        # Escaped once here so build() is plain concatenation
+        self._escaped_prompt = prompt.replace("'", "''")
+        self._format_json: str | None = None
 
     def with_response_format(self, schema: dict[str, Any]) -> "AICompleteBuilder":
         """Add structured output format."""
         self.response_format = schema
+        self._format_json = response_format_literal(schema)
         return self
 
     def build(self) -> str:
         """Build AI_COMPLETE function call."""
-        # Escape single quotes in prompt
-        escaped_prompt = self.prompt.replace("'", "''")
+        escaped_prompt = self._escaped_prompt
 
         if self.response_format:
             # Convert dict to JSON string for Snowflake
-            import json
-            format_payload = self.response_format
-            if "schema" not in self.response_format:
-                format_payload = {"type": "json", "schema": self.response_format}
-            format_json = json.dumps(format_payload).replace("'", "''")
+            format_json = self._format_json
+            if format_json is None:
+                format_json = response_format_literal(self.response_format)
             return f"""AI_COMPLETE(
                 '{self.model}',
                 '{escaped_prompt}',
@@ -280,6 +294,8 @@ class SelectQueryBuilder(QueryBuilder):
         self.group_by_columns = []
         self.order_by_columns = []
         self.limit_value = None
+        # Last built SQL; every mutator resets it.
+        self._cached_sql: str | None = None
 
     def select(self, *columns: str | tuple[str, str]) -> "SelectQueryBuilder":
         """Add columns to SELECT clause.
@@ -293,6 +309,23 @@ class SelectQueryBuilder(QueryBuilder):
                 self.select_columns.append(f"{expr} as {alias}")
             else:
                 self.select_columns.append(col)
+        self._cached_sql = None
+        return self
+
+    def select_plain(self, *columns: str) -> "SelectQueryBuilder":
+        """Add column names or expressions to SELECT clause as-is."""
+        self.select_columns.extend(columns)
+        self._cached_sql = None
+        return self
+
+    def select_aliased(self, **aliases: str) -> "SelectQueryBuilder":
+        """Add aliased expressions to SELECT clause.
+
+        Args:
+            aliases: Column alias -> expression, in SELECT order
+        """
+        self.select_columns.extend(f"{expr} as {alias}" for alias, expr in aliases.items())
+        self._cached_sql = None
         return self
 
     def select_ai_function(self, builder: Any, alias: str) -> "SelectQueryBuilder":
@@ -303,64 +336,74 @@ class SelectQueryBuilder(QueryBuilder):
             alias: Column alias for the result
         """
         self.select_columns.append(f"{builder.build()} as {alias}")
+        self._cached_sql = None
         return self
 
     def where(self, condition: str) -> "SelectQueryBuilder":
         """Add WHERE condition."""
         self.where_conditions.append(condition)
+        self._cached_sql = None
         return self
 
     def where_ai_filter(self, builder: AIFilterBuilder) -> "SelectQueryBuilder":
         """Add AI_FILTER as WHERE condition."""
         self.where_conditions.append(builder.build())
+        self._cached_sql = None
         return self
 
     def group_by(self, *columns: str) -> "SelectQueryBuilder":
         """Add GROUP BY columns."""
         self.group_by_columns.extend(columns)
+        self._cached_sql = None
         return self
 
     def order_by(self, *columns: str) -> "SelectQueryBuilder":
         """Add ORDER BY columns."""
         self.order_by_columns.extend(columns)
+        self._cached_sql = None
         return self
 
     def limit(self, n: int) -> "SelectQueryBuilder":
         """Set LIMIT."""
         self.limit_value = n
+        self._cached_sql = None
         return self
 
     def build(self) -> str:
         """Build complete SELECT query."""
-        query_parts = []
-
-        # SELECT clause
-        columns_str = ",\n            ".join(self.select_columns) if self.select_columns else "*"
-        query_parts.append(f"SELECT\n            {columns_str}")
-
-        # FROM clause
-        query_parts.append(f"        FROM {self.table_name}")
+        if self._cached_sql is not None:
+            return self._cached_sql
+
+        # SELECT / FROM clauses
+        parts = [
+            "SELECT\n            ",
+            ",\n            ".join(self.select_columns) if self.select_columns else "*",
+            "\n        FROM ",
+            self.table_name,
+        ]
 
         # WHERE clause
         if self.where_conditions:
-            where_str = " AND ".join(f"({cond})" for cond in self.where_conditions)
-            query_parts.append(f"        WHERE {where_str}")
+            parts.append("\n        WHERE (")
+            parts.append(") AND (".join(self.where_conditions))
+            parts.append(")")
 
         # GROUP BY clause
         if self.group_by_columns:
-            group_str = ", ".join(self.group_by_columns)
-            query_parts.append(f"        GROUP BY {group_str}")
+            parts.append("\n        GROUP BY ")
+            parts.append(", ".join(self.group_by_columns))
 
         # ORDER BY clause
         if self.order_by_columns:
-            order_str = ", ".join(self.order_by_columns)
-            query_parts.append(f"        ORDER BY {order_str}")
+            parts.append("\n        ORDER BY ")
+            parts.append(", ".join(self.order_by_columns))
 
         # LIMIT clause
         if self.limit_value:
-            query_parts.append(f"        LIMIT {self.limit_value}")
+            parts.append(f"\n        LIMIT {self.limit_value}")
 
-        return "\n".join(query_parts)
+        self._cached_sql = "".join(parts)
+        return self._cached_sql
 
 
 class CTEQueryBuilder(QueryBuilder):
@@ -429,33 +472,41 @@ class SemanticJoinBuilder(QueryBuilder):
         self.join_type = "LEFT JOIN"
         self.additional_columns = []
         self.limit_value = 100
+        # Last built SQL; every mutator resets it.
+        self._cached_sql: str | None = None
 
     def with_join_type(self, join_type: str) -> "SemanticJoinBuilder":
         """Set JOIN type (INNER, LEFT, RIGHT, FULL)."""
         self.join_type = join_type
+        self._cached_sql = None
         return self
 
     def select_additional(self, *columns: str) -> "SemanticJoinBuilder":
         """Add additional columns to select."""
         self.additional_columns.extend(columns)
+        self._cached_sql = None
         return self
 
     def limit(self, n: int) -> "SemanticJoinBuilder":
         """Set LIMIT."""
         self.limit_value = n
+        self._cached_sql = None
         return self
 
     def build(self) -> str:
         """Build semantic JOIN query."""
-        select_cols = [
-            f"l.{self.left_column} as left_content",
-            f"r.{self.right_column} as right_content",
-        ]
-        select_cols.extend(self.additional_columns)
-
-        select_str = ",\n            ".join(select_cols)
+        if self._cached_sql is not None:
+            return self._cached_sql
+
+        select_str = ",\n            ".join(
+            [
+                f"l.{self.left_column} as left_content",
+                f"r.{self.right_column} as right_content",
+                *self.additional_columns,
+            ]
+        )
 
-        return f"""
+        self._cached_sql = f"""
         SELECT
             {select_str}
         FROM {self.left_table} l
@@ -463,6 +514,7 @@ class SemanticJoinBuilder(QueryBuilder):
             ON AI_FILTER(PROMPT('{self.join_condition}', l.{self.left_column}, r.{self.right_column}))
         LIMIT {self.limit_value}
         """
+        return self._cached_sql
 
 
 class StructuredExtractionBuilder(QueryBuilder):
@@ -482,22 +534,28 @@ class StructuredExtractionBuilder(QueryBuilder):
         self.schema = schema
         self.model = "claude-3-7-sonnet"
         self.limit_value = 100
+        # Last built SQL; every mutator resets it.
+        self._cached_sql: str | None = None
 
     def with_model(self, model: str) -> "StructuredExtractionBuilder":
         """Set LLM model."""
         self.model = model
+        self._cached_sql = None
         return self
 
     def limit(self, n: int) -> "StructuredExtractionBuilder":
         """Set LIMIT."""
         self.limit_value = n
+        self._cached_sql = None
         return self
 
     def build(self) -> str:
         """Build structured extraction query."""
-        import json
+        if self._cached_sql is not None:
+            return self._cached_sql
+
         schema_json = json.dumps(self.schema).replace("'", "''")
-        return f"""
+        self._cached_sql = f"""
         SELECT
             {self.text_column},
             AI_COMPLETE(
@@ -508,6 +566,7 @@ class StructuredExtractionBuilder(QueryBuilder):
         FROM {self.table_name}
         LIMIT {self.limit_value}
         """
+        return self._cached_sql
 
 
 # ============================================================================
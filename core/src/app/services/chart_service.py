@@ -1,7 +1,13 @@
 """Chart generation and recommendation service."""
 
+from collections.abc import Iterator
+from itertools import chain, combinations, islice
 from typing import Any
 
+_STRING_TYPES = frozenset({"VARCHAR", "STRING", "TEXT"})
+_TEMPORAL_TYPES = frozenset({"DATE", "TIMESTAMP", "DATETIME"})
+_NUMERIC_TYPES = frozenset({"NUMBER", "FLOAT", "INTEGER", "DECIMAL", "DOUBLE"})
+
 
 class ChartService:
     """Service for generating chart candidates and configurations."""
@@ -17,14 +23,13 @@ class ChartService:
         dimensions = []
         for col in columns:
             data_type = col.get("DATA_TYPE", "")
-            cardinality = col.get("cardinality", 1.0)
 
             # Categorical: low cardinality string/number
-            if data_type in ["VARCHAR", "STRING", "TEXT"] and cardinality < 0.1:
+            if data_type in _STRING_TYPES and col.get("cardinality", 1.0) < 0.1:
                 dimensions.append({"column": col["COLUMN_NAME"], "type": "categorical"})
 
             # Time dimension
-            elif data_type in ["DATE", "TIMESTAMP", "DATETIME"]:
+            elif data_type in _TEMPORAL_TYPES:
                 dimensions.append({"column": col["COLUMN_NAME"], "type": "temporal"})
 
         return dimensions
@@ -36,7 +41,7 @@ class ChartService:
         metrics = []
         for col in columns:
             data_type = col.get("DATA_TYPE", "")
-            if data_type in ["NUMBER", "FLOAT", "INTEGER", "DECIMAL", "DOUBLE"]:
+            if data_type in _NUMERIC_TYPES:
                 metrics.append(
                     {
                         "column": col["COLUMN_NAME"],
@@ -53,76 +58,87 @@ class ChartService:
         dimensions = self.identify_dimension_columns(column_profiles)
         metrics = self.identify_metric_columns(column_profiles)
 
-        candidates = []
-
-        # Bar charts: categorical dimension vs metric
-        for dim in [d for d in dimensions if d["type"] == "categorical"]:
+        # Candidates are generated lazily, so only the top 10 are ever built
+        candidates = chain(
+            self._bar_candidates(dimensions, metrics),
+            self._line_candidates(dimensions, metrics),
+            self._histogram_candidates(metrics),
+            self._scatter_candidates(metrics),
+        )
+        return list(islice(candidates, 10))  # Return top 10 candidates
+
+    @staticmethod
+    def _bar_candidates(
+        dimensions: list[dict[str, Any]], metrics: list[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Bar charts: categorical dimension vs metric."""
+        for dim in dimensions:
+            if dim["type"] != "categorical":
+                continue
             for metric in metrics:
-                candidates.append(
-                    {
-                        "chart_type": "bar",
-                        "x_axis": dim["column"],
-                        "y_axis": f"AVG({metric['column']})",
-                        "title": f"{metric['column']} by {dim['column']}",
-                        "rationale": f"Compare average {metric['column']} across {dim['column']} categories",
-                        "config": {
-                            "dimension": dim["column"],
-                            "metric": metric["column"],
-                            "aggregation": "avg",
-                        },
-                    }
-                )
+                yield {
+                    "chart_type": "bar",
+                    "x_axis": dim["column"],
+                    "y_axis": f"AVG({metric['column']})",
+                    "title": f"{metric['column']} by {dim['column']}",
+                    "rationale": f"Compare average {metric['column']} across {dim['column']} categories",
+                    "config": {
+                        "dimension": dim["column"],
+                        "metric": metric["column"],
+                        "aggregation": "avg",
+                    },
+                }
 
-        # Line charts: temporal dimension vs metric
-        for dim in [d for d in dimensions if d["type"] == "temporal"]:
+    @staticmethod
+    def _line_candidates(
+        dimensions: list[dict[str, Any]], metrics: list[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Line charts: temporal dimension vs metric."""
+        for dim in dimensions:
+            if dim["type"] != "temporal":
+                continue
             for metric in metrics:
-                candidates.append(
-                    {
-                        "chart_type": "line",
-                        "x_axis": dim["column"],
-                        "y_axis": f"SUM({metric['column']})",
-                        "title": f"{metric['column']} over time",
-                        "rationale": f"Track {metric['column']} trends over {dim['column']}",
-                        "config": {
-                            "dimension": dim["column"],
-                            "metric": metric["column"],
-                            "aggregation": "sum",
-                        },
-                    }
-                )
-
-        # Histograms: metric distribution
-        for metric in metrics[:3]:  # Limit to first 3 metrics
-            candidates.append(
-                {
-                    "chart_type": "histogram",
-                    "x_axis": metric["column"],
-                    "y_axis": "COUNT(*)",
-                    "title": f"Distribution of {metric['column']}",
-                    "rationale": f"Understand the distribution and frequency of {metric['column']} values",
-                    "config": {"metric": metric["column"], "bins": 20},
+                yield {
+                    "chart_type": "line",
+                    "x_axis": dim["column"],
+                    "y_axis": f"SUM({metric['column']})",
+                    "title": f"{metric['column']} over time",
+                    "rationale": f"Track {metric['column']} trends over {dim['column']}",
+                    "config": {
+                        "dimension": dim["column"],
+                        "metric": metric["column"],
+                        "aggregation": "sum",
+                    },
                 }
-            )
 
-        # Scatter plots: metric vs metric
-        if len(metrics) >= 2:
-            for i, metric1 in enumerate(metrics[:2]):
-                for metric2 in metrics[i + 1 : 3]:
-                    candidates.append(
-                        {
-                            "chart_type": "scatter",
-                            "x_axis": metric1["column"],
-                            "y_axis": metric2["column"],
-                            "title": f"{metric1['column']} vs {metric2['column']}",
-                            "rationale": f"Explore correlation between {metric1['column']} and {metric2['column']}",
-                            "config": {
-                                "x_metric": metric1["column"],
-                                "y_metric": metric2["column"],
-                            },
-                        }
-                    )
-
-        return candidates[:10]  # Return top 10 candidates
+    @staticmethod
+    def _histogram_candidates(metrics: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Histograms: metric distribution."""
+        for metric in metrics[:3]:  # Limit to first 3 metrics
+            yield {
+                "chart_type": "histogram",
+                "x_axis": metric["column"],
+                "y_axis": "COUNT(*)",
+                "title": f"Distribution of {metric['column']}",
+                "rationale": f"Understand the distribution and frequency of {metric['column']} values",
+                "config": {"metric": metric["column"], "bins": 20},
+            }
+
+    @staticmethod
+    def _scatter_candidates(metrics: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Scatter plots: each pair among the first 3 metrics."""
+        for metric1, metric2 in combinations(metrics[:3], 2):
+            yield {
+                "chart_type": "scatter",
+                "x_axis": metric1["column"],
+                "y_axis": metric2["column"],
+                "title": f"{metric1['column']} vs {metric2['column']}",
+                "rationale": f"Explore correlation between {metric1['column']} and {metric2['column']}",
+                "config": {
+                    "x_metric": metric1["column"],
+                    "y_metric": metric2["column"],
+                },
+            }
 
     def organize_dashboard(
         self, charts: list[dict[str, Any]], table_name: str
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from datetime import datetime, timezone
@@ -38,6 +39,9 @@ SEMANTIC_TYPES = [
 class ColumnMetadataService:
     """Service to build and cache column metadata with rule-first inference."""
 
+    # Cap on concurrent image-description AI_COMPLETE calls per table
+    IMAGE_DESCRIPTION_CONCURRENCY = 8
+
     def __init__(
         self,
         db: AsyncSession,
@@ -293,6 +297,9 @@ class ColumnMetadataService:
         columns_metadata: list[dict[str, Any]] = []
         sample_size = len(sample_rows)
 
+        # Rule-first pass; low-confidence columns are refined by AI in one batch
+        profiles: list[dict[str, Any]] = []
+
         for col in schema_info:
             col_name = col["COLUMN_NAME"]
             sql_type = col.get("DATA_TYPE", "VARIANT")
@@ -320,21 +327,61 @@ class ColumnMetadataService:
                 type_inference["confidence"],
             )
 
-            ai_context = None
-            if semantic_type == "unknown" or confidence < 0.55:
-                ai_context = await self._ai_refine_type(
-                    col_name=col_name,
-                    sql_type=sql_type,
-                    samples=samples,
-                    current_type=semantic_type,
-                )
-                if ai_context:
-                    semantic_type = ai_context.get("type", semantic_type)
-                    confidence = max(confidence, ai_context.get("confidence", confidence))
+            profiles.append(
+                {
+                    "col_name": col_name,
+                    "sql_type": sql_type,
+                    "samples": samples,
+                    "unique_count": unique_count,
+                    "null_count": null_count,
+                    "type_inference": type_inference,
+                    "semantic_type": semantic_type,
+                    "confidence": confidence,
+                    "ai_context": None,
+                }
+            )
 
-            image_description = None
-            if semantic_type == "image" and samples:
-                image_description = await self._describe_image_sample(samples[0])
+        pending = [
+            profile for profile in profiles
+            if profile["semantic_type"] == "unknown" or profile["confidence"] < 0.55
+        ]
+        refinements = await self._ai_refine_types(
+            [
+                (profile["col_name"], profile["sql_type"], profile["samples"], profile["semantic_type"])
+                for profile in pending
+            ]
+        )
+        for profile, ai_context in zip(pending, refinements):
+            profile["ai_context"] = ai_context
+            if ai_context:
+                profile["semantic_type"] = ai_context.get("type", profile["semantic_type"])
+                profile["confidence"] = max(profile["confidence"], ai_context.get("confidence", profile["confidence"]))
+
+        # Image descriptions are independent Cortex calls, so run them concurrently
+        image_profiles = [
+            profile for profile in profiles if profile["semantic_type"] == "image" and profile["samples"]
+        ]
+        semaphore = asyncio.Semaphore(self.IMAGE_DESCRIPTION_CONCURRENCY)
+
+        async def describe(sample_value: Any) -> dict[str, Any]:
+            async with semaphore:
+                return await self._describe_image_sample(sample_value)
+
+        image_descriptions = await asyncio.gather(*(describe(profile["samples"][0]) for profile in image_profiles))
+        for profile, image_description in zip(image_profiles, image_descriptions):
+            profile["image_description"] = image_description
+
+        for profile in profiles:
+            col_name = profile["col_name"]
+            sql_type = profile["sql_type"]
+            samples = profile["samples"]
+            unique_count = profile["unique_count"]
+            null_count = profile["null_count"]
+            type_inference = profile["type_inference"]
+            semantic_type = profile["semantic_type"]
+            confidence = profile["confidence"]
+            ai_context = profile["ai_context"]
+            image_description = profile.get("image_description")
 
             metadata_payload = {
                 "sql_type": sql_type,
@@ -465,24 +512,39 @@ class ColumnMetadataService:
                 return True
         return False
 
-    async def _ai_refine_type(self, col_name: str, sql_type: str, samples: list[Any], current_type: str) -> dict[str, Any] | None:
-        prompt = (
-            "You are a data profiling assistant. "
-            "Choose the best semantic type for this column from: "
-            + ", ".join(SEMANTIC_TYPES)
-            + ".\n"
-            f"Column name: {col_name}\n"
-            f"SQL type: {sql_type}\n"
-            f"Samples: {samples}\n"
-            f"Current guess: {current_type}\n"
-            "Respond as JSON: {\"type\": \"...\", \"confidence\": 0.0-1.0, \"rationale\": \"...\"}."
-        )
+    async def _ai_refine_types(
+        self, columns: list[tuple[str, str, list[Any], str]]
+    ) -> list[dict[str, Any]]:
+        """Refine (col_name, sql_type, samples, current_type) guesses with one batched AI_COMPLETE."""
+        if not columns:
+            return []
+        prompts = [
+            (
+                "You are a data profiling assistant. "
+                "Choose the best semantic type for this column from: "
+                + ", ".join(SEMANTIC_TYPES)
+                + ".\n"
+                f"Column name: {col_name}\n"
+                f"SQL type: {sql_type}\n"
+                f"Samples: {samples}\n"
+                f"Current guess: {current_type}\n"
+                "Respond as JSON: {\"type\": \"...\", \"confidence\": 0.0-1.0, \"rationale\": \"...\"}."
+            )
+            for col_name, sql_type, samples, current_type in columns
+        ]
+        # Token estimates and the completions are independent round-trips;
+        # each estimate is its own warehouse query, so cap how many run at once
+        semaphore = asyncio.Semaphore(self.IMAGE_DESCRIPTION_CONCURRENCY)
 
-        tokens = await self._estimate_tokens_for_prompt(prompt)
-        try:
-            result = await self.ai_sql.ai_complete(
+        async def estimate(prompt: str) -> int:
+            async with semaphore:
+                return await self._estimate_tokens_for_prompt(prompt)
+
+        token_counts, results = await asyncio.gather(
+            asyncio.gather(*(estimate(prompt) for prompt in prompts)),
+            self.ai_sql.ai_complete_batch(
                 model=self.model_id,
-                prompt=prompt,
+                prompts=prompts,
                 response_format={
                     "type": "object",
                     "properties": {
@@ -491,16 +553,29 @@ class ColumnMetadataService:
                         "rationale": {"type": "string"},
                     },
                 },
-            )
-        except Exception as exc:
-            return {
-                "type": current_type,
-                "confidence": 0.0,
-                "rationale": "ai_complete_error",
-                "token_estimate": tokens,
-                "error": str(exc),
-            }
+                # A failed prompt only affects its own column
+                return_exceptions=True,
+            ),
+        )
+
+        refinements = []
+        for result, (_, _, _, current_type), tokens in zip(results, columns, token_counts):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                refinements.append({
+                    "type": current_type,
+                    "confidence": 0.0,
+                    "rationale": "ai_complete_error",
+                    "token_estimate": tokens,
+                    "error": str(result),
+                })
+            else:
+                refinements.append(self._parse_type_refinement(result, current_type, tokens))
+        return refinements
 
+    @staticmethod
+    def _parse_type_refinement(result: Any, current_type: str, tokens: int) -> dict[str, Any]:
         try:
             if result is None or result == "":
                 return {
@@ -4,6 +4,7 @@ This service leverages the composable query builders for cleaner, more maintaina
 """
 
 from typing import Any
+import asyncio
 import json
 import re
 from snowflake.connector.errors import ProgrammingError
@@ -42,12 +43,77 @@ from .ai_sql_builders import (
     ai_transcribe,
     ai_translate,
     extract_structured,
+    response_format_literal,
     select,
     semantic_join,
     summarize,
 )
 
 
+def _build_classify_op(spec: dict[str, Any]) -> AIClassifyBuilder:
+    classifier = ai_classify(spec["column"], spec["categories"])
+    if spec.get("prompt_prefix"):
+        classifier = classifier.with_prompt_prefix(spec["prompt_prefix"])
+    return classifier
+
+
+def _build_redact_op(spec: dict[str, Any]) -> AIRedactBuilder:
+    redact = ai_redact(spec["column"])
+    if spec.get("pii_types"):
+        redact = redact.with_pii_types(spec["pii_types"])
+    return redact
+
+
+# Row-level AI functions that can share one SELECT in run_ops_batch
+_BATCH_OP_BUILDERS = {
+    "ai_sentiment": lambda spec: ai_sentiment(spec["column"]),
+    "ai_classify": _build_classify_op,
+    "summarize": lambda spec: summarize(spec["column"]),
+    "ai_translate": lambda spec: ai_translate(
+        spec["column"], spec["source_lang"], spec["target_lang"]
+    ),
+    "ai_extract": lambda spec: ai_extract(spec["column"], spec["instruction"]),
+    "ai_embed": lambda spec: ai_embed(spec["column"], spec.get("model", "e5-base-v2")),
+    "ai_similarity": lambda spec: ai_similarity(spec["column"], spec["column2"]),
+    "ai_count_tokens": lambda spec: ai_count_tokens(spec["model"], spec["column"]),
+    "ai_redact": _build_redact_op,
+}
+BATCH_OPS = tuple(_BATCH_OP_BUILDERS)
+
+
+# Snowflake requires string literals and limits prompt length (~16KB)
+_AI_COMPLETE_MAX_PROMPT_LEN = 16000
+
+# Prompts per AI_COMPLETE statement in ai_complete_batch; keeps the SQL text
+# well under Snowflake's statement size limit at the maximum prompt length
+_AI_COMPLETE_BATCH_SIZE = 32
+
+# Warehouse statements ai_complete_batch keeps in flight at once, counting both
+# chunk queries and the per-prompt fallback calls of a failed chunk
+_AI_COMPLETE_BATCH_CONCURRENCY = 4
+
+
+def _sanitize_prompt(text: str, aggressive: bool = False) -> str:
+    """Produce a safe single-quoted literal (no raw newlines)."""
+    # Remove control chars
+    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", " ", text)
+    if aggressive:
+        text = text.encode("ascii", "ignore").decode()
+    # Escape backslash/single-quote
+    text = text.replace("\\", "\\\\").replace("'", "''")
+    # Encode newlines/tabs as literal sequences to keep prompt on one line
+    text = text.replace("\r", "\\n").replace("\n", "\\n").replace("\t", " ")
+    return text
+
+
+def _normalize_completion(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
 class ModularAISQLService:
     """Modular AI SQL service using composable query builders.
 
@@ -83,30 +149,14 @@ class ModularAISQLService:
         print("\n[AI_COMPLETE] prompt length:", len(prompt))
         print("[AI_COMPLETE] prompt content:\n", prompt)
 
-        # Snowflake requires string literals and limits prompt length (~16KB)
-        MAX_LEN = 16000
-
-        def sanitize(text: str, aggressive: bool = False) -> str:
-            """Produce a safe single-quoted literal (no raw newlines)."""
-            # Remove control chars
-            text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", " ", text)
-            if aggressive:
-                text = text.encode("ascii", "ignore").decode()
-            # Escape backslash/single-quote
-            text = text.replace("\\", "\\\\").replace("'", "''")
-            # Encode newlines/tabs as literal sequences to keep prompt on one line
-            text = text.replace("\r", "\\n").replace("\n", "\\n").replace("\t", " ")
-            return text
+        # Serialized once; the aggressive-sanitization retry reuses it
+        response_format_json = response_format_literal(response_format) if response_format else None
 
         def build_query(safe_prompt: str) -> str:
-            if len(safe_prompt) > MAX_LEN:
+            if len(safe_prompt) > _AI_COMPLETE_MAX_PROMPT_LEN:
                 raise ValueError("Prompt too long for AI_COMPLETE; please reduce context under 16KB.")
 
-            if response_format:
-                format_payload = response_format
-                if "schema" not in response_format:
-                    format_payload = {"type": "json", "schema": response_format}
-                response_format_json = json.dumps(format_payload).replace("'", "''")
+            if response_format_json is not None:
                 return f"""
                 SELECT AI_COMPLETE(
                     '{model}',
@@ -123,34 +173,102 @@ class ModularAISQLService:
             """
 
         # First attempt with mild sanitization
-        safe_prompt = sanitize(prompt, aggressive=False)
+        safe_prompt = _sanitize_prompt(prompt, aggressive=False)
         query = build_query(safe_prompt)
 
         print("[AI_COMPLETE] query used:\n", query)
-        def normalize_response(value: Any) -> str:
-            if value is None:
-                return ""
-            if isinstance(value, (dict, list)):
-                return json.dumps(value)
-            return str(value)
 
         try:
             result = await self.sf.execute_query(query)
             response = result[0].get("RESPONSE") if result else ""
-            return normalize_response(response)
+            return _normalize_completion(response)
         except ProgrammingError as e:
             msg = str(e)
             if "needs to be a string literal" not in msg:
                 raise
             # Retry once with aggressive sanitization and truncation
-            safe_prompt = sanitize(prompt, aggressive=True)
-            if len(safe_prompt) > MAX_LEN:
-                safe_prompt = safe_prompt[:MAX_LEN]
+            safe_prompt = _sanitize_prompt(prompt, aggressive=True)
+            if len(safe_prompt) > _AI_COMPLETE_MAX_PROMPT_LEN:
+                safe_prompt = safe_prompt[:_AI_COMPLETE_MAX_PROMPT_LEN]
             query = build_query(safe_prompt)
             print("[AI_COMPLETE] retry with aggressive sanitization:\n", query)
             result = await self.sf.execute_query(query)
             response = result[0].get("RESPONSE") if result else ""
-            return normalize_response(response)
+            return _normalize_completion(response)
+
+    async def ai_complete_batch(
+        self,
+        model: str,
+        prompts: list[str],
+        response_format: dict[str, Any] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[str | BaseException]:
+        """Execute AI_COMPLETE for many prompts in as few statements as possible.
+
+        Prompts are sent as a VALUES list so one warehouse query answers up to
+        32 of them; larger inputs are split into chunks that run concurrently,
+        at most four statements at a time.
+        A chunk whose query fails (e.g. one prompt Snowflake rejects) is retried
+        prompt by prompt with ai_complete, so other chunks and prompts still
+        get their responses.
+
+        Example:
+            results = await service.ai_complete_batch(
+                'mistral-large2',
+                ['Describe column A', 'Describe column B']
+            )
+
+        Args:
+            return_exceptions: Put a failed prompt's exception in its slot
+                instead of raising it
+
+        Returns:
+            Responses in prompt order
+        """
+        if not prompts:
+            return []
+
+        format_arg = (
+            f", NULL, PARSE_JSON('{response_format_literal(response_format)}')" if response_format else ""
+        )
+
+        semaphore = asyncio.Semaphore(_AI_COMPLETE_BATCH_CONCURRENCY)
+
+        async def complete_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.ai_complete(model, prompt, response_format)
+
+        async def run_chunk(start: int) -> list[str | BaseException]:
+            chunk = prompts[start:start + _AI_COMPLETE_BATCH_SIZE]
+            safe_prompts = [_sanitize_prompt(prompt) for prompt in chunk]
+            try:
+                if any(len(safe_prompt) > _AI_COMPLETE_MAX_PROMPT_LEN for safe_prompt in safe_prompts):
+                    raise ValueError("Prompt too long for AI_COMPLETE; please reduce context under 16KB.")
+                rows = ",\n                ".join(
+                    f"({offset}, '{safe_prompt}')" for offset, safe_prompt in enumerate(safe_prompts)
+                )
+                query = f"""
+                SELECT v.idx AS idx, AI_COMPLETE('{model}', v.prompt{format_arg}) AS response
+                FROM (VALUES
+                    {rows}
+                ) AS v(idx, prompt)
+                ORDER BY v.idx
+                """
+                async with semaphore:
+                    result = await self.sf.execute_query(query)
+            except Exception:
+                # One bad prompt fails the whole statement; isolate it per prompt
+                return await asyncio.gather(
+                    *(complete_one(prompt) for prompt in chunk),
+                    return_exceptions=return_exceptions,
+                )
+            responses = {int(row["IDX"]): row.get("RESPONSE") for row in result}
+            return [_normalize_completion(responses.get(index)) for index in range(len(chunk))]
+
+        chunks = await asyncio.gather(
+            *(run_chunk(start) for start in range(0, len(prompts), _AI_COMPLETE_BATCH_SIZE))
+        )
+        return [response for chunk in chunks for response in chunk]
 
     async def ai_classify(
         self,
@@ -174,10 +292,12 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(content_column)
+            .select_plain(content_column)
             .select_ai_function(classifier, "classification")
-            .select("classification['labels'][0]", "primary_label")
-            .select("classification['scores'][0]", "primary_confidence")
+            .select_aliased(
+                primary_label="classification['labels'][0]",
+                primary_confidence="classification['scores'][0]",
+            )
             .limit(100)
             .build()
         )
@@ -201,7 +321,7 @@ class ModularAISQLService:
         """
         filter_builder = ai_filter(filter_condition, columns[0])
 
-        query = select(table_name).select(*columns).where_ai_filter(filter_builder).limit(100).build()
+        query = select(table_name).select_plain(*columns).where_ai_filter(filter_builder).limit(100).build()
 
         return await self.sf.execute_query(query)
 
@@ -225,11 +345,13 @@ class ModularAISQLService:
         agg = ai_aggregate(column_to_aggregate, aggregation_prompt)
 
         query_builder = (
-            select(table_name).select("COUNT(*)", "total_records").select_ai_function(agg, "insights")
+            select(table_name).select_aliased(total_records="COUNT(*)").select_ai_function(agg, "insights")
         )
 
         if group_by:
-            query_builder = query_builder.select(group_by).group_by(group_by).order_by("total_records DESC").limit(10)
+            query_builder = (
+                query_builder.select_plain(group_by).group_by(group_by).order_by("total_records DESC").limit(10)
+            )
 
         return await self.sf.execute_query(query_builder.build())
 
@@ -247,10 +369,12 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(sentiment, "sentiment")
-            .select("sentiment['categories'][0]['sentiment']::VARCHAR", "primary_sentiment")
-            .select("sentiment['categories'][0]['score']::FLOAT", "sentiment_score")
+            .select_aliased(
+                primary_sentiment="sentiment['categories'][0]['sentiment']::VARCHAR",
+                sentiment_score="sentiment['categories'][0]['score']::FLOAT",
+            )
             .limit(100)
             .build()
         )
@@ -271,7 +395,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(summary, "summary")
             .limit(100)
             .build()
@@ -293,10 +417,12 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(audio_file_column)
+            .select_plain(audio_file_column)
             .select_ai_function(transcribe, "transcription")
-            .select("transcription['text']::VARCHAR", "transcription_text")
-            .select("transcription['audio_duration']::FLOAT", "audio_duration_seconds")
+            .select_aliased(
+                transcription_text="transcription['text']::VARCHAR",
+                audio_duration_seconds="transcription['audio_duration']::FLOAT",
+            )
             .limit(100)
             .build()
         )
@@ -318,7 +444,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(content_column)
+            .select_plain(content_column)
             .select_ai_function(embed, "embedding")
             .limit(100)
             .build()
@@ -326,6 +452,25 @@ class ModularAISQLService:
 
         return await self.sf.execute_query(query)
 
+    async def ai_embed_text(
+        self,
+        text: str,
+        model: str = "e5-base-v2",
+    ) -> list[float]:
+        """Generate the embedding of a single text value.
+
+        Example:
+            vector = await service.ai_embed_text('Summarize this article')
+        """
+        literal = text.replace("\\", "\\\\").replace("'", "''")
+        embed = ai_embed(f"'{literal}'", model)
+
+        result = await self.sf.execute_query(f"SELECT {embed.build()} AS embedding")
+        vector = result[0].get("EMBEDDING") if result else None
+        if isinstance(vector, str):
+            vector = json.loads(vector)
+        return list(vector or [])
+
     async def ai_similarity(
         self,
         table_name: str,
@@ -341,7 +486,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(column1, column2)
+            .select_plain(column1, column2)
             .select_ai_function(similarity, "similarity_score")
             .limit(100)
             .build()
@@ -367,7 +512,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(translate, "translated_text")
             .limit(100)
             .build()
@@ -394,7 +539,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(content_column)
+            .select_plain(content_column)
             .select_ai_function(extract, "extracted_data")
             .limit(100)
             .build()
@@ -425,7 +570,7 @@ class ModularAISQLService:
         )
 
         if group_by:
-            query_builder = query_builder.select(group_by).group_by(group_by).limit(20)
+            query_builder = query_builder.select_plain(group_by).group_by(group_by).limit(20)
 
         return await self.sf.execute_query(query_builder.build())
 
@@ -448,7 +593,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(count_tokens, "token_count")
             .limit(100)
             .build()
@@ -477,7 +622,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(redact, "redacted_text")
             .limit(100)
             .build()
@@ -506,7 +651,7 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(file_path_column)
+            .select_plain(file_path_column)
             .select_ai_function(parse_doc, "parsed_content")
             .limit(100)
             .build()
@@ -607,6 +752,54 @@ class ModularAISQLService:
     # Convenience Methods for Common Patterns
     # ============================================================================
 
+    async def run_ops_batch(
+        self,
+        table_name: str,
+        ops: list[dict[str, Any]],
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Run several row-level AI functions over one table in a single query.
+
+        Each op is a dict with ``op`` (one of ``BATCH_OPS``), ``column`` and the
+        op's parameters (``categories``, ``prompt_prefix``, ``source_lang``,
+        ``target_lang``, ``instruction``, ``model``, ``pii_types``,
+        ``column2``). Results land in ``alias`` if given, else ``<op>_<index>``.
+
+        Example:
+            results = await service.run_ops_batch(
+                'reviews',
+                [
+                    {'op': 'ai_sentiment', 'column': 'review_text'},
+                    {'op': 'ai_classify', 'column': 'review_text',
+                     'categories': ['Shipping', 'Quality', 'Price']},
+                ],
+            )
+        """
+        if not ops:
+            raise ValueError("run_ops_batch requires at least one op.")
+
+        query_builder = select(table_name)
+        source_columns: list[str] = []
+        ai_columns: list[tuple[Any, str]] = []
+        for index, spec in enumerate(ops):
+            op_name = spec.get("op")
+            build_op = _BATCH_OP_BUILDERS.get(op_name)
+            if build_op is None:
+                raise ValueError(
+                    f"Unsupported batch op {op_name!r}; expected one of {', '.join(BATCH_OPS)}."
+                )
+            for column in (spec["column"], spec.get("column2")):
+                if column and column not in source_columns:
+                    source_columns.append(column)
+            ai_columns.append((build_op(spec), spec.get("alias") or f"{op_name}_{index}"))
+
+        query_builder.select_plain(*source_columns)
+        for builder, alias in ai_columns:
+            query_builder.select_ai_function(builder, alias)
+        query_builder.limit(limit)
+
+        return await self.sf.execute_query(query_builder.build())
+
     async def multi_sentiment_analysis(
         self, table_name: str, text_columns: list[str]
     ) -> list[dict[str, Any]]:
@@ -647,10 +840,10 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(text_column)
+            .select_plain(text_column)
             .select_ai_function(classifier, "classification")
             .select_ai_function(summary_builder, "summary")
-            .select("classification['labels'][0]", "primary_category")
+            .select_aliased(primary_category="classification['labels'][0]")
             .limit(50)
             .build()
         )
@@ -676,8 +869,8 @@ class ModularAISQLService:
 
         query = (
             select(table_name)
-            .select(group_by_column)
-            .select("COUNT(*)", "total_reviews")
+            .select_plain(group_by_column)
+            .select_aliased(total_reviews="COUNT(*)")
             .select_ai_function(sentiment, "avg_sentiment")
             .group_by(group_by_column)
             .order_by("total_reviews DESC")
@@ -0,0 +1,53 @@
+"""Unit tests for the EDA workflow file_write tool's path checks."""
+
+import pytest
+
+from src.app.orchestration.eda_workflows import EDAWorkflowTools
+
+OUTSIDE_ERROR = {"error": "file_write only supports paths under output/."}
+
+
+@pytest.fixture
+def tools(tmp_path):
+    """Workflow tools writing under a temporary output/ directory."""
+    workflow_tools = EDAWorkflowTools.__new__(EDAWorkflowTools)
+    workflow_tools.output_dir = tmp_path / "output"
+    workflow_tools.output_dir.mkdir()
+    workflow_tools._output_dir_resolved = workflow_tools.output_dir.resolve()
+    return workflow_tools
+
+
+class TestFileWrite:
+    """Test file_write path validation."""
+
+    def test_relative_path_writes_under_output(self, tools):
+        """Relative paths land under output/, creating parent directories."""
+        result = tools.file_write("reports/summary.md", "héllo")
+
+        target = tools.output_dir / "reports" / "summary.md"
+        assert result == {"path": str(target), "bytes": len("héllo".encode())}
+        assert target.read_text(encoding="utf-8") == "héllo"
+
+    def test_absolute_path_inside_output_is_allowed(self, tools):
+        """Absolute paths are accepted when they point under output/."""
+        path = str(tools.output_dir / "chart.json")
+
+        assert tools.file_write(path, "{}")["path"] == path
+
+    @pytest.mark.parametrize("path", ["../escape.txt", "reports/../../escape.txt", "/etc/passwd"])
+    def test_paths_outside_output_are_rejected(self, tools, path):
+        """Traversal and foreign absolute paths are refused without writing."""
+        assert tools.file_write(path, "x") == OUTSIDE_ERROR
+        assert not (tools.output_dir.parent / "escape.txt").exists()
+
+    def test_symlink_out_of_output_is_rejected(self, tools, tmp_path):
+        """A symlink under output/ cannot redirect the write elsewhere."""
+        (tools.output_dir / "link").symlink_to(tmp_path)
+
+        assert tools.file_write("link/escape.txt", "x") == OUTSIDE_ERROR
+        assert not (tmp_path / "escape.txt").exists()
+
+    @pytest.mark.parametrize("path", ["", "a\x00b", "a" * 5000])
+    def test_malformed_paths_are_rejected(self, tools, path):
+        """Empty, NUL-containing and overlong paths are refused."""
+        assert "error" in tools.file_write(path, "x")
@@ -0,0 +1,92 @@
+"""Unit tests for ModularAISQLService.ai_complete_batch."""
+
+import asyncio
+import re
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.app.services.modular_ai_sql_service import _AI_COMPLETE_BATCH_CONCURRENCY, ModularAISQLService
+
+
+def _answer_batch(query):
+    """Answer a batched AI_COMPLETE query out of order, echoing each prompt."""
+    rows = re.findall(r"\((\d+), '([^']*)'\)", query)
+    return [{"IDX": int(idx), "RESPONSE": f"answer: {prompt}"} for idx, prompt in reversed(rows)]
+
+
+@pytest.fixture
+def service():
+    """Service over a mocked Snowflake connection."""
+    return ModularAISQLService(Mock())
+
+
+class TestAICompleteBatch:
+    """Test batched AI_COMPLETE."""
+
+    @pytest.mark.asyncio
+    async def test_responses_follow_prompt_order_across_chunks(self, service):
+        """Rows are matched by index, whatever order the warehouse returns them in."""
+        service.sf.execute_query = AsyncMock(side_effect=_answer_batch)
+        prompts = [f"prompt {i}" for i in range(40)]
+
+        results = await service.ai_complete_batch("mistral-large2", prompts)
+
+        assert results == [f"answer: {prompt}" for prompt in prompts]
+        # 40 prompts in chunks of 32
+        assert service.sf.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_prompt_list_runs_no_query(self, service):
+        """No prompts means no warehouse call."""
+        service.sf.execute_query = AsyncMock()
+
+        assert await service.ai_complete_batch("mistral-large2", []) == []
+        service.sf.execute_query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_falls_back_to_single_prompts(self, service):
+        """Only the prompt that fails on its own reports an error."""
+
+        async def execute_query(query):
+            if "bad" in query:
+                raise RuntimeError("rejected")
+            return [{"RESPONSE": "single"}]
+
+        service.sf.execute_query = AsyncMock(side_effect=execute_query)
+
+        results = await service.ai_complete_batch("mistral-large2", ["good", "bad"], return_exceptions=True)
+
+        assert results[0] == "single"
+        assert isinstance(results[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_failed_prompt_raises_by_default(self, service):
+        """Without return_exceptions a failing prompt raises."""
+        service.sf.execute_query = AsyncMock(side_effect=RuntimeError("rejected"))
+
+        with pytest.raises(RuntimeError):
+            await service.ai_complete_batch("mistral-large2", ["bad"])
+
+    @pytest.mark.asyncio
+    async def test_statements_in_flight_are_capped(self, service):
+        """Chunk queries and their per-prompt fallbacks share one concurrency cap."""
+        in_flight = peak = 0
+
+        async def execute_query(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "VALUES" in query:
+                raise RuntimeError("rejected")
+            return [{"RESPONSE": "single"}]
+
+        service.sf.execute_query = AsyncMock(side_effect=execute_query)
+        prompts = [f"prompt {i}" for i in range(100)]
+
+        results = await service.ai_complete_batch("mistral-large2", prompts)
+
+        assert results == ["single"] * 100
+        assert peak == _AI_COMPLETE_BATCH_CONCURRENCY
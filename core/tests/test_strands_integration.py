@@ -0,0 +1,66 @@
+"""Unit tests for the adaptive concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from src.app.orchestration.strands_integration import AdaptiveLimiter
+
+
+class ThrottlingException(Exception):
+    """Stand-in for a provider throttling error."""
+
+
+class TestAdaptiveLimiter:
+    """Test AIMD concurrency limiting."""
+
+    @pytest.mark.asyncio
+    async def test_limits_calls_in_flight(self):
+        """No more than ``limit`` calls run at once."""
+        limiter = AdaptiveLimiter(initial_concurrency=2, max_concurrency=2)
+        in_flight = peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_the_limit(self):
+        """A throttling error halves the limit, down to min_concurrency."""
+        limiter = AdaptiveLimiter(initial_concurrency=8, min_concurrency=3)
+
+        for expected in (4, 3):
+            with pytest.raises(ThrottlingException):
+                async with limiter:
+                    raise ThrottlingException()
+            assert limiter.limit == expected
+
+    @pytest.mark.asyncio
+    async def test_other_errors_keep_the_limit(self):
+        """Errors that are not throttling leave the limit alone."""
+        limiter = AdaptiveLimiter(initial_concurrency=8)
+
+        with pytest.raises(ValueError):
+            async with limiter:
+                raise ValueError()
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_successes_grow_the_limit(self):
+        """``limit`` consecutive successes raise the limit by one, up to max_concurrency."""
+        limiter = AdaptiveLimiter(initial_concurrency=2, max_concurrency=3)
+
+        for _ in range(2 + 3 + 3):
+            async with limiter:
+                pass
+
+        assert limiter.limit == 3
@@ -0,0 +1,217 @@
+"""Unit tests for the AI SQL toolkit's caches and row-op batcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.app.orchestration.tools import (
+    AISQLToolkit,
+    RowOpBatcher,
+    SemanticCache,
+    ToolResultCache,
+)
+
+
+class TestToolResultCache:
+    """Test exact-match tool result caching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_in_flight_call(self):
+        """Concurrent calls with the same key run the underlying call once."""
+        cache = ToolResultCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"response": "done"}
+
+        key = cache.make_key("ai_complete", {"prompt": "hi"})
+        waiters = [asyncio.ensure_future(cache.get_or_call(key, call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert results == [{"response": "done"}] * 3
+        assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+
+    @pytest.mark.asyncio
+    async def test_hits_return_copies(self):
+        """Mutating a returned result does not change the cached one."""
+        cache = ToolResultCache()
+        call = AsyncMock(return_value={"tags": ["a"]})
+
+        first = await cache.get_or_call("key", call)
+        first["tags"].append("b")
+        second = await cache.get_or_call("key", call)
+
+        assert second == {"tags": ["a"]}
+        call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_recomputed(self):
+        """Entries older than the TTL are not reused."""
+        cache = ToolResultCache(ttl_seconds=0)
+        call = AsyncMock(side_effect=["first", "second"])
+
+        assert await cache.get_or_call("key", call) == "first"
+        assert await cache.get_or_call("key", call) == "second"
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """A failed call is retried on the next request."""
+        cache = ToolResultCache()
+        call = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_call("key", call)
+        assert await cache.get_or_call("key", call) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_positional_and_keyword_calls_share_a_key(self):
+        """Toolkit calls are keyed on bound arguments, not on how they were passed."""
+        calls = []
+
+        async def ai_complete(model, prompt, response_format=None):
+            calls.append(prompt)
+            return "answer"
+
+        service = Mock()
+        service.ai_complete = ai_complete
+        tool = AISQLToolkit(service).get_tool("ai_complete")
+
+        await tool.function("mistral-large2", "hi")
+        await tool.function(model="mistral-large2", prompt="hi", response_format=None)
+
+        assert calls == ["hi"]
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_is_evicted(self):
+        """The least recently used entry is dropped beyond max_entries."""
+        cache = ToolResultCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_call(key, AsyncMock(return_value=key))
+
+        call = AsyncMock(return_value="recomputed")
+        assert await cache.get_or_call("a", call) == "recomputed"
+
+
+class TestSemanticCache:
+    """Test similarity-matched caching."""
+
+    @staticmethod
+    def _embed(vectors):
+        async def embed(text):
+            return vectors[text]
+
+        return embed
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_in_same_scope_hits(self):
+        """A prompt above the threshold reuses the earlier result."""
+        cache = SemanticCache(self._embed({"a": [1.0, 0.0], "a2": [0.999, 0.01]}))
+        call = AsyncMock(side_effect=["first", "second"])
+
+        assert await cache.get_or_call("scope", "a", call) == "first"
+        assert await cache.get_or_call("scope", "a2", call) == "first"
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    @pytest.mark.asyncio
+    async def test_other_scope_or_dissimilar_prompt_misses(self):
+        """Results are only reused within a scope and above the threshold."""
+        cache = SemanticCache(self._embed({"a": [1.0, 0.0], "b": [0.0, 1.0]}))
+        call = AsyncMock(side_effect=["first", "other scope", "dissimilar"])
+
+        await cache.get_or_call("scope", "a", call)
+        assert await cache.get_or_call("other", "a", call) == "other scope"
+        assert await cache.get_or_call("scope", "b", call) == "dissimilar"
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self):
+        """Entries older than the TTL are not reused."""
+        cache = SemanticCache(self._embed({"a": [1.0, 0.0]}), ttl_seconds=0)
+        call = AsyncMock(side_effect=["first", "second"])
+
+        await cache.get_or_call("scope", "a", call)
+        assert await cache.get_or_call("scope", "a", call) == "second"
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_falls_through(self):
+        """An embedding error runs the call instead of failing it."""
+
+        async def embed(text):
+            raise RuntimeError("embed failed")
+
+        cache = SemanticCache(embed)
+        assert await cache.get_or_call("scope", "a", AsyncMock(return_value="ok")) == "ok"
+
+    def test_toolkit_has_no_semantic_cache_by_default(self):
+        """The semantic tier is opt-in."""
+        toolkit = AISQLToolkit(Mock())
+
+        assert set(toolkit.cache_stats()) == {"exact"}
+
+
+class TestRowOpBatcher:
+    """Test coalescing of row-level ops into run_ops_batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ops_share_one_query(self):
+        """Each caller gets its own column, renamed to its result column."""
+        service = Mock()
+        service.run_ops_batch = AsyncMock(
+            return_value=[{"REVIEW": "text", "OP_0": "summary", "OP_1": "redacted"}]
+        )
+        batcher = RowOpBatcher(service)
+        single = AsyncMock()
+
+        summary, redacted = await asyncio.gather(
+            batcher.submit("reviews", {"op": "summarize", "column": "review"}, "summary", single),
+            batcher.submit("reviews", {"op": "ai_redact", "column": "review"}, "redacted_text", single),
+        )
+
+        assert summary == [{"REVIEW": "text", "SUMMARY": "summary"}]
+        assert redacted == [{"REVIEW": "text", "REDACTED_TEXT": "redacted"}]
+        service.run_ops_batch.assert_awaited_once()
+        single.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lone_op_runs_its_single_call(self):
+        """A call with nothing to batch with skips run_ops_batch."""
+        service = Mock()
+        service.run_ops_batch = AsyncMock()
+        batcher = RowOpBatcher(service)
+
+        result = await batcher.submit(
+            "reviews", {"op": "summarize", "column": "review"}, "summary", AsyncMock(return_value=["single"])
+        )
+
+        assert result == ["single"]
+        service.run_ops_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_calls(self):
+        """If the batch query fails, each op runs on its own and fails on its own."""
+        service = Mock()
+        service.run_ops_batch = AsyncMock(side_effect=RuntimeError("bad op"))
+        batcher = RowOpBatcher(service)
+
+        results = await asyncio.gather(
+            batcher.submit(
+                "reviews", {"op": "summarize", "column": "review"}, "summary", AsyncMock(return_value=["ok"])
+            ),
+            batcher.submit(
+                "reviews",
+                {"op": "ai_redact", "column": "review"},
+                "redacted_text",
+                AsyncMock(side_effect=ValueError("bad column")),
+            ),
+            return_exceptions=True,
+        )
+
+        assert results[0] == ["ok"]
+        assert isinstance(results[1], ValueError)